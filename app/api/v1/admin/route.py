@@ -1,12 +1,45 @@
-from fastapi import APIRouter, HTTPException, status
+from datetime import date
+from typing import Optional
+
+import hmac
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from app.core.config import settings
-from app.schema.admin_schema import AdminLoginRequest
+from app.core.dependency import validate_admin_token
+from app.schema.admin_schema import AdminLoginRequest, ExportCollection, ExportFormat
+from app.util.email_outbox import EmailOutbox
+from app.repository.email_outbox_repository import EmailOutboxRepository
+from app.repository.pitchRepository import PitchRepository
+from app.repository.mentorship_repository import MentorshipRepository
+from app.services.calender_service import CalenderService
+from app.core.executor import BlockingExecutor
+from app.core.razorpay_client import AsyncRazorpayClient
+from app.util.response_cache import ResponseCache
+from app.core.index_audit import audit_query_plans
+from app.controller.export_controller import export_collection_controller
+from app.services.stats_service import StatsService
+from app.services.payment_service import PaymentService
+from app.controller.pitchController import PitchController
+from app.controller.payment_controller import PaymentBatchVerificationController
+from app.schema.payment_schema import (
+    PaymentBatchVerificationRequestSchema,
+    PaymentBatchVerificationResponseSchema,
+)
+from app.schema.pitchSchema import PitchStatusSchema
 
 router = APIRouter()
 
+# everything but /login
+ADMIN_ONLY = [Depends(validate_admin_token)]
+
 @router.post("/login")
 def admin_login(payload: AdminLoginRequest):
-    if payload.username != settings.ADMIN_USERNAME and payload.password != settings.ADMIN_PASSWORD:
+    """
+    Credentials → the X-Admin-Token every other admin route requires.
+    """
+    valid = hmac.compare_digest(payload.username.encode(), settings.ADMIN_USERNAME.encode())
+    valid &= hmac.compare_digest(payload.password.encode(), settings.ADMIN_PASSWORD.encode())
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials"
@@ -14,5 +47,92 @@ def admin_login(payload: AdminLoginRequest):
 
     return {
         "success": True,
-        "message": "Admin login successful"
+        "message": "Admin login successful",
+        "token": settings.ADMIN_API_TOKEN,
+    }
+
+
+@router.get("/metrics", summary="Background workers health / latency", dependencies=ADMIN_ONLY)
+async def admin_metrics():
+    return {
+        "success": True,
+        "email": EmailOutbox.metrics(),
+        "email_outbox_backlog": await EmailOutboxRepository.count_by_status(),
+        "pitch_pipeline_backlog": await PitchRepository.count_by_processing_status(),
+        "mentorship_booking_backlog": await MentorshipRepository.count_by_booking_status(),
+        "freebusy_cache": CalenderService.busy_cache_stats(),
+        "executors": BlockingExecutor.metrics(),
+        "razorpay_http": AsyncRazorpayClient.metrics(),
+        "response_cache": ResponseCache.stats(),
+    }
+
+
+@router.get("/index-report", summary="Explain-plan check of repository queries", dependencies=ADMIN_ONLY)
+async def admin_index_report():
+    report = await audit_query_plans()
+    return {
+        "success": all(row["uses_index"] for row in report),
+        "queries": report,
     }
+
+
+@router.get("/export/{collection}", summary="Stream a full collection as NDJSON / CSV", dependencies=ADMIN_ONLY)
+async def admin_export(
+    collection: ExportCollection,
+    format: ExportFormat = Query(ExportFormat.ndjson, description="ndjson or csv"),
+    date_from: Optional[date] = Query(None, description="created_at on or after (YYYY-MM-DD)"),
+    date_to: Optional[date] = Query(None, description="created_at on or before (YYYY-MM-DD)"),
+):
+    """
+    Constant-memory dump for the admin dashboard (replaces paging through
+    limit<=100 windows). Rows match the listing endpoints.
+    """
+    return export_collection_controller(collection, format, date_from, date_to)
+
+
+@router.get("/stats", summary="Pre-aggregated dashboard totals + daily series", dependencies=ADMIN_ONLY)
+async def admin_stats(
+    date_from: Optional[date] = Query(None, description="first day (YYYY-MM-DD), default: 30 days ago"),
+    date_to: Optional[date] = Query(None, description="last day (YYYY-MM-DD), default: today"),
+):
+    return await StatsService.get_stats(date_from, date_to)
+
+
+@router.post("/stats/rebuild", summary="Recompute dashboard stats from the raw collections", dependencies=ADMIN_ONLY)
+async def admin_stats_rebuild():
+    return await StatsService.rebuild()
+
+
+@router.get("/payments/reconcile", summary="Re-check stored Razorpay payment signatures", dependencies=ADMIN_ONLY)
+async def admin_payments_reconcile(
+    date_from: Optional[date] = Query(None, description="created_at on or after (YYYY-MM-DD)"),
+    date_to: Optional[date] = Query(None, description="created_at on or before (YYYY-MM-DD)"),
+):
+    """
+    Every verified Razorpay booking in the range → signature re-check
+    (in-process HMAC, batched); lists the bookings that fail it.
+    """
+    return await PaymentService.reconcile_stored_payments(date_from, date_to)
+
+
+
+@router.post(
+    "/payments/verify-batch",
+    summary="Re-check up to PAYMENT_VERIFY_BATCH_MAX Razorpay signatures",
+    response_model=PaymentBatchVerificationResponseSchema,
+    dependencies=ADMIN_ONLY,
+)
+async def admin_payments_verify_batch(request: PaymentBatchVerificationRequestSchema):
+    """
+    Reconciliation: (order id, payment id, signature) triples → one result each.
+    """
+    return await PaymentBatchVerificationController(request=request)
+
+@router.post(
+    "/pitches/{pitch_id}/requeue",
+    summary="Re-run the background pipeline of a failed pitch",
+    response_model=PitchStatusSchema,
+    dependencies=ADMIN_ONLY,
+)
+async def admin_pitch_requeue(pitch_id: str):
+    return await PitchController.requeue_pitch_controller(pitch_id)
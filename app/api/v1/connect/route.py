@@ -1,6 +1,10 @@
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Header, Query
+from typing import Optional
 from app.controller.connectController import *
 from app.schema.connectSchema import *
+from app.util.fast_json import FastJSONResponse
+from app.util.etag import conditional_listing
+from app.repository.connect_repository import ConnectRepository
 
 router = APIRouter()
 
@@ -9,10 +13,17 @@ async def connect_create(payload: ConnectCreateRequestSchema):
     return await connect_create_controller(payload)
 
 
-@router.get("/", summary="To get the data for admin dashbaord", response_model=ConnectFetchResponseSchema)
+@router.get("/", summary="To get the data for admin dashbaord", response_model=ConnectFetchResponseSchema, response_class=FastJSONResponse)
 async def connect_fetch(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
-    limit: int = Query(10, ge=1, le=100, description="Number of records to fetch")
+    limit: int = Query(10, ge=1, le=100, description="Number of records to fetch"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (overrides skip)"),
+    if_none_match: Optional[str] = Header(None),
 ):
-    result =  await connect_fetch_controller(skip, limit)
-    return result
+    return await conditional_listing(
+        if_none_match,
+        "connect",
+        ("list", skip, limit, cursor),
+        probe=lambda: ConnectRepository.connect_get_all_fingerprint(skip, limit + 1, cursor),
+        build=lambda: connect_fetch_controller(skip, limit, cursor),
+    )
@@ -1,29 +1,75 @@
-from fastapi import APIRouter, Query
-from app.schema.mentorship_schema import AvailabilityRequest, MentorshipCreateSchema, AvailabilityResponse
+from fastapi import APIRouter, Header, Query
+from typing import Optional
+from app.schema.mentorship_schema import (
+    AvailabilityRequest,
+    AvailabilityResponse,
+    AvailabilityRangeRequest,
+    AvailabilityRangeResponse,
+    MentorshipCreateSchema,
+    MentorshipResponseSchema,
+    MentorshipBookingStatusSchema,
+)
 from app.controller.mentorship_controller import MentorshipController
+from app.util.fast_json import FastJSONResponse
+from app.util.etag import conditional_listing
+from app.repository.mentorship_repository import MentorshipRepository
 
 router = APIRouter()
 
 @router.post("/availability", response_model=AvailabilityResponse)
 async def availability(request: AvailabilityRequest):
-    return MentorshipController.get_available_slots(request)
+    return await MentorshipController.get_available_slots(request)
 
-@router.post("/book")
+@router.post("/availability/range", response_model=AvailabilityRangeResponse)
+async def availability_range(request: AvailabilityRangeRequest):
+    """
+    Week / month picker:
+    - One free/busy query for the whole window
+    - Slots for every day in [meeting_date_from, meeting_date_to]
+    """
+    return await MentorshipController.get_available_slots_range(request)
+
+@router.post("/book", response_model=MentorshipResponseSchema)
 async def book(request: MentorshipCreateSchema):
+    """
+    Holds the slot and stores the booking (status "processing"), returns its id.
+    Calendar event + emails run in the background: poll /book/{booking_id}/status.
+    A retry with the same razorpay_payment_id replays the first response.
+    """
     return await MentorshipController.book_mentorship(request)
 
-@router.get("/")
+@router.get("/book/{booking_id}/status", response_model=MentorshipBookingStatusSchema)
+async def booking_status(booking_id: str):
+    """
+    processing   → calendar event / emails still running (retried on failure)
+    scheduled    → done, event_link is final
+    compensating → could not be booked, event + slot being released
+    failed       → released; failure_reason says why
+    """
+    return await MentorshipController.get_booking_status_controller(booking_id)
+
+@router.get("/", response_class=FastJSONResponse)
 async def get_all_mentorships(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
-    limit: int = Query(20, ge=1, le=100, description="Number of records to fetch")
+    limit: int = Query(20, ge=1, le=100, description="Number of records to fetch"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (overrides skip)"),
+    if_none_match: Optional[str] = Header(None),
 ):
     """
     Admin Dashboard:
     - Get all mentorship bookings
     - Sorted by creation (latest first)
-    - Paginated
+    - Paginated (skip/limit or keyset cursor)
+    - ETag / If-None-Match → 304 when the page is unchanged
     """
-    return await MentorshipController.get_all_mentorships_controller(
-        skip=skip,
-        limit=limit
+    return await conditional_listing(
+        if_none_match,
+        "mentorships",
+        ("list", skip, limit, cursor),
+        probe=lambda: MentorshipRepository.get_all_mentorships_fingerprint(skip, limit + 1, cursor),
+        build=lambda: MentorshipController.get_all_mentorships_controller(
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+        ),
     )
\ No newline at end of file
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, HTTPException
+from typing import Optional
+from fastapi import APIRouter, Header, HTTPException
 from app.schema.payment_schema import *
 from app.controller.payment_controller import *
 
@@ -8,17 +9,29 @@ router = APIRouter()
 
 
 @router.post("/create-order", response_model=PaymentOrderResponseSchema)
-async def create_payment_order(request: PaymentOrderRequestSchema):
+async def create_payment_order(
+    request: PaymentOrderRequestSchema,
+    idempotency_key: Optional[str] = Header(None),
+):
+    """
+    Optional `Idempotency-Key` header: retries with the same key (and body)
+    get the first order back instead of creating a new one.
+    """
 
     # Calling Controller for razorpay order creation
     try:
-        result = await CreatePaymentOrderController(request=request)
+        result = await CreatePaymentOrderController(
+            request=request, idempotency_key=idempotency_key
+        )
 
         return PaymentOrderResponseSchema(
             order_id=result["id"],
             amount=result["amount"]
         )
-        
+
+    except HTTPException:
+        raise
+
     except Exception as e:
         print(f"[ERROR] - [{e}]")
         raise HTTPException(
@@ -44,4 +57,3 @@ async def verify_payment(request: PaymentVerificationRequestSchema) -> PaymentVe
                 "message": str(e),
             },
         )
-
@@ -1,15 +1,30 @@
-from fastapi import APIRouter, Form, UploadFile, File, Query
+from fastapi import APIRouter, Form, UploadFile, File, Header, HTTPException, Query, Request, status
+from datetime import date
 from typing import Optional
 
 from app.schema.pitchSchema import (
     PitchCreateSchema,
     PitchCreateResponseSchema,
-    PitchListResponseSchema
+    PitchListResponseSchema,
+    ProposalUploadSignatureSchema,
+    PitchSearchResponseSchema,
+    PitchStatusSchema,
 )
 from app.controller.pitchController import PitchController
+from app.util.fast_json import FastJSONResponse
+from app.util.response_cache import ResponseCache
+from app.util.etag import conditional_listing
+from app.repository.pitchRepository import PitchRepository
+from app.util.cloudinary_upload import sign_proposal_upload
+from app.util.rate_limit import FixedWindowRateLimiter
+from app.core.config import settings
 
 router = APIRouter()
 
+_upload_grants = FixedWindowRateLimiter(
+    limit=settings.CLOUDINARY_SIGNED_UPLOADS_PER_HOUR, window_seconds=3600
+)
+
 
 @router.get("/health", summary="Health Check")
 async def health_check():
@@ -49,13 +64,19 @@ async def create_pitch(
     email: str = Form(...),
     contact_number: str = Form(...),
     pitch_summary: str = Form(...),
-    proposal_file: Optional[UploadFile] = File(None),  # ✅ actual file
+    proposal_file: Optional[UploadFile] = File(None),  # legacy: file through the API
+    proposal_public_id: Optional[str] = Form(None),  # ✅ direct upload result
+    proposal_version: Optional[int] = Form(None),
+    proposal_signature: Optional[str] = Form(None),
 ):
     """
     Create a new pitch (multipart/form-data)
 
     - Text fields via Form
-    - proposal_file is an actual file (PDF / PPT / DOC)
+    - Preferred: upload the proposal straight to Cloudinary with the params from
+      `POST /proposal-upload-signature`, then send the `public_id`, `version`
+      and `signature` from Cloudinary's response
+    - Legacy: proposal_file is an actual file (PDF / PPT / DOC)
     """
 
     payload = PitchCreateSchema(
@@ -71,23 +92,108 @@ async def create_pitch(
     return await PitchController.create_pitch_controller(
         payload=payload,
         proposal_file=proposal_file,
+        proposal_public_id=proposal_public_id,
+        proposal_version=proposal_version,
+        proposal_signature=proposal_signature,
     )
 
 
+@router.post(
+    "/proposal-upload-signature",
+    response_model=ProposalUploadSignatureSchema,
+    summary="Signed params for a direct browser → Cloudinary proposal upload",
+)
+async def proposal_upload_signature(request: Request):
+    """
+    The browser POSTs the file with these fields to `upload_url`; the deck
+    never passes through this API. Valid until `expires_at`.
+    At most CLOUDINARY_SIGNED_UPLOADS_PER_HOUR grants per client.
+    """
+    client = request.client.host if request.client else "unknown"
+    if not _upload_grants.hit(client):
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many upload requests, try again later"
+        )
+    return sign_proposal_upload()
+
+
 @router.get(
     "/",
     response_model=PitchListResponseSchema,
+    response_class=FastJSONResponse,
     summary="Get all startup pitches (paginated)",
     description="Fetch all startup pitches sorted by creation date (latest first)"
 )
 async def get_all_pitch(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(10, ge=1, le=100, description="Number of records to fetch"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (overrides skip)"),
+    if_none_match: Optional[str] = Header(None),
 ):
     """
     Returns a paginated list of pitches.
 
-    - **skip**: Offset (default 0)
+    - **skip**: Offset (default 0, legacy mode)
     - **limit**: Page size (default 10, max 100)
+    - **cursor**: Opaque keyset cursor (`next_cursor` of the previous page)
+    - **If-None-Match**: ETag of a previous response → 304 when unchanged
+    """
+    # response_model documents the contract; the body is serialized in one pass
+    return await conditional_listing(
+        if_none_match,
+        "pitch",
+        ("list", skip, limit, cursor),
+        probe=lambda: PitchRepository.get_all_pitch_fingerprint(skip, limit + 1, cursor),
+        build=lambda: PitchController.get_all_pitches_controller(skip=skip, limit=limit, cursor=cursor),
+    )
+
+
+@router.get(
+    "/search",
+    response_model=PitchSearchResponseSchema,
+    response_class=FastJSONResponse,
+    summary="Search pitches",
+    description="Keyword search over company name / sector / summary, with sector and date filters"
+)
+async def search_pitch(
+    q: Optional[str] = Query(None, min_length=2, max_length=200, description="Keywords (relevance ranked)"),
+    sector: Optional[str] = Query(None, description="Exact sector"),
+    date_from: Optional[date] = Query(None, description="created_at on or after (YYYY-MM-DD)"),
+    date_to: Optional[date] = Query(None, description="created_at on or before (YYYY-MM-DD)"),
+    limit: int = Query(20, ge=1, le=100, description="Number of records to fetch"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+):
+    """
+    - **q** given → ranked by relevance (`score`), then newest
+    - no **q** → latest first
+    - **cursor** is only valid with the same filters it was issued for
+    """
+    return FastJSONResponse(
+        await ResponseCache.get_or_build(
+            "pitch",
+            ("search", q, sector, date_from, date_to, limit, cursor),
+            lambda: PitchController.search_pitches_controller(
+                q=q,
+                sector=sector,
+                date_from=date_from,
+                date_to=date_to,
+                limit=limit,
+                cursor=cursor,
+            ),
+        )
+    )
+
+
+@router.get(
+    "/{pitch_id}/status",
+    response_model=PitchStatusSchema,
+    summary="Background processing status of a pitch",
+)
+async def pitch_status(pitch_id: str):
+    """
+    processing → proposal upload / emails still running (retried on failure)
+    ready      → done, proposal_file_url is final
+    failed     → gave up after the retry budget; last_error says why
     """
-    return await PitchController.get_all_pitches_controller(skip=skip, limit=limit)
+    return await PitchController.get_pitch_status_controller(pitch_id)
@@ -1,36 +1,49 @@
 from app.services.connectService import ConnectService
 from app.repository.connect_repository import ConnectRepository
 from app.schema.connectSchema import *
+from app.util.pagination import split_page
+from typing import Any, Dict, Optional
 
 async def connect_create_controller(payload: ConnectCreateRequestSchema) -> ConnectCreateResponseSchema:
     result = await ConnectService.connect_create_service(payload)
     return result
 
+def connect_list_row(doc: dict) -> Dict[str, Any]:
+    """
+    Raw Mongo connect → ConnectFetchSchema-shaped dict (listing + export)
+    """
+    return {
+        "name": doc["name"],
+        "email": doc["email"],
+        "purpose": doc["purpose"],
+        "message": doc["message"],
+        "created_at": doc["created_at"],
+    }
+
 async def connect_fetch_controller(
     skip: int = 0,
-    limit: int = 20
-) -> ConnectFetchResponseSchema:
+    limit: int = 20,
+    cursor: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Fast path: raw Mongo dicts → JSON-ready dict (no model instantiation).
+    Same JSON contract as ConnectFetchResponseSchema; serialize with FastJSONResponse.
+    """
     
-    docs = await ConnectRepository.connect_get_all_repository(
+    docs = await ConnectRepository.connect_get_all_raw_repository(
         skip=skip,
-        limit=limit
+        limit=limit + 1,  # one extra row → is there a next page?
+        cursor=cursor,
     )
+    docs, next_cursor = split_page(docs, limit)
 
-    data = [
-        ConnectFormEntry(
-            name=doc.name,
-            email=doc.email,
-            purpose=doc.purpose,
-            message=doc.message,
-            created_at=doc.created_at
-        )
-        for doc in docs
-    ]
+    data = [connect_list_row(doc) for doc in docs]
 
-    return ConnectFetchResponseSchema(
-        success=True,
-        limit=limit,
-        skip=skip,
-        count=len(data),
-        data=data
-    )
\ No newline at end of file
+    return {
+        "success": True,
+        "limit": limit,
+        "count": len(data),
+        "skip": skip,
+        "data": data,
+        "next_cursor": next_cursor,
+    }
@@ -0,0 +1,79 @@
+from datetime import date
+from typing import Optional
+
+from fastapi import HTTPException, status
+from fastapi.responses import StreamingResponse
+
+from app.controller.connectController import connect_list_row
+from app.controller.mentorship_controller import MentorshipController
+from app.controller.pitchController import PitchController
+from app.repository.connect_repository import ConnectRepository
+from app.repository.mentorship_repository import MentorshipRepository
+from app.repository.pitchRepository import PitchRepository
+from app.schema.admin_schema import ExportCollection, ExportFormat
+from app.util.export_stream import csv_stream, ndjson_stream
+
+# collection → (raw cursor, row builder shared with the listing, CSV columns)
+EXPORTS = {
+    ExportCollection.pitches: (
+        PitchRepository.export_pitch_cursor,
+        PitchController.list_row,
+        [
+            "id", "name", "company_name", "sector", "investment_required", "email",
+            "contact_number", "pitch_summary", "proposal_file_url", "created_at", "updated_at",
+        ],
+    ),
+    ExportCollection.connects: (
+        ConnectRepository.connect_export_cursor,
+        connect_list_row,
+        ["name", "email", "purpose", "message", "created_at"],
+    ),
+    ExportCollection.mentorships: (
+        MentorshipRepository.export_mentorships_cursor,
+        MentorshipController.list_row,
+        [
+            "id", "full_name", "email", "contact", "plan_name", "price", "duration_minutes",
+            "selected_date", "selected_start_time", "timezone", "topic", "status",
+            "payment.method", "payment.amount", "payment.verified",
+            "calendar_event.meet_link", "calendar_event.start_datetime", "calendar_event.end_datetime",
+            "created_at", "updated_at",
+        ],
+    ),
+}
+
+MEDIA_TYPES = {
+    ExportFormat.ndjson: "application/x-ndjson",
+    ExportFormat.csv: "text/csv; charset=utf-8",
+}
+
+
+def export_collection_controller(
+    collection: ExportCollection,
+    fmt: ExportFormat,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+) -> StreamingResponse:
+    """
+    Stream a whole collection (optionally a created_at day range) straight
+    from the Mongo cursor; memory stays at one cursor batch.
+    """
+    if date_from and date_to and date_from > date_to:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="date_from must be on or before date_to"
+        )
+
+    open_cursor, to_row, columns = EXPORTS[collection]
+    cursor = open_cursor(date_from, date_to)
+
+    if fmt == ExportFormat.csv:
+        body = csv_stream(cursor, to_row, columns)
+    else:
+        body = ndjson_stream(cursor, to_row)
+
+    filename = f"{collection.value}-{date.today():%Y%m%d}.{fmt.value}"
+    return StreamingResponse(
+        body,
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
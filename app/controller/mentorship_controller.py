@@ -1,22 +1,34 @@
 # Packages
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
+import asyncio
+from datetime import date, datetime, timedelta
+from typing import List, Dict, Any, Optional
 import pytz
 from fastapi import HTTPException
+from beanie import PydanticObjectId
+from bson.errors import InvalidId
+from pymongo.errors import DuplicateKeyError
 
 # Custom Code imports
 from app.services.calender_service import CalenderService
 from app.services.payment_service import PaymentService
-from app.util.email_service import EmailService
+from app.services.mentorship_booking_service import MentorshipBookingService
+from app.services.slot_reservation_service import SlotReservationService
+from app.services.idempotency_service import IdempotencyService
 from app.core.config import settings
 from app.repository.mentorship_repository import MentorshipRepository
-from app.models.mentorship_model import Mentorship, PaymentDetails, CalendarEventDetails
+from app.util.pagination import split_page
+from app.util.slot_engine import merge_busy_intervals, free_slot_starts, hhmm
+from app.models.mentorship_model import Mentorship, PaymentDetails, BookingProcessing
 from app.schema.mentorship_schema import (
     AvailabilityRequest,
     AvailabilityResponse,
+    AvailabilityRangeRequest,
+    AvailabilityRangeResponse,
+    DayAvailability,
     TimeSlot,
     MentorshipCreateSchema,
-    MentorshipResponseSchema
+    MentorshipResponseSchema,
+    MentorshipBookingStatusSchema,
 )
 from app.schema.payment_schema import PaymentVerificationRequestSchema
 
@@ -27,20 +39,30 @@ class MentorshipController:
     # 1️⃣ Compute available slots
     # ---------------------------------------------------------
     @staticmethod
-    def get_available_slots(request: AvailabilityRequest) -> AvailabilityResponse:
+    def _compute_day_slots(
+        meeting_date: date,
+        duration_minutes: int,
+        busy_slots: List[dict],
+        now: datetime,
+        step_minutes: Optional[int] = None,
+    ) -> List[TimeSlot]:
+        """
+        Free slots of one working day, given that day's busy intervals.
+
+        Slot starts sit on a grid anchored at WORK_START_TIME with
+        `step_minutes` spacing (defaults to SLOT_STEP_MINUTES, then duration).
+        """
         tz = pytz.timezone(settings.TIMEZONE)
-        meeting_date = request.meeting_date
         meeting_date_str = meeting_date.strftime("%Y-%m-%d")
-
-        now = datetime.now(tz)
         today = now.date()
 
+        if meeting_date < today:
+            return []
+
         earliest_start = None
         if meeting_date == today:
             earliest_start = (now + timedelta(minutes=30)).replace(second=0, microsecond=0)
 
-        busy_slots = CalenderService.fetch_busy_slots(meeting_date_str)
-
         work_start = tz.localize(datetime.strptime(
             f"{meeting_date_str} {settings.WORK_START_TIME}", "%Y-%m-%d %H:%M"
         ))
@@ -50,39 +72,119 @@ class MentorshipController:
 
         effective_start = max(work_start, earliest_start) if earliest_start else work_start
         if effective_start >= work_end:
-            return AvailabilityResponse(slots=[])
+            return []
+
+        duration = duration_minutes * 60
+        step = (step_minutes or settings.SLOT_STEP_MINUTES or duration_minutes) * 60
+
+        starts = free_slot_starts(
+            grid_origin=int(work_start.timestamp()),
+            window_start=int(effective_start.timestamp()),
+            window_end=int(work_end.timestamp()),
+            duration=duration,
+            step=step,
+            intervals=merge_busy_intervals(busy_slots),
+        )
 
-        duration_td = timedelta(minutes=request.duration_minutes)
-        slot_start = effective_start
-        available_slots: List[TimeSlot] = []
+        # 🔹 Fast label path unless the day crosses a DST change
+        utc_offset = int(work_start.utcoffset().total_seconds())
+        if utc_offset != int(work_end.utcoffset().total_seconds()):
+            return [
+                TimeSlot(
+                    start=datetime.fromtimestamp(t, tz).strftime("%H:%M"),
+                    end=datetime.fromtimestamp(t + duration, tz).strftime("%H:%M"),
+                )
+                for t in starts
+            ]
 
-        while slot_start + duration_td <= work_end:
-            slot_end = slot_start + duration_td
-            overlap = False
+        return [
+            TimeSlot(start=hhmm(t, utc_offset), end=hhmm(t + duration, utc_offset))
+            for t in starts
+        ]
 
-            for busy in busy_slots:
-                busy_start = datetime.fromisoformat(busy["start"]).astimezone(tz)
-                busy_end = datetime.fromisoformat(busy["end"]).astimezone(tz)
-                if slot_start < busy_end and slot_end > busy_start:
-                    overlap = True
-                    break
+    @staticmethod
+    async def get_available_slots(request: AvailabilityRequest) -> AvailabilityResponse:
+        now = datetime.now(pytz.timezone(settings.TIMEZONE))
 
-            if not overlap:
-                available_slots.append(TimeSlot(
-                    start=slot_start.strftime("%H:%M"),
-                    end=slot_end.strftime("%H:%M")
-                ))
+        meeting_date = request.meeting_date.strftime("%Y-%m-%d")
 
-            slot_start += duration_td
+        # Google free/busy + local holds (bookings not on the calendar yet)
+        busy_slots, held_by_day = await asyncio.gather(
+            CalenderService.fetch_busy_slots(meeting_date),
+            SlotReservationService.held_busy(meeting_date, meeting_date),
+        )
+        busy_slots = busy_slots + held_by_day.get(meeting_date, [])
+
+        return AvailabilityResponse(
+            slots=MentorshipController._compute_day_slots(
+                request.meeting_date,
+                request.duration_minutes,
+                busy_slots,
+                now,
+                step_minutes=request.step_minutes,
+            )
+        )
 
-        return AvailabilityResponse(slots=available_slots)
+    @staticmethod
+    async def get_available_slots_range(request: AvailabilityRangeRequest) -> AvailabilityRangeResponse:
+        """
+        Slots for every day in [meeting_date_from, meeting_date_to]
+        from ONE free/busy query for the whole window.
+        """
+        now = datetime.now(pytz.timezone(settings.TIMEZONE))
+
+        date_from = request.meeting_date_from.strftime("%Y-%m-%d")
+        date_to = request.meeting_date_to.strftime("%Y-%m-%d")
+
+        busy_by_day, held_by_day = await asyncio.gather(
+            CalenderService.fetch_busy_slots_range(date_from, date_to),
+            SlotReservationService.held_busy(date_from, date_to),
+        )
+
+        days: List[DayAvailability] = []
+        day = request.meeting_date_from
+        while day <= request.meeting_date_to:
+            day_str = day.strftime("%Y-%m-%d")
+            busy_slots = busy_by_day.get(day_str, []) + held_by_day.get(day_str, [])
+            days.append(DayAvailability(
+                meeting_date=day,
+                slots=MentorshipController._compute_day_slots(
+                    day,
+                    request.duration_minutes,
+                    busy_slots,
+                    now,
+                    step_minutes=request.step_minutes,
+                ),
+            ))
+            day += timedelta(days=1)
+
+        return AvailabilityRangeResponse(days=days)
 
     # ---------------------------------------------------------
     # 2️⃣ Book mentorship session
     # ---------------------------------------------------------
     @staticmethod
     async def book_mentorship(request: MentorshipCreateSchema) -> MentorshipResponseSchema:
-        
+        """
+        Idempotent on razorpay_payment_id: a retried booking gets the first
+        response back (one indexed lookup) instead of booking again.
+        """
+        response = await IdempotencyService.run(
+            "mentorship.book",
+            request.razorpay_payment_id,
+            IdempotencyService.fingerprint(request.model_dump(mode="json")),
+            lambda: MentorshipController._book(request),
+        )
+        return MentorshipResponseSchema(**response)
+
+    @staticmethod
+    async def _book(request: MentorshipCreateSchema) -> Dict[str, Any]:
+        """
+        Verify payment (local signature check), hold the slot and store the
+        booking with status "processing", then return its id right away.
+        Calendar event + emails → MentorshipBookingService.
+        """
+
         # -------------------------------
         # Payment verification
         # -------------------------------
@@ -118,34 +220,27 @@ class MentorshipController:
             )
 
         # -------------------------------
-        # Google Calendar booking
+        # Slot hold (Mongo ledger, one round trip, no Google call)
         # -------------------------------
-        calendar_result = CalenderService.book_meeting(
-            date=request.selected_date.strftime("%Y-%m-%d"),
-            start_time=request.selected_start_time,
-            duration=request.duration_minutes,
-            title=f"Mentorship: {request.plan_name}",
-            description=request.topic or "No topic specified",
+        booking_id = PydanticObjectId()
+        held = await SlotReservationService.hold(
+            booking_id,
+            request.selected_date,
+            request.selected_start_time,
+            request.duration_minutes,
         )
 
-        if calendar_result.get("status") != "success":
+        if not held:
             raise HTTPException(
-                status_code=500,
-                detail="Failed to schedule mentorship session"
+                status_code=409,
+                detail="Selected slot is already booked"
             )
 
-        calendar_event = CalendarEventDetails(
-            event_id=calendar_result["event_id"],
-            calendar_link=calendar_result["calendar_link"],
-            meet_link=calendar_result.get("meet_link"),
-            start_datetime=calendar_result["start"],
-            end_datetime=calendar_result["end"]
-        )
-
         # -------------------------------
-        # Save in DB
+        # Save in DB (status "processing")
         # -------------------------------
         mentorship = Mentorship(
+            id=booking_id,
             full_name=request.full_name,
             contact=request.contact,
             email=request.email,
@@ -157,111 +252,127 @@ class MentorshipController:
             topic=request.topic,
             payment_method=request.payment_method,
             payment=payment_details,
-            calendar_event=calendar_event,
-            status="scheduled"
+            calendar_event=None,
+            status="processing",
+            processing=BookingProcessing(),
         )
 
-        await MentorshipRepository.create_mentorship(mentorship)
-
-        # -------------------------------
-        # 📧 USER EMAIL
-        # -------------------------------
-        EmailService.send_email(
-            to_email=request.email,
-            subject="Mentorship Session Confirmed",
-            template_name="mentorship_requested_user.html",
-            full_name=request.full_name,
-            plan_name=request.plan_name,
-            session_date=request.selected_date.strftime("%d %b %Y"),
-            session_time=request.selected_start_time,
-            duration_minutes=request.duration_minutes,
-            topic=request.topic or "General Discussion",
-            platform_name="Rohit Mentorship"
-        )
+        try:
+            await MentorshipRepository.create_mentorship(mentorship)
+        except DuplicateKeyError:
+            await SlotReservationService.release(booking_id)
+            raise HTTPException(
+                status_code=409,
+                detail="This payment is already attached to a booking"
+            )
 
-        # -------------------------------
-        # 📧 ADMIN EMAIL
-        # -------------------------------
-        EmailService.send_email(
-            to_email=settings.EMAIL_FROM,
-            subject="New Mentorship Session Booked",
-            template_name="mentorship_requested_admin.html",
-            user_name=request.full_name,
-            user_email=request.email,
-            contact=request.contact,
-            plan_name=request.plan_name,
-            price=request.price,
-            session_date=request.selected_date.strftime("%d %b %Y"),
-            session_time=request.selected_start_time,
-            duration_minutes=request.duration_minutes,
-            topic=request.topic or "General Discussion",
-            payment_method=request.payment_method,
-            platform_name="Rohit Mentorship"
-        )
+        # calendar event / emails / stats → MentorshipBookingService
+        MentorshipBookingService.wake()
 
         # -------------------------------
         # Response
         # -------------------------------
         return MentorshipResponseSchema(
             success=True,
-            event_link=calendar_result["calendar_link"],
-            status="confirmed"
+            message="Mentorship booking received",
+            booking_id=str(mentorship.id),
+            status=mentorship.status
+        ).model_dump(mode="json")
+
+    @staticmethod
+    async def get_booking_status_controller(booking_id: str) -> MentorshipBookingStatusSchema:
+        """
+        Booking saga progress of one mentorship
+        """
+        try:
+            doc = await MentorshipRepository.get_booking_status(PydanticObjectId(booking_id))
+        except InvalidId:
+            doc = None
+
+        if not doc:
+            raise HTTPException(
+                status_code=404,
+                detail="Booking not found"
+            )
+
+        processing = doc.get("processing") or {}
+        calendar_event = doc.get("calendar_event") or {}
+        return MentorshipBookingStatusSchema(
+            id=str(doc["_id"]),
+            status=doc["status"],
+            completed_steps=processing.get("completed_steps", []),
+            compensated_steps=processing.get("compensated_steps", []),
+            attempts=processing.get("attempts", 0),
+            last_error=processing.get("last_error"),
+            failure_reason=processing.get("failure_reason"),
+            event_link=calendar_event.get("calendar_link"),
+            finished_at=processing.get("finished_at"),
         )
 
     
+    @staticmethod
+    def list_row(m: dict) -> Dict[str, Any]:
+        """
+        Raw Mongo mentorship → admin dashboard row (listing + export)
+        """
+        return {
+            "id": str(m["_id"]),
+            "full_name": m["full_name"],
+            "email": m["email"],
+            "contact": m["contact"],
+            "plan_name": m["plan_name"],
+            "price": m["price"],
+            "duration_minutes": m["duration_minutes"],
+            "selected_date": m["selected_date"].date(),  # stored as midnight datetime
+            "selected_start_time": m["selected_start_time"],
+            "timezone": m.get("timezone", "Asia/Kolkata"),
+            "topic": m.get("topic"),
+            "status": m["status"],
+
+            # payment (safe fields only)
+            "payment": {
+                "method": m["payment"].get("method"),
+                "amount": m["payment"].get("amount"),
+                "verified": m["payment"].get("verified"),
+            } if m.get("payment") else None,
+
+            # calendar
+            "calendar_event": {
+                "meet_link": m["calendar_event"].get("meet_link"),
+                "start_datetime": m["calendar_event"].get("start_datetime"),
+                "end_datetime": m["calendar_event"].get("end_datetime"),
+            } if m.get("calendar_event") else None,
+
+            "created_at": m["created_at"],
+            "updated_at": m["updated_at"],
+        }
+
     @staticmethod
     async def get_all_mentorships_controller(
         skip: int,
-        limit: int
+        limit: int,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Controller layer:
         - calls repository
         - converts data to admin dashboard response format
+          (JSON-ready dict; route serializes it with FastJSONResponse)
         """
 
-        mentorships = await MentorshipRepository.get_all_mentorships(
+        # Fast path: raw Mongo dicts, no model instantiation
+        mentorships = await MentorshipRepository.get_all_mentorships_raw(
             skip=skip,
-            limit=limit
+            limit=limit + 1,  # one extra row → is there a next page?
+            cursor=cursor,
         )
+        mentorships, next_cursor = split_page(mentorships, limit)
 
         return {
             "success": True,
             "limit": limit,
             "skip": skip,
             "count": len(mentorships),
-            "data": [
-                {
-                    "id": str(m.id),
-                    "full_name": m.full_name,
-                    "email": m.email,
-                    "contact": m.contact,
-                    "plan_name": m.plan_name,
-                    "price": m.price,
-                    "duration_minutes": m.duration_minutes,
-                    "selected_date": m.selected_date,
-                    "selected_start_time": m.selected_start_time,
-                    "timezone": m.timezone,
-                    "topic": m.topic,
-                    "status": m.status,
-
-                    # payment (safe fields only)
-                    "payment": {
-                        "method": m.payment.method if m.payment else None,
-                        "amount": m.payment.amount if m.payment else None,
-                        "verified": m.payment.verified if m.payment else None,
-                    } if m.payment else None,
-
-                    # calendar
-                    "calendar_event": {
-                        "meet_link": m.calendar_event.meet_link,
-                        "start_datetime": m.calendar_event.start_datetime,
-                        "end_datetime": m.calendar_event.end_datetime,
-                    } if m.calendar_event else None,
-
-                    "created_at": m.created_at,
-                    "updated_at": m.updated_at,
-                }
-                for m in mentorships
-            ]
-        }
\ No newline at end of file
+            "data": [MentorshipController.list_row(m) for m in mentorships],
+            "next_cursor": next_cursor,
+        }
@@ -1,16 +1,47 @@
+from typing import Optional
+
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.config import settings
 from app.schema.payment_schema import *
 from app.services.payment_service import PaymentService
+from app.services.idempotency_service import IdempotencyService
 
 
 async def CreatePaymentOrderController(
-        request: PaymentOrderRequestSchema
+        request: PaymentOrderRequestSchema,
+        idempotency_key: Optional[str] = None,
 ) -> PaymentOrderResponseSchema:
     
     # Calling payment service for razorpay order creation
     amount: str = request.amount
     currency: str = request.currency
-    return await PaymentService.create_razorpay_order_service(amount=amount, currency=currency)
+
+    if not idempotency_key:
+        return await PaymentService.create_razorpay_order_service(amount=amount, currency=currency)
+
+    if len(idempotency_key) > settings.IDEMPOTENCY_MAX_KEY_LENGTH:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Idempotency-Key cannot exceed {settings.IDEMPOTENCY_MAX_KEY_LENGTH} characters"
+        )
+
+    # Retried request → the first Razorpay order, not a new one
+    return await IdempotencyService.run(
+        "payment.create_order",
+        idempotency_key,
+        IdempotencyService.fingerprint(request.model_dump()),
+        lambda: PaymentService.create_razorpay_order_service(amount=amount, currency=currency),
+    )
 
 
 async def PaymentVerificationController(request: PaymentVerificationRequestSchema) -> PaymentVerificationResponseSchema:
     return PaymentService.verify_payment_service(request)
+
+
+async def PaymentBatchVerificationController(
+        request: PaymentBatchVerificationRequestSchema
+) -> PaymentBatchVerificationResponseSchema:
+    # CPU-bound HMAC loop → worker thread, the event loop keeps serving
+    return await run_in_threadpool(PaymentService.verify_payment_batch_service, request)
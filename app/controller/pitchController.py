@@ -1,15 +1,22 @@
-from fastapi import UploadFile
-from typing import Optional
+from fastapi import HTTPException, UploadFile, status
+from datetime import date
+from typing import Any, Dict, Optional
 
-from app.util.cloudinary_upload import upload_file_to_cloudinary
+from beanie import PydanticObjectId
+from bson.errors import InvalidId
+from pymongo.errors import DuplicateKeyError
+
+from app.util.cloudinary_upload import verify_proposal_upload
+from app.services.upload_service import UploadService
+from app.services.pitch_pipeline_service import PitchPipelineService
 from app.schema.pitchSchema import (
     PitchCreateSchema,
     PitchCreateResponseSchema,
-    PitchGetSchema,
-    PitchListResponseSchema
+    PitchStatusSchema,
 )
 from app.services.pitchService import PitchService
 from app.repository.pitchRepository import PitchRepository
+from app.util.pagination import split_page
 
 
 class PitchController:
@@ -22,58 +29,189 @@ class PitchController:
     async def create_pitch_controller(
         payload: PitchCreateSchema,
         proposal_file: Optional[UploadFile] = None,
+        proposal_public_id: Optional[str] = None,
+        proposal_version: Optional[int] = None,
+        proposal_signature: Optional[str] = None,
     ) -> PitchCreateResponseSchema:
         """
-        Create a new pitch
+        Create a new pitch (stored with status "processing", returns right away)
+
+        Proposal either:
+        - uploaded directly to Cloudinary (signed params) → public_id/version/signature
+        - or sent as a file (legacy multipart path, proxied through the API)
         """
 
+        if proposal_file and proposal_public_id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Send either proposal_file or proposal_public_id, not both"
+            )
+
         file_url = None
-        if proposal_file:
-            upload_result = await upload_file_to_cloudinary(
-                file=proposal_file,
-                folder="pitch/proposals",
-                resource_type="raw",  # pdf/doc/ppt
+        pending_upload = None
+        if proposal_public_id:
+            # ✅ verified locally against Cloudinary's response signature
+            file_url = verify_proposal_upload(
+                proposal_public_id, proposal_version, proposal_signature
             )
 
-            # ✅ ONLY public URL
-            file_url = upload_result["url"]
+        elif proposal_file:
+            # size-capped read + hash only; the upload runs in the background
+            pending_upload = await UploadService.read_capped(proposal_file)
 
-        result = await PitchService.create_pitch_service(
-            payload=payload,
-            proposal_file_url=file_url,
-        )
+        try:
+            result = await PitchService.create_pitch_service(
+                payload=payload,
+                proposal_file_url=file_url,
+                proposal_public_id=proposal_public_id,
+                pending_upload=pending_upload,
+            )
+        except DuplicateKeyError:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="This proposal upload is already attached to a pitch"
+            )
+
+        # upload / patch-back / emails → PitchPipelineService
+        PitchPipelineService.wake()
 
         return PitchCreateResponseSchema(**result)
 
+    @staticmethod
+    async def get_pitch_status_controller(pitch_id: str) -> PitchStatusSchema:
+        """
+        Background pipeline progress of one pitch
+        """
+        try:
+            doc = await PitchRepository.get_processing_status(PydanticObjectId(pitch_id))
+        except InvalidId:
+            doc = None
+
+        if not doc:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Pitch not found"
+            )
+
+        processing = doc.get("processing") or {}
+        return PitchStatusSchema(
+            id=str(doc["_id"]),
+            status=doc.get("status", "ready"),  # pitches stored before the pipeline
+            completed_steps=processing.get("completed_steps", []),
+            attempts=processing.get("attempts", 0),
+            last_error=processing.get("last_error"),
+            proposal_file_url=doc.get("proposal_file_url"),
+            finished_at=processing.get("finished_at"),
+        )
+
+    @staticmethod
+    async def requeue_pitch_controller(pitch_id: str) -> PitchStatusSchema:
+        """
+        Admin: send a failed pitch back through the background pipeline
+        """
+        try:
+            requeued = await PitchRepository.requeue_failed(PydanticObjectId(pitch_id))
+        except InvalidId:
+            requeued = False
+
+        if not requeued:
+            status_schema = await PitchController.get_pitch_status_controller(pitch_id)  # 404 if missing
+            if status_schema.status == "failed":
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="The proposal file is no longer stored; the pitch cannot be re-queued"
+                )
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Only failed pitches can be re-queued (status: {status_schema.status})"
+            )
+
+        PitchPipelineService.wake()
+        return await PitchController.get_pitch_status_controller(pitch_id)
+
+    @staticmethod
+    def list_row(doc: dict) -> Dict[str, Any]:
+        """
+        Raw Mongo pitch → PitchGetSchema-shaped dict (listing + export)
+        """
+        return {
+            "id": str(doc["_id"]),
+            "name": doc["name"],
+            "company_name": doc["company_name"],
+            "sector": doc["sector"],
+            "investment_required": doc["investment_required"],
+            "email": doc["email"],
+            "contact_number": doc["contact_number"],
+            "pitch_summary": doc.get("pitch_summary"),
+            "proposal_file_url": doc.get("proposal_file_url"),
+            "created_at": doc["created_at"],
+            "updated_at": doc["updated_at"],
+        }
+
     @staticmethod
     async def get_all_pitches_controller(
         skip: int = 0,
-        limit: int = 10
-    ) -> PitchListResponseSchema:
+        limit: int = 10,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Fast path: raw Mongo dicts → JSON-ready dict (no model instantiation).
+        Same JSON contract as PitchListResponseSchema; serialize with FastJSONResponse.
+        """
 
-        docs = await PitchRepository.get_all_pitch_repository(skip, limit)
+        # one extra row → is there a next page?
+        docs = await PitchRepository.get_all_pitch_raw_repository(skip, limit + 1, cursor)
+        docs, next_cursor = split_page(docs, limit)
 
-        data = [
-            PitchGetSchema(
-                id=str(doc.id),
-                name=doc.name,
-                company_name=doc.company_name,
-                sector=doc.sector,
-                investment_required=doc.investment_required,
-                email=doc.email,
-                contact_number=doc.contact_number,
-                pitch_summary=doc.pitch_summary,
-                proposal_file_url=doc.proposal_file_url,
-                created_at=doc.created_at,
-                updated_at=doc.updated_at,
+        data = [PitchController.list_row(doc) for doc in docs]
+
+        return {
+            "success": True,
+            "limit": limit,
+            "count": len(data),
+            "skip": skip,
+            "data": data,
+            "next_cursor": next_cursor,
+        }
+
+    @staticmethod
+    async def search_pitches_controller(
+        q: Optional[str] = None,
+        sector: Optional[str] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Keyword (relevance-ranked) and/or sector + date-range search.
+        Same fast path as the listing; serialize with FastJSONResponse.
+        """
+        if date_from and date_to and date_from > date_to:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="date_from must be on or before date_to"
             )
+
+        docs = await PitchRepository.search_pitch_raw_repository(
+            q=q,
+            sector=sector,
+            date_from=date_from,
+            date_to=date_to,
+            limit=limit + 1,  # one extra row → is there a next page?
+            cursor=cursor,
+        )
+        docs, next_cursor = split_page(docs, limit)
+
+        data = [
+            {**PitchController.list_row(doc), "score": doc.get("score")}
             for doc in docs
         ]
 
-        return PitchListResponseSchema(
-            success=True,
-            limit=limit,
-            skip=skip,
-            count=len(data),
-            data=data
-        )
\ No newline at end of file
+        return {
+            "success": True,
+            "limit": limit,
+            "count": len(data),
+            "data": data,
+            "next_cursor": next_cursor,
+        }
@@ -22,6 +22,7 @@ class Settings(BaseSettings):
     # File Upload
     # --------------------------------------------------
     MAX_UPLOAD_SIZE_MB: int = 10
+    UPLOAD_READ_CHUNK_BYTES: int = 1024 * 1024  # hash / size-check granularity
 
     # --------------------------------------------------
     # Timezone & Working Hours
@@ -29,12 +30,25 @@ class Settings(BaseSettings):
     TIMEZONE: str = "Asia/Kolkata"
     WORK_START_TIME: str = "10:00"
     WORK_END_TIME: str = "23:00"
+    AVAILABILITY_MAX_RANGE_DAYS: int = 31
+    SLOT_STEP_MINUTES: Optional[int] = None  # None → step by meeting duration
+    MENTORSHIP_MAX_DURATION_MINUTES: int = 240  # longest plan a booking may ask for
+
+    # --------------------------------------------------
+    # Slot reservation ledger (Mongo holds, see SlotReservationService)
+    # --------------------------------------------------
+    SLOT_RESERVATION_GRANULE_MINUTES: int = 5
+    SLOT_HOLD_TTL_SECONDS: int = 3600  # must outlast the booking saga's retries
 
     # --------------------------------------------------
     # MongoDB
     # --------------------------------------------------
     MONGO_URI: str
     MONGO_DB_NAME: str
+    MONGO_DROP_STALE_INDEXES: bool = False  # drop indexes no longer declared on models
+    MONGO_AUDIT_QUERY_PLANS: bool = False  # print explain-plan report on startup
+    EXPORT_BATCH_SIZE: int = 1000  # cursor batch + rows per streamed chunk (admin export)
+    STATS_DEFAULT_RANGE_DAYS: int = 30  # GET /admin/stats window when no dates are given
 
     # --------------------------------------------------
     # Email (SMTP)
@@ -46,16 +60,75 @@ class Settings(BaseSettings):
     EMAIL_FROM: str
     EMAIL_USE_SSL: bool = False
 
+    # --------------------------------------------------
+    # Email outbox (background sending)
+    # --------------------------------------------------
+    EMAIL_OUTBOX_WORKERS: int = 2
+    EMAIL_OUTBOX_MAX_QUEUE: int = 1000
+    EMAIL_OUTBOX_DRAIN_TIMEOUT_SECONDS: int = 10
+    EMAIL_SMTP_POOL_SIZE: int = 2
+    EMAIL_SMTP_MAX_IDLE_SECONDS: int = 240
+    EMAIL_SMTP_TIMEOUT_SECONDS: int = 30
+
+    # Durable outbox (Mongo `email_outbox` drainer)
+    EMAIL_OUTBOX_BATCH_SIZE: int = 20
+    EMAIL_OUTBOX_POLL_SECONDS: int = 5
+    EMAIL_OUTBOX_LEASE_SECONDS: int = 120
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = 6
+    EMAIL_OUTBOX_BACKOFF_BASE_SECONDS: int = 30
+    EMAIL_OUTBOX_BACKOFF_MAX_SECONDS: int = 3600
+    EMAIL_OUTBOX_RETENTION_DAYS: int = 7
+
+    # --------------------------------------------------
+    # Pitch pipeline (background upload + notifications)
+    # --------------------------------------------------
+    PITCH_PIPELINE_BATCH_SIZE: int = 10
+    PITCH_PIPELINE_POLL_SECONDS: int = 5
+    PITCH_PIPELINE_LEASE_SECONDS: int = 300
+    PITCH_PIPELINE_MAX_ATTEMPTS: int = 5
+    PITCH_PIPELINE_BACKOFF_BASE_SECONDS: int = 30
+    PITCH_PIPELINE_BACKOFF_MAX_SECONDS: int = 1800
+    PITCH_FAILED_UPLOAD_RETENTION_HOURS: int = 72  # re-queue window for failed pitches
+
+    # --------------------------------------------------
+    # Mentorship booking saga (calendar event + notifications)
+    # --------------------------------------------------
+    MENTORSHIP_BOOKING_BATCH_SIZE: int = 10
+    MENTORSHIP_BOOKING_POLL_SECONDS: int = 5
+    MENTORSHIP_BOOKING_LEASE_SECONDS: int = 120
+    MENTORSHIP_BOOKING_MAX_ATTEMPTS: int = 5
+    MENTORSHIP_BOOKING_BACKOFF_BASE_SECONDS: int = 15
+    MENTORSHIP_BOOKING_BACKOFF_MAX_SECONDS: int = 600
+
+    # --------------------------------------------------
+    # Idempotency (create-order Idempotency-Key, booking payment id)
+    # --------------------------------------------------
+    IDEMPOTENCY_TTL_SECONDS: int = 86400  # how long responses are replayed
+    IDEMPOTENCY_LEASE_SECONDS: int = 60  # in-flight owner presumed dead after this
+    IDEMPOTENCY_WAIT_SECONDS: float = 15  # duplicate waits this long, then 409
+    IDEMPOTENCY_POLL_SECONDS: float = 0.1
+    IDEMPOTENCY_MAX_KEY_LENGTH: int = 255
+
     # --------------------------------------------------
     # Razorpay
     # --------------------------------------------------
     RAZORPAY_KEY_ID: str
     RAZORPAY_KEY_SECRET: str
+    RAZORPAY_API_URL: str = "https://api.razorpay.com/v1"
+    RAZORPAY_HTTP_TIMEOUT_SECONDS: int = 10
+    RAZORPAY_HTTP_MAX_CONNECTIONS: int = 20
+    RAZORPAY_MAX_CONCURRENCY: int = 50  # calls in flight; extra callers wait
+    PAYMENT_VERIFY_BATCH_MAX: int = 100  # signatures per /admin/payments/verify-batch call
 
     # --------------------------------------------------
     # Google Calendar
     # --------------------------------------------------
     GOOGLE_CALENDAR_ID: str
+    FREEBUSY_CACHE_TTL_SECONDS: int = 60
+    FREEBUSY_CACHE_MAX_ENTRIES: int = 256
+    GOOGLE_HTTP_TIMEOUT_SECONDS: int = 10
+    GOOGLE_HTTP_MAX_CONNECTIONS: int = 20
+    GOOGLE_TOKEN_REFRESH_MARGIN_SECONDS: int = 300
 
     # --------------------------------------------------
     # Google Service Account (Encrypted)
@@ -68,6 +141,7 @@ class Settings(BaseSettings):
     # --------------------------------------------------
     ADMIN_USERNAME: str
     ADMIN_PASSWORD: str
+    ADMIN_API_TOKEN: Optional[str] = None  # X-Admin-Token for /admin/*; unset → admin API disabled
 
     # --------------------------------------------------
     #  Cloudinary credential
@@ -75,6 +149,24 @@ class Settings(BaseSettings):
     CLOUDINARY_CLOUD_NAME: str
     CLOUDINARY_API_KEY: str
     CLOUDINARY_API_SECRET: str
+    CLOUDINARY_SIGNED_UPLOAD_TTL_SECONDS: int = 900  # Cloudinary itself rejects signatures > 1h old
+    CLOUDINARY_SIGNED_UPLOADS_PER_HOUR: int = 10  # grants per client IP (per worker process)
+
+    # --------------------------------------------------
+    # Admin listing response cache
+    # --------------------------------------------------
+    RESPONSE_CACHE_BACKEND: str = "local"  # local | shared (multi-worker) | off
+    RESPONSE_CACHE_MAX_ENTRIES: int = 512
+    RESPONSE_CACHE_TTL_SECONDS: int = 30
+    RESPONSE_CACHE_SHM_NAME: str = "portfolio_response_cache"
+
+    # --------------------------------------------------
+    # Blocking SDK executors (one bounded pool per vendor)
+    # --------------------------------------------------
+    EXECUTOR_GOOGLE_WORKERS: int = 4
+    EXECUTOR_SMTP_WORKERS: int = 4
+    EXECUTOR_CLOUDINARY_WORKERS: int = 4
+    EXECUTOR_MAX_PENDING: int = 64  # per pool, queued + running
 
     # --------------------------------------------------
     # Pydantic config
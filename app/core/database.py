@@ -5,7 +5,9 @@ MongoDB connection setup using Motor + Beanie ODM.
 
 Responsibilities:
 - Create async MongoDB client
+- Check legacy data against new unique indexes (fail with the offending ids)
 - Initialize Beanie with document models
+- Sync declared indexes (+ optional explain-plan audit)
 - Provide clean startup integration for FastAPI
 
 Used by:
@@ -23,7 +25,13 @@ import os
 from app.models.pitchModel import Pitch
 from app.models.connect_model import Connect
 from app.models.mentorship_model import Mentorship
+from app.models.email_outbox_model import EmailOutboxEntry
+from app.models.stats_model import DailyStats
+from app.models.uploaded_file_model import UploadedFile
+from app.models.slot_reservation_model import SlotReservation
+from app.models.idempotency_model import IdempotencyRecord
 from app.core.config import settings
+from app.core.index_audit import print_query_plan_report
 
 
 class MongoDatabase:
@@ -38,6 +46,7 @@ class MongoDatabase:
     async def connect(cls):
         """
         Initialize MongoDB connection and Beanie ODM.
+        Syncs the indexes declared on every model.
 
         Called ONCE during FastAPI startup.
         """
@@ -50,16 +59,64 @@ class MongoDatabase:
 
         cls.client = AsyncIOMotorClient(mongo_uri)
 
+        await cls._check_duplicate_payment_ids(cls.client[db_name])
+
         await init_beanie(
             database=cls.client[db_name],
             document_models=[
                 Pitch,  # register all models here
                 Connect,
-                Mentorship
+                Mentorship,
+                EmailOutboxEntry,
+                DailyStats,
+                UploadedFile,
+                SlotReservation,
+                IdempotencyRecord,
             ],
+            # Declared `Settings.indexes` are created here; optionally drop
+            # indexes that are no longer declared on the model.
+            allow_index_dropping=settings.MONGO_DROP_STALE_INDEXES,
         )
 
-        print("✅ MongoDB connected successfully")
+        print("✅ MongoDB connected successfully (indexes synced)")
+
+        if settings.MONGO_AUDIT_QUERY_PLANS:
+            await print_query_plan_report()
+
+    @staticmethod
+    async def _check_duplicate_payment_ids(db):
+        """
+        `payment_razorpay_payment_id_unique` cannot be built while two
+        bookings share a Razorpay payment id. Before init_beanie tries,
+        name the duplicates so they can be merged / cleared by hand.
+        (Skipped once the index exists.)
+        """
+        collection = db[Mentorship.Settings.name]
+        indexes = await collection.index_information()
+        if "payment_razorpay_payment_id_unique" in indexes:
+            return
+
+        duplicates = await collection.aggregate([
+            {"$match": {"payment.razorpay_payment_id": {"$type": "string"}}},
+            {"$group": {
+                "_id": "$payment.razorpay_payment_id",
+                "bookings": {"$push": "$_id"},
+                "count": {"$sum": 1},
+            }},
+            {"$match": {"count": {"$gt": 1}}},
+        ]).to_list(length=None)
+
+        if not duplicates:
+            return
+
+        for row in duplicates:
+            bookings = ", ".join(str(booking_id) for booking_id in row["bookings"])
+            print(f"[ERROR] - Razorpay payment {row['_id']} is attached to several bookings: {bookings}")
+        raise RuntimeError(
+            f"{len(duplicates)} duplicate payment.razorpay_payment_id value(s) in "
+            f"'{Mentorship.Settings.name}': keep one booking per payment (or unset "
+            f"the id on the others) before the unique index can be created"
+        )
 
     @classmethod
     async def close(cls):
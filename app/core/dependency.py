@@ -1,5 +1,10 @@
+import hmac
+from typing import Optional
+
 from fastapi import Header, HTTPException, status
 
+from app.core.config import settings
+
 async def validate_user_header(user: str = Header(...)):
     """
     Dependency to check header 'user=abcd'.
@@ -11,3 +16,24 @@ async def validate_user_header(user: str = Header(...)):
             detail="Forbidden: Invalid user header"
         )
 
+
+
+async def validate_admin_token(x_admin_token: Optional[str] = Header(None)):
+    """
+    Dependency for the admin API: header 'X-Admin-Token' must equal
+    ADMIN_API_TOKEN (handed out by POST /admin/login).
+    Fails closed while ADMIN_API_TOKEN is not configured.
+    """
+    if not settings.ADMIN_API_TOKEN:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Admin API is disabled: ADMIN_API_TOKEN is not configured"
+        )
+
+    if not x_admin_token or not hmac.compare_digest(
+        x_admin_token.encode(), settings.ADMIN_API_TOKEN.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or missing X-Admin-Token"
+        )
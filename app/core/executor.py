@@ -0,0 +1,131 @@
+import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+from app.core.config import settings
+from app.util.metrics import LatencyRecorder
+
+# Named pools → size comes from settings.EXECUTOR_<NAME>_WORKERS
+POOLS = ("google", "smtp", "cloudinary")
+
+
+class ExecutorSaturatedError(RuntimeError):
+    """
+    Raised when a dependency pool already has EXECUTOR_MAX_PENDING calls
+    queued or running (fail fast instead of piling up requests).
+    """
+
+
+class _PoolStats:
+    def __init__(self):
+        self.pending = 0
+        self.completed = 0
+        self.errors = 0
+        self.rejected = 0
+        self.queue_wait = LatencyRecorder()
+        self.run_time = LatencyRecorder()
+
+    def snapshot(self, workers: int) -> dict:
+        return {
+            "workers": workers,
+            "pending": self.pending,
+            "completed": self.completed,
+            "errors": self.errors,
+            "rejected": self.rejected,
+            "queue_wait": self.queue_wait.snapshot(),
+            "run_time": self.run_time.snapshot(),
+        }
+
+
+class BlockingExecutor:
+    """
+    Central offload layer for blocking third-party SDK calls.
+
+    Each vendor gets its own size-limited thread pool, so a slow vendor
+    only exhausts its own threads and never the event loop or the other
+    vendors' pools.
+
+        result = await BlockingExecutor.run("cloudinary", cloudinary.uploader.upload, ...)
+    """
+
+    _pools: Dict[str, ThreadPoolExecutor] = {}
+    _stats: Dict[str, _PoolStats] = {name: _PoolStats() for name in POOLS}
+
+    @classmethod
+    def _get_pool(cls, name: str) -> ThreadPoolExecutor:
+        if name not in POOLS:
+            raise ValueError(f"Unknown executor pool: {name}")
+
+        pool = cls._pools.get(name)
+        if pool is None:
+            pool = ThreadPoolExecutor(
+                max_workers=getattr(settings, f"EXECUTOR_{name.upper()}_WORKERS"),
+                thread_name_prefix=f"{name}-io",
+            )
+            cls._pools[name] = pool
+        return pool
+
+    @staticmethod
+    def _timed_call(fn: Callable) -> tuple:
+        # runs on the worker thread; stats are recorded back on the loop
+        started_at = time.perf_counter()
+        try:
+            result, error = fn(), None
+        except Exception as e:
+            result, error = None, e
+        return started_at, time.perf_counter(), result, error
+
+    @classmethod
+    async def run(cls, pool_name: str, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Run a blocking callable on the named pool and await its result.
+        """
+        pool = cls._get_pool(pool_name)
+        stats = cls._stats[pool_name]
+
+        if stats.pending >= settings.EXECUTOR_MAX_PENDING:
+            stats.rejected += 1
+            raise ExecutorSaturatedError(
+                f"{pool_name} executor saturated ({stats.pending} pending calls)"
+            )
+
+        submitted_at = time.perf_counter()
+        stats.pending += 1
+        try:
+            started_at, finished_at, result, error = await asyncio.get_running_loop().run_in_executor(
+                pool,
+                cls._timed_call,
+                functools.partial(fn, *args, **kwargs),
+            )
+        finally:
+            stats.pending -= 1
+
+        stats.queue_wait.record(started_at - submitted_at)
+        stats.run_time.record(finished_at - started_at)
+
+        if error is not None:
+            stats.errors += 1
+            raise error
+
+        stats.completed += 1
+        return result
+
+    @classmethod
+    def shutdown(cls):
+        """
+        Called during FastAPI shutdown.
+        """
+        for pool in cls._pools.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+        cls._pools = {}
+
+    @classmethod
+    def metrics(cls) -> dict:
+        return {
+            name: cls._stats[name].snapshot(
+                getattr(settings, f"EXECUTOR_{name.upper()}_WORKERS")
+            )
+            for name in POOLS
+        }
@@ -0,0 +1,122 @@
+"""
+index_audit.py
+-------------
+Explain-plan check for the repository queries.
+
+Runs each query shape used by app/repository/* through `explain()` and
+reports the winning plan's stages, flagging any that fall back to a
+collection scan.
+
+Used by:
+- MongoDatabase.connect() when MONGO_AUDIT_QUERY_PLANS is enabled
+- GET /api/v1/admin/index-report
+"""
+
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Set
+
+from bson import ObjectId
+
+from app.models.connect_model import Connect
+from app.models.mentorship_model import Mentorship
+from app.models.pitchModel import Pitch
+from app.models.slot_reservation_model import SlotReservation
+from app.models.idempotency_model import IdempotencyRecord
+from app.core.config import settings
+from app.util.pagination import KEYSET_SORT
+
+
+def _query_shapes() -> list:
+    """
+    (name, document model, filter, sort) mirroring the repository queries.
+    """
+    keyset = {
+        "$or": [
+            {"created_at": {"$lt": datetime.now()}},
+            {"created_at": datetime.now(), "_id": {"$lt": ObjectId()}},
+        ]
+    }
+    day = datetime.combine(date.today(), datetime.min.time())
+    export_range = {"created_at": {"$gte": day, "$lt": datetime.now()}}
+
+    return [
+        ("pitch.list", Pitch, {}, KEYSET_SORT),
+        ("pitch.list_cursor", Pitch, keyset, KEYSET_SORT),
+        ("pitch.export_range", Pitch, export_range, KEYSET_SORT),
+        ("pitch.search_sector", Pitch, {"sector": "audit", **export_range}, KEYSET_SORT),
+        ("pitch.search_text", Pitch, {"$text": {"$search": "audit"}}, None),
+        ("pitch.pipeline_due", Pitch,
+         {"status": "processing", "processing.next_attempt_at": {"$lte": datetime.now()}},
+         [("processing.next_attempt_at", 1)]),
+        ("pitch.pipeline_claimed", Pitch,
+         {"_id": {"$in": [ObjectId()]}, "processing.claim_token": "audit"}, None),
+        ("pitch.stale_failed_uploads", Pitch,
+         {"status": "failed", "processing.finished_at": {"$lt": datetime.now()},
+          "pending_upload": {"$ne": None}}, None),
+        ("pitch.by_email", Pitch, {"email": "audit@example.com"}, None),
+        ("connect.list", Connect, {}, KEYSET_SORT),
+        ("connect.list_cursor", Connect, keyset, KEYSET_SORT),
+        ("connect.export_range", Connect, export_range, KEYSET_SORT),
+        ("connect.by_email", Connect, {"email": "audit@example.com"}, None),
+        ("mentorship.list", Mentorship, {}, KEYSET_SORT),
+        ("mentorship.list_cursor", Mentorship, keyset, KEYSET_SORT),
+        ("mentorship.export_range", Mentorship, export_range, KEYSET_SORT),
+        ("mentorship.by_email", Mentorship, {"email": "audit@example.com"}, None),
+        ("mentorship.by_date", Mentorship, {"selected_date": day}, None),
+        ("mentorship.booking_due", Mentorship,
+         {"status": {"$in": ["processing", "compensating"]}, "processing.next_attempt_at": {"$lte": datetime.now()}},
+         [("processing.next_attempt_at", 1)]),
+        ("mentorship.booking_claimed", Mentorship,
+         {"_id": {"$in": [ObjectId()]}, "processing.claim_token": "audit"}, None),
+        ("slot_reservation.held_between", SlotReservation,
+         {"calendar": settings.GOOGLE_CALENDAR_ID, "start": {"$gte": day, "$lt": day + timedelta(days=1)},
+          "expires_at": {"$gt": datetime.utcnow()}}, None),
+        ("slot_reservation.by_booking", SlotReservation, {"booking_id": ObjectId()}, None),
+        ("idempotency.by_key", IdempotencyRecord, {"scope": "mentorship.book", "key": "audit"}, None),
+        ("mentorship.by_payment_id", Mentorship, {"payment.razorpay_payment_id": "pay_audit"}, None),
+        ("mentorship.verified_payments", Mentorship,
+         {"payment.verified": True, "payment.razorpay_payment_id": {"$type": "string"}, **export_range}, None),
+    ]
+
+
+def _stages(plan: dict, found: Optional[Set[str]] = None) -> Set[str]:
+    found = set() if found is None else found
+    if "stage" in plan:
+        found.add(plan["stage"])
+    for key in ("inputStage", "queryPlan"):
+        if key in plan:
+            _stages(plan[key], found)
+    for child in plan.get("inputStages", []):
+        _stages(child, found)
+    return found
+
+
+async def audit_query_plans() -> List[dict]:
+    """
+    Explain every repository query shape.
+    `uses_index` is False when the winning plan contains a COLLSCAN.
+    """
+    report = []
+
+    for name, model, query_filter, sort in _query_shapes():
+        cursor = model.get_pymongo_collection().find(query_filter).limit(1)
+        if sort:
+            cursor = cursor.sort(sort)
+
+        explained = await cursor.explain()
+        stages = _stages(explained["queryPlanner"]["winningPlan"])
+
+        report.append({
+            "query": name,
+            "collection": model.get_collection_name(),
+            "stages": sorted(stages),
+            "uses_index": "COLLSCAN" not in stages,
+        })
+
+    return report
+
+
+async def print_query_plan_report():
+    for row in await audit_query_plans():
+        mark = "✅" if row["uses_index"] else "❌ COLLSCAN"
+        print(f"{mark} {row['query']:<28} {','.join(row['stages'])}")
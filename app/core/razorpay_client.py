@@ -1,13 +1,145 @@
-import razorpay
+import asyncio
+import time
+from typing import Optional
+from urllib.parse import quote
+
+import httpx
 from app.core.config import settings
+from app.util.metrics import LatencyRecorder
+
+
+class RazorpayError(Exception):
+    """
+    Non-2xx response from the Razorpay API.
+    """
+
+    def __init__(self, status_code: int, message: str):
+        self.status_code = status_code
+        self.message = message
+        super().__init__(f"[{status_code}] {message}")
+
+
+class AsyncRazorpayClient:
+    """
+    Native asyncio Razorpay client (httpx, pooled keep-alive connections).
+
+    - Basic auth with RAZORPAY_KEY_ID / RAZORPAY_KEY_SECRET
+    - At most RAZORPAY_MAX_CONCURRENCY calls in flight; the rest wait
+      for a slot instead of opening more connections
+    - Only the operations we use: orders create, payments fetch / refund
+    - RAZORPAY_API_URL can point at bench/fake_razorpay.py for offline runs
 
-class RazorpayClient:
-    _client = None
+    Lazy singleton; closed from the FastAPI lifespan.
+    """
 
+    _http: Optional[httpx.AsyncClient] = None
+    _slots: Optional[asyncio.Semaphore] = None
+    _latency = LatencyRecorder()
+    _in_flight = 0
+    _errors = 0
+
+    # ---------------------------------------------------------
+    # HTTP CLIENT
+    # ---------------------------------------------------------
     @classmethod
-    def get_client(cls):
-        if cls._client is None:
-            cls._client = razorpay.Client(
-                auth=(settings.RAZORPAY_KEY_ID, settings.RAZORPAY_KEY_SECRET)
+    def _get_http(cls) -> httpx.AsyncClient:
+        if cls._http is None:
+            cls._http = httpx.AsyncClient(
+                base_url=settings.RAZORPAY_API_URL,
+                auth=(settings.RAZORPAY_KEY_ID, settings.RAZORPAY_KEY_SECRET),
+                timeout=settings.RAZORPAY_HTTP_TIMEOUT_SECONDS,
+                limits=httpx.Limits(
+                    max_connections=settings.RAZORPAY_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.RAZORPAY_HTTP_MAX_CONNECTIONS,
+                ),
             )
-        return cls._client
+            cls._slots = asyncio.Semaphore(settings.RAZORPAY_MAX_CONCURRENCY)
+        return cls._http
+
+    @classmethod
+    async def close(cls):
+        if cls._http is not None:
+            await cls._http.aclose()
+            cls._http = None
+            cls._slots = None
+
+    # ---------------------------------------------------------
+    # REQUEST
+    # ---------------------------------------------------------
+    @classmethod
+    async def _request(cls, method: str, path: str, **kwargs) -> dict:
+        http = cls._get_http()
+
+        async with cls._slots:
+            cls._in_flight += 1
+            started = time.perf_counter()
+            try:
+                response = await http.request(method, path, **kwargs)
+            except httpx.HTTPError:
+                cls._errors += 1
+                raise
+            finally:
+                cls._in_flight -= 1
+                cls._latency.record(time.perf_counter() - started)
+
+        if response.status_code >= 400:
+            cls._errors += 1
+            raise RazorpayError(response.status_code, response.text)
+
+        return response.json()
+
+    # ---------------------------------------------------------
+    # OPERATIONS
+    # ---------------------------------------------------------
+    @classmethod
+    async def create_order(
+        cls,
+        amount: int,
+        currency: str = "INR",
+        receipt: Optional[str] = None,
+        notes: Optional[dict] = None,
+    ) -> dict:
+        """
+        amount in the smallest currency unit (paise)
+        """
+        body = {"amount": amount, "currency": currency}
+        if receipt:
+            body["receipt"] = receipt
+        if notes:
+            body["notes"] = notes
+
+        return await cls._request("POST", "/orders", json=body)
+
+    @classmethod
+    async def fetch_payment(cls, payment_id: str) -> dict:
+        return await cls._request("GET", f"/payments/{quote(payment_id, safe='')}")
+
+    @classmethod
+    async def refund_payment(
+        cls,
+        payment_id: str,
+        amount: Optional[int] = None,
+        speed: str = "normal",
+        notes: Optional[dict] = None,
+    ) -> dict:
+        """
+        Full refund unless `amount` (paise) is given.
+        """
+        body = {"speed": speed}
+        if amount is not None:
+            body["amount"] = amount
+        if notes:
+            body["notes"] = notes
+
+        return await cls._request("POST", f"/payments/{quote(payment_id, safe='')}/refund", json=body)
+
+    # ---------------------------------------------------------
+    # METRICS
+    # ---------------------------------------------------------
+    @classmethod
+    def metrics(cls) -> dict:
+        return {
+            "in_flight": cls._in_flight,
+            "errors": cls._errors,
+            "latency": cls._latency.snapshot(),
+        }
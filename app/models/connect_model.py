@@ -1,5 +1,6 @@
-from beanie import Document
-from pydantic import EmailStr, Field
+from beanie import Document, PydanticObjectId
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pydantic import BaseModel, EmailStr, Field
 from datetime import datetime
 
 
@@ -12,4 +13,22 @@ class Connect(Document):
     updated_at: datetime = Field(default_factory=datetime.now)
 
     class Settings:
-        name = "connect" # MongoDB collection name
\ No newline at end of file
+        name = "connect" # MongoDB collection name
+        indexes = [
+            # admin listing: latest first + keyset cursor
+            IndexModel([("created_at", DESCENDING), ("_id", DESCENDING)], name="created_at_id_desc"),
+            IndexModel([("email", ASCENDING)], name="email"),
+        ]
+
+
+class ConnectListView(BaseModel):
+    """
+    Lean projection for the admin listing (no updated_at).
+    email is a plain str: it was validated on insert.
+    """
+    id: PydanticObjectId = Field(alias="_id")
+    name: str
+    email: str
+    purpose: str
+    message: str
+    created_at: datetime
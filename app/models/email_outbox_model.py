@@ -0,0 +1,43 @@
+from datetime import datetime
+from typing import Optional
+from beanie import Document
+from pydantic import Field
+from pymongo import ASCENDING, IndexModel
+
+from app.core.config import settings
+
+
+class EmailOutboxEntry(Document):
+    # --- Message ---
+    to_email: str
+    subject: str
+    html_body: str
+    attachment_bytes: Optional[bytes] = None
+    attachment_name: Optional[str] = None
+
+    # --- Delivery state ---
+    status: str = "pending"  # pending / sending / sent / failed
+    attempts: int = 0
+    next_attempt_at: datetime = Field(default_factory=datetime.now)
+    last_error: Optional[str] = None
+
+    # --- Claim (drainer lease) ---
+    claim_token: Optional[str] = None
+    lease_until: Optional[datetime] = None
+
+    # --- Metadata ---
+    sent_at: Optional[datetime] = None
+    created_at: datetime = Field(default_factory=datetime.now)
+    updated_at: datetime = Field(default_factory=datetime.now)
+
+    class Settings:
+        name = "email_outbox"
+        indexes = [
+            IndexModel([("status", ASCENDING), ("next_attempt_at", ASCENDING)]),
+            IndexModel([("claim_token", ASCENDING)]),
+            # Delivered rows are purged automatically
+            IndexModel(
+                [("sent_at", ASCENDING)],
+                expireAfterSeconds=settings.EMAIL_OUTBOX_RETENTION_DAYS * 24 * 3600,
+            ),
+        ]
@@ -0,0 +1,34 @@
+from datetime import datetime
+from typing import Optional
+from beanie import Document
+from pydantic import Field
+from pymongo import ASCENDING, IndexModel
+
+
+class IdempotencyRecord(Document):
+    """
+    First response of an idempotent request, replayed to its retries
+    (see IdempotencyService).
+
+    - key: Idempotency-Key header, or a natural key (razorpay_payment_id)
+    - fingerprint: hash of the request body; same key + other body → 422
+    - in_progress: `owner` holds the lease; duplicates wait for it
+    """
+    scope: str  # "payment.create_order" / "mentorship.book"
+    key: str
+    fingerprint: str
+
+    status: str = "in_progress"  # in_progress / done
+    owner: Optional[str] = None
+    lease_until: Optional[datetime] = None  # naive UTC
+    response: Optional[dict] = None
+
+    created_at: datetime = Field(default_factory=datetime.now)
+    expires_at: datetime  # naive UTC, TTL
+
+    class Settings:
+        name = "idempotency_records"
+        indexes = [
+            IndexModel([("scope", ASCENDING), ("key", ASCENDING)], name="scope_key_unique", unique=True),
+            IndexModel([("expires_at", ASCENDING)], name="expires_at_ttl", expireAfterSeconds=0),
+        ]
@@ -1,7 +1,8 @@
 from datetime import datetime, date
-from typing import Optional
-from beanie import Document, Indexed
+from typing import List, Optional
+from beanie import Document, Indexed, PydanticObjectId
 from pydantic import BaseModel, EmailStr, Field
+from pymongo import ASCENDING, DESCENDING, IndexModel
 
 class PaymentDetails(BaseModel):
     method: str
@@ -21,6 +22,24 @@ class CalendarEventDetails(BaseModel):
     end_datetime: Optional[datetime]
     created_at: datetime = Field(default_factory=datetime.now)
 
+class BookingProcessing(BaseModel):
+    """
+    Background booking saga state (see MentorshipBookingService).
+    """
+    completed_steps: List[str] = Field(default_factory=list)
+    compensated_steps: List[str] = Field(default_factory=list)
+    attempts: int = 0
+    next_attempt_at: datetime = Field(default_factory=datetime.now)
+    last_error: Optional[str] = None
+    failure_reason: Optional[str] = None  # why the booking was compensated
+
+    # --- Claim (worker lease) ---
+    claim_token: Optional[str] = None
+    lease_until: Optional[datetime] = None
+
+    finished_at: Optional[datetime] = None
+
+
 class Mentorship(Document):
     # --- User Info ---
     full_name: str
@@ -45,13 +64,33 @@ class Mentorship(Document):
     calendar_event: Optional[CalendarEventDetails]
 
     # --- Status & Metadata ---
-    status: str = "pending"
+    status: str = "pending"  # processing / scheduled / compensating / failed (+ admin statuses)
+    processing: Optional[BookingProcessing] = None
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
     notes: Optional[str] = None
 
     class Settings:
         name = "mentorships"
+        indexes = [
+            # admin listing: latest first + keyset cursor
+            IndexModel([("created_at", DESCENDING), ("_id", DESCENDING)], name="created_at_id_desc"),
+            IndexModel([("email", ASCENDING)], name="email"),
+            # bookings of a day (optionally by status)
+            IndexModel([("selected_date", ASCENDING), ("status", ASCENDING)], name="selected_date_status"),
+            # booking saga: due bookings
+            IndexModel(
+                [("status", ASCENDING), ("processing.next_attempt_at", ASCENDING)],
+                name="status_next_attempt",
+            ),
+            # one booking per Razorpay payment (non-Razorpay bookings have no id)
+            IndexModel(
+                [("payment.razorpay_payment_id", ASCENDING)],
+                name="payment_razorpay_payment_id_unique",
+                unique=True,
+                partialFilterExpression={"payment.razorpay_payment_id": {"$type": "string"}},
+            ),
+        ]
 
     model_config = {
         "json_schema_extra": {
@@ -88,3 +127,66 @@ class Mentorship(Document):
             }
         }
     }
+
+
+# ==================================================
+# Admin listing projection (safe + lean fields only)
+# ==================================================
+
+class MentorshipPaymentView(BaseModel):
+    method: Optional[str] = None
+    amount: Optional[float] = None
+    verified: Optional[bool] = None
+
+
+class MentorshipCalendarView(BaseModel):
+    meet_link: Optional[str] = None
+    start_datetime: Optional[datetime] = None
+    end_datetime: Optional[datetime] = None
+
+
+class MentorshipListView(BaseModel):
+    """
+    No payment ids / signatures and no raw calendar links travel over the wire.
+    email is a plain str: it was validated on insert.
+    """
+    id: PydanticObjectId = Field(alias="_id")
+    full_name: str
+    email: str
+    contact: str
+    plan_name: str
+    price: float
+    duration_minutes: int
+    selected_date: date
+    selected_start_time: str
+    timezone: str = "Asia/Kolkata"
+    topic: Optional[str] = None
+    status: str
+    payment: Optional[MentorshipPaymentView] = None
+    calendar_event: Optional[MentorshipCalendarView] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Settings:
+        projection = {
+            "_id": 1,
+            "full_name": 1,
+            "email": 1,
+            "contact": 1,
+            "plan_name": 1,
+            "price": 1,
+            "duration_minutes": 1,
+            "selected_date": 1,
+            "selected_start_time": 1,
+            "timezone": 1,
+            "topic": 1,
+            "status": 1,
+            "payment.method": 1,
+            "payment.amount": 1,
+            "payment.verified": 1,
+            "calendar_event.meet_link": 1,
+            "calendar_event.start_datetime": 1,
+            "calendar_event.end_datetime": 1,
+            "created_at": 1,
+            "updated_at": 1,
+        }
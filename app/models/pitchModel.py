@@ -1,9 +1,38 @@
-from beanie import Document
-from pydantic import EmailStr, Field
-from typing import Optional
+from beanie import Document, PydanticObjectId
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
+from pydantic import BaseModel, EmailStr, Field
+from typing import List, Optional
 from datetime import datetime
 
 
+class PendingUpload(BaseModel):
+    """
+    Proposal bytes waiting for the background upload (unset once stored).
+    Size is capped by MAX_UPLOAD_SIZE_MB, well under the 16 MB BSON limit.
+    """
+    data: bytes
+    sha256: str
+    size_bytes: int
+    filename: Optional[str] = None
+
+
+class PitchProcessing(BaseModel):
+    """
+    Background pipeline state (see PitchPipelineService).
+    """
+    completed_steps: List[str] = Field(default_factory=list)
+    attempts: int = 0
+    next_attempt_at: datetime = Field(default_factory=datetime.now)
+    last_error: Optional[str] = None
+    upload_expired: bool = False  # pending bytes dropped before the upload ran
+
+    # --- Claim (worker lease) ---
+    claim_token: Optional[str] = None
+    lease_until: Optional[datetime] = None
+
+    finished_at: Optional[datetime] = None
+
+
 class Pitch(Document):
     name: str
     company_name: str
@@ -13,9 +42,63 @@ class Pitch(Document):
     contact_number: str
     pitch_summary: Optional[str] = None
     proposal_file_url: Optional[str] = None
+    proposal_public_id: Optional[str] = None  # Cloudinary asset (direct upload)
+
+    # --- Background pipeline ---
+    status: str = "ready"  # processing / ready / failed
+    processing: Optional[PitchProcessing] = None
+    pending_upload: Optional[PendingUpload] = None
 
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
 
     class Settings:
         name = "pitch"  # MongoDB collection name
+        indexes = [
+            # admin listing: latest first + keyset cursor
+            IndexModel([("created_at", DESCENDING), ("_id", DESCENDING)], name="created_at_id_desc"),
+            IndexModel([("email", ASCENDING)], name="email"),
+            # one pitch per uploaded proposal (legacy pitches have none)
+            IndexModel(
+                [("proposal_public_id", ASCENDING)],
+                name="proposal_public_id_unique",
+                unique=True,
+                partialFilterExpression={"proposal_public_id": {"$type": "string"}},
+            ),
+            # background pipeline: due pitches + processing / failed backlog
+            IndexModel(
+                [("status", ASCENDING), ("processing.next_attempt_at", ASCENDING)],
+                name="status_next_attempt",
+            ),
+            # search: sector filter (+ created_at range) in listing order
+            IndexModel(
+                [("sector", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+                name="sector_created_at_id_desc",
+            ),
+            # search: relevance-ranked keywords (company name weighs most)
+            IndexModel(
+                [("company_name", TEXT), ("sector", TEXT), ("pitch_summary", TEXT)],
+                name="pitch_text",
+                weights={"company_name": 10, "sector": 5, "pitch_summary": 1},
+                default_language="english",
+            ),
+        ]
+
+
+class PitchListView(BaseModel):
+    """
+    Lean projection for the admin listing.
+    email is a plain str: it was validated on insert.
+    """
+    id: PydanticObjectId = Field(alias="_id")
+    name: str
+    company_name: str
+    sector: str
+    investment_required: str
+    email: str
+    contact_number: str
+    pitch_summary: Optional[str] = None
+    proposal_file_url: Optional[str] = None
+
+    created_at: datetime
+    updated_at: datetime
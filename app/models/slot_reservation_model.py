@@ -0,0 +1,31 @@
+from datetime import datetime
+from beanie import Document, PydanticObjectId
+from pydantic import Field
+from pymongo import ASCENDING, IndexModel
+
+
+class SlotReservation(Document):
+    """
+    One reserved granule (SLOT_RESERVATION_GRANULE_MINUTES) of a calendar.
+
+    A booking holds every granule its [start, end) covers; the unique
+    (calendar, start) index makes two overlapping bookings collide on
+    their first shared granule, whatever their start / duration.
+
+    - Hold (booking processing) → expires after SLOT_HOLD_TTL_SECONDS
+    - Confirmed (event created) → expires when the session ends
+    - Expired holds are reaped by the TTL index
+    """
+    calendar: str
+    start: datetime  # UTC granule start
+    booking_id: PydanticObjectId
+    expires_at: datetime  # UTC
+    created_at: datetime = Field(default_factory=datetime.now)
+
+    class Settings:
+        name = "slot_reservations"
+        indexes = [
+            IndexModel([("calendar", ASCENDING), ("start", ASCENDING)], name="calendar_start_unique", unique=True),
+            IndexModel([("booking_id", ASCENDING)], name="booking_id"),
+            IndexModel([("expires_at", ASCENDING)], name="expires_at_ttl", expireAfterSeconds=0),
+        ]
@@ -0,0 +1,33 @@
+from datetime import datetime
+from typing import Dict
+from beanie import Document
+from pydantic import Field
+from pymongo import ASCENDING, IndexModel
+
+
+class DailyStats(Document):
+    """
+    Pre-aggregated admin dashboard bucket, one per calendar day of created_at.
+    Maintained with $inc as submissions arrive; rebuilt by StatsService.rebuild().
+    """
+    day: str  # "YYYY-MM-DD" (sorts / range-queries as a string)
+
+    # --- Submissions ---
+    pitches: int = 0
+    connects: int = 0
+    mentorships: int = 0
+
+    # --- Revenue (verified payments only) ---
+    paid_mentorships: int = 0
+    mentorship_revenue: float = 0.0
+
+    # --- Breakdown ---
+    pitches_by_sector: Dict[str, int] = Field(default_factory=dict)
+
+    updated_at: datetime = Field(default_factory=datetime.now)
+
+    class Settings:
+        name = "daily_stats"
+        indexes = [
+            IndexModel([("day", ASCENDING)], name="day_unique", unique=True),
+        ]
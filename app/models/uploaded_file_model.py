@@ -0,0 +1,32 @@
+from datetime import datetime
+from typing import Optional
+from beanie import Document
+from pydantic import Field
+from pymongo import ASCENDING, IndexModel
+
+
+class UploadedFile(Document):
+    """
+    Content-hash index of files already stored on Cloudinary.
+    A re-submitted file (same bytes, same folder) reuses the stored URL.
+    """
+    sha256: str
+    folder: str
+    size_bytes: int
+
+    # --- Cloudinary asset ---
+    public_id: str
+    url: str
+    resource_type: str
+    format: Optional[str] = None
+
+    # --- Reuse ---
+    reuse_count: int = 0
+    last_used_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime = Field(default_factory=datetime.now)
+
+    class Settings:
+        name = "uploaded_files"
+        indexes = [
+            IndexModel([("sha256", ASCENDING), ("folder", ASCENDING)], name="sha256_folder_unique", unique=True),
+        ]
@@ -1,6 +1,11 @@
+from datetime import date
 from typing import List, Optional
-from app.models.connect_model import Connect
+from app.models.connect_model import Connect, ConnectListView
 from app.schema.connectSchema import ConnectCreateRequestSchema
+from app.util.pagination import FINGERPRINT_PROJECTION, find_raw_page
+from beanie.odm.utils.projection import get_projection
+from app.util.export_stream import open_export_cursor
+from app.util.response_cache import ResponseCache
 
 
 class ConnectRepository:
@@ -13,17 +18,39 @@ class ConnectRepository:
         payload: ConnectCreateRequestSchema,
     ) -> Connect:
         connect = Connect(**payload.model_dump())
-        return await connect.insert()
+        connect = await connect.insert()
+        ResponseCache.invalidate("connect")
+        return connect
 
     @staticmethod
-    async def connect_get_all_repository(skip: int, limit: int):
-        return await (
-            Connect
-            .find_all()
-            .sort(-Connect.created_at)
-            .skip(skip)
-            .limit(limit)
-            .to_list()
+    async def connect_get_all_raw_repository(
+        skip: int, limit: int, cursor: Optional[str] = None
+    ) -> List[dict]:
+        """
+        Latest first, raw Mongo dicts (ConnectListView fields) for the fast JSON path.
+        """
+        return await find_raw_page(
+            Connect.get_pymongo_collection(), get_projection(ConnectListView), skip, limit, cursor
+        )
+
+    @staticmethod
+    async def connect_get_all_fingerprint(
+        skip: int, limit: int, cursor: Optional[str] = None
+    ) -> List[dict]:
+        """
+        (_id, updated_at) of the same window, for the listing ETag.
+        """
+        return await find_raw_page(
+            Connect.get_pymongo_collection(), FINGERPRINT_PROJECTION, skip, limit, cursor
+        )
+
+    @staticmethod
+    def connect_export_cursor(date_from: Optional[date] = None, date_to: Optional[date] = None):
+        """
+        Raw cursor (ConnectListView fields) for the streaming admin export.
+        """
+        return open_export_cursor(
+            Connect.get_pymongo_collection(), get_projection(ConnectListView), date_from, date_to
         )
 
     @staticmethod
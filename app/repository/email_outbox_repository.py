@@ -0,0 +1,134 @@
+import uuid
+from datetime import datetime, timedelta
+from typing import List
+from beanie.operators import In
+from app.models.email_outbox_model import EmailOutboxEntry
+
+
+class EmailOutboxRepository:
+    """
+    Data Access Layer for the durable email outbox.
+    """
+
+    # ---------------------------
+    # ENQUEUE (BULK)
+    # ---------------------------
+    @staticmethod
+    async def enqueue_many(entries: List[EmailOutboxEntry]) -> None:
+        """
+        Insert all messages of a request in one round trip.
+        """
+        if entries:
+            await EmailOutboxEntry.insert_many(entries)
+
+    # ---------------------------
+    # CLAIM A BATCH
+    # ---------------------------
+    @staticmethod
+    def _claimable(now: datetime) -> dict:
+        return {
+            "$or": [
+                {"status": "pending", "next_attempt_at": {"$lte": now}},
+                # crashed / stuck drainer → lease expired
+                {"status": "sending", "lease_until": {"$lt": now}},
+            ]
+        }
+
+    @staticmethod
+    async def claim_batch(limit: int, lease_seconds: int) -> List[EmailOutboxEntry]:
+        """
+        Atomically claim up to `limit` due messages.
+
+        Candidates are stamped with a fresh claim token by a single
+        update_many that re-checks the claimable filter, so two drainers
+        can never own the same row.
+        """
+        now = datetime.now()
+        claimable = EmailOutboxRepository._claimable(now)
+
+        candidates = await (
+            EmailOutboxEntry.get_pymongo_collection()
+            .find(claimable, {"_id": 1})
+            .sort("next_attempt_at", 1)
+            .limit(limit)
+            .to_list(length=limit)
+        )
+        if not candidates:
+            return []
+
+        token = uuid.uuid4().hex
+        await EmailOutboxEntry.find(
+            {"_id": {"$in": [c["_id"] for c in candidates]}, **claimable}
+        ).update_many({
+            "$set": {
+                "status": "sending",
+                "claim_token": token,
+                "lease_until": now + timedelta(seconds=lease_seconds),
+                "updated_at": now,
+            }
+        })
+
+        return await EmailOutboxEntry.find(EmailOutboxEntry.claim_token == token).to_list()
+
+    # ---------------------------
+    # RESULT BOOKKEEPING
+    # (only while still holding the claim: a drainer whose lease expired
+    #  must not overwrite what the one that re-claimed the row recorded)
+    # ---------------------------
+    @staticmethod
+    async def mark_sent(entries: List[EmailOutboxEntry]) -> None:
+        if not entries:
+            return
+        now = datetime.now()
+        await EmailOutboxEntry.find(
+            In(EmailOutboxEntry.id, [entry.id for entry in entries]),
+            # one claim_batch → one token for the whole batch
+            In(EmailOutboxEntry.claim_token, list({entry.claim_token for entry in entries})),
+        ).update_many({
+            "$set": {"status": "sent", "sent_at": now, "lease_until": None, "updated_at": now},
+            "$inc": {"attempts": 1},
+        })
+
+    @staticmethod
+    async def mark_retry(
+        entry: EmailOutboxEntry, next_attempt_at: datetime, error: str
+    ) -> None:
+        await EmailOutboxEntry.find_one(
+            EmailOutboxEntry.id == entry.id,
+            EmailOutboxEntry.claim_token == entry.claim_token,
+        ).update({
+            "$set": {
+                "status": "pending",
+                "next_attempt_at": next_attempt_at,
+                "last_error": error,
+                "lease_until": None,
+                "updated_at": datetime.now(),
+            },
+            "$inc": {"attempts": 1},
+        })
+
+    @staticmethod
+    async def mark_failed(entry: EmailOutboxEntry, error: str) -> None:
+        await EmailOutboxEntry.find_one(
+            EmailOutboxEntry.id == entry.id,
+            EmailOutboxEntry.claim_token == entry.claim_token,
+        ).update({
+            "$set": {
+                "status": "failed",
+                "last_error": error,
+                "lease_until": None,
+                "updated_at": datetime.now(),
+            },
+            "$inc": {"attempts": 1},
+        })
+
+    # ---------------------------
+    # BACKLOG (METRICS)
+    # ---------------------------
+    @staticmethod
+    async def count_by_status() -> dict:
+        rows = await EmailOutboxEntry.aggregate([
+            {"$match": {"status": {"$in": ["pending", "sending", "failed"]}}},
+            {"$group": {"_id": "$status", "count": {"$sum": 1}}},
+        ]).to_list()
+        return {row["_id"]: row["count"] for row in rows}
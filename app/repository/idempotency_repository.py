@@ -0,0 +1,78 @@
+from datetime import datetime, timedelta
+from typing import Optional
+
+from pymongo.errors import DuplicateKeyError
+
+from app.models.idempotency_model import IdempotencyRecord
+
+
+class IdempotencyRepository:
+    """
+    Data Access Layer for `idempotency_records` (one indexed lookup per retry).
+    All datetimes are naive UTC (what the TTL monitor compares against).
+    """
+
+    @staticmethod
+    async def begin(
+        scope: str,
+        key: str,
+        fingerprint: str,
+        owner: str,
+        lease_seconds: int,
+        ttl_seconds: int,
+    ) -> Optional[dict]:
+        """
+        Claim the key. None → claimed by `owner`; otherwise the existing
+        record (or {} if it vanished in between: the caller retries).
+        """
+        now = datetime.utcnow()
+        collection = IdempotencyRecord.get_pymongo_collection()
+
+        try:
+            await collection.insert_one({
+                "scope": scope,
+                "key": key,
+                "fingerprint": fingerprint,
+                "status": "in_progress",
+                "owner": owner,
+                "lease_until": now + timedelta(seconds=lease_seconds),
+                "response": None,
+                "created_at": datetime.now(),
+                "expires_at": now + timedelta(seconds=ttl_seconds),
+            })
+            return None
+        except DuplicateKeyError:
+            return await collection.find_one({"scope": scope, "key": key}) or {}
+
+    @staticmethod
+    async def take_over(scope: str, key: str, owner: str, lease_seconds: int) -> bool:
+        """
+        The first request died mid-flight (lease expired) → run it again.
+        """
+        now = datetime.utcnow()
+        result = await IdempotencyRecord.get_pymongo_collection().update_one(
+            {
+                "scope": scope,
+                "key": key,
+                "status": "in_progress",
+                "lease_until": {"$lt": now},
+            },
+            {"$set": {"owner": owner, "lease_until": now + timedelta(seconds=lease_seconds)}},
+        )
+        return result.modified_count == 1
+
+    @staticmethod
+    async def complete(scope: str, key: str, owner: str, response: dict) -> None:
+        await IdempotencyRecord.get_pymongo_collection().update_one(
+            {"scope": scope, "key": key, "owner": owner},
+            {"$set": {"status": "done", "response": response, "lease_until": None}},
+        )
+
+    @staticmethod
+    async def abandon(scope: str, key: str, owner: str) -> None:
+        """
+        Failed requests are not replayed: free the key for the next attempt.
+        """
+        await IdempotencyRecord.get_pymongo_collection().delete_one(
+            {"scope": scope, "key": key, "owner": owner}
+        )
@@ -1,7 +1,19 @@
-from typing import List, Optional
-from datetime import date
-from beanie import PydanticObjectId
-from app.models.mentorship_model import Mentorship, PaymentDetails, CalendarEventDetails
+import uuid
+from typing import Dict, List, Optional
+from datetime import date, datetime, timedelta
+from beanie import PydanticObjectId, UpdateResponse
+from beanie.operators import In
+from pymongo import UpdateOne
+from app.models.mentorship_model import (
+    Mentorship,
+    MentorshipListView,
+    PaymentDetails,
+    CalendarEventDetails,
+)
+from app.util.pagination import FINGERPRINT_PROJECTION, find_raw_page
+from app.core.config import settings
+from app.util.export_stream import created_at_range, open_export_cursor
+from app.util.response_cache import ResponseCache
 
 
 class MentorshipRepository:
@@ -19,6 +31,7 @@ class MentorshipRepository:
         Save a new mentorship booking in MongoDB.
         """
         await mentorship.insert()
+        ResponseCache.invalidate("mentorships")
         return mentorship
     
     
@@ -26,20 +39,74 @@ class MentorshipRepository:
     # GET ALL (ADMIN DASHBOARD)
     # ---------------------------
     @staticmethod
-    async def get_all_mentorships(
+    async def get_all_mentorships_raw(
         skip: int = 0,
         limit: int = 50,
-    ) -> List[Mentorship]:
+        cursor: Optional[str] = None,
+    ) -> List[dict]:
         """
         Fetch all mentorship bookings for admin dashboard
         sorted by creation time (latest first).
+
+        Lean MentorshipListView fields (no signatures / raw calendar data) as
+        raw Mongo dicts for the fast JSON path. With a cursor → keyset page
+        on (created_at, _id), otherwise legacy skip/limit.
+        """
+        return await find_raw_page(
+            Mentorship.get_pymongo_collection(),
+            MentorshipListView.Settings.projection,
+            skip,
+            limit,
+            cursor,
+        )
+
+    @staticmethod
+    async def get_all_mentorships_fingerprint(
+        skip: int = 0,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> List[dict]:
+        """
+        (_id, updated_at) of the same window, for the listing ETag.
+        """
+        return await find_raw_page(
+            Mentorship.get_pymongo_collection(), FINGERPRINT_PROJECTION, skip, limit, cursor
+        )
+
+    @staticmethod
+    def export_mentorships_cursor(date_from: Optional[date] = None, date_to: Optional[date] = None):
+        """
+        Raw cursor (MentorshipListView fields) for the streaming admin export.
+        """
+        return open_export_cursor(
+            Mentorship.get_pymongo_collection(),
+            MentorshipListView.Settings.projection,
+            date_from,
+            date_to,
+        )
+
+    @staticmethod
+    def payment_signatures_cursor(date_from: Optional[date] = None, date_to: Optional[date] = None):
+        """
+        Raw cursor over the stored Razorpay ids + signatures of verified
+        bookings (reconciliation). Unsorted: served by the partial
+        `payment_razorpay_payment_id_unique` index, not the listing one.
         """
         return (
-            await Mentorship.find_all()
-            .sort("-created_at")
-            .skip(skip)
-            .limit(limit)
-            .to_list()
+            Mentorship.get_pymongo_collection()
+            .find(
+                {
+                    "payment.verified": True,
+                    "payment.razorpay_payment_id": {"$type": "string"},
+                    **created_at_range(date_from, date_to),
+                },
+                {
+                    "payment.razorpay_order_id": 1,
+                    "payment.razorpay_payment_id": 1,
+                    "payment.razorpay_signature": 1,
+                },
+            )
+            .batch_size(settings.EXPORT_BATCH_SIZE)
         )
 
     # ---------------------------
@@ -66,51 +133,112 @@ class MentorshipRepository:
     # ---------------------------
     # UPDATE STATUS / NOTES / PAYMENT / CALENDAR
     # ---------------------------
+    @staticmethod
+    async def _set_fields(
+        mentorship_id: str, fields: dict, return_document: bool = True
+    ) -> Optional[Mentorship] | bool:
+        """
+        Single round trip atomic `$set` (+ updated_at stamp).
+
+        return_document=True  → find_one_and_update, returns the NEW document (or None)
+        return_document=False → update_one, returns whether a document matched
+        """
+        result = await Mentorship.find_one(
+            Mentorship.id == PydanticObjectId(mentorship_id)
+        ).update(
+            {"$set": {**fields, "updated_at": datetime.now()}},
+            response_type=(
+                UpdateResponse.NEW_DOCUMENT if return_document else UpdateResponse.UPDATE_RESULT
+            ),
+        )
+        ResponseCache.invalidate("mentorships")
+
+        if return_document:
+            return result
+        return result.matched_count > 0
+
     @staticmethod
     async def update_status(
-        mentorship_id: str, status: str, notes: Optional[str] = None
-    ) -> Optional[Mentorship]:
-        mentorship = await Mentorship.get(PydanticObjectId(mentorship_id))
-        if mentorship:
-            mentorship.status = status
-            if notes:
-                mentorship.notes = notes
-            mentorship.updated_at = mentorship.updated_at  # will auto-update if using triggers
-            await mentorship.save()
-        return mentorship
+        mentorship_id: str,
+        status: str,
+        notes: Optional[str] = None,
+        return_document: bool = True,
+    ) -> Optional[Mentorship] | bool:
+        fields = {"status": status}
+        if notes:
+            fields["notes"] = notes
+        return await MentorshipRepository._set_fields(mentorship_id, fields, return_document)
 
     @staticmethod
     async def update_payment(
-        mentorship_id: str, payment: PaymentDetails
-    ) -> Optional[Mentorship]:
-        mentorship = await Mentorship.get(PydanticObjectId(mentorship_id))
-        if mentorship:
-            mentorship.payment = payment
-            mentorship.updated_at = mentorship.updated_at
-            await mentorship.save()
-        return mentorship
+        mentorship_id: str, payment: PaymentDetails, return_document: bool = True
+    ) -> Optional[Mentorship] | bool:
+        return await MentorshipRepository._set_fields(
+            mentorship_id, {"payment": payment}, return_document
+        )
 
     @staticmethod
     async def update_calendar_event(
-        mentorship_id: str, event: CalendarEventDetails
-    ) -> Optional[Mentorship]:
-        mentorship = await Mentorship.get(PydanticObjectId(mentorship_id))
-        if mentorship:
-            mentorship.calendar_event = event
-            mentorship.updated_at = mentorship.updated_at
-            await mentorship.save()
-        return mentorship
+        mentorship_id: str, event: CalendarEventDetails, return_document: bool = True
+    ) -> Optional[Mentorship] | bool:
+        return await MentorshipRepository._set_fields(
+            mentorship_id, {"calendar_event": event}, return_document
+        )
+
+    # ---------------------------
+    # BULK STATUS UPDATES
+    # ---------------------------
+    @staticmethod
+    async def update_status_many(
+        mentorship_ids: List[str], status: str, notes: Optional[str] = None
+    ) -> int:
+        """
+        Same status for many bookings → one update_many.
+        Returns the number of modified documents.
+        """
+        fields = {"status": status, "updated_at": datetime.now()}
+        if notes:
+            fields["notes"] = notes
+
+        result = await Mentorship.find(
+            In(Mentorship.id, [PydanticObjectId(i) for i in mentorship_ids])
+        ).update_many({"$set": fields})
+        ResponseCache.invalidate("mentorships")
+        return result.modified_count
+
+    @staticmethod
+    async def bulk_update_status(changes: Dict[str, str]) -> int:
+        """
+        Different status per booking ({id: status}) → one unordered bulk_write.
+        Returns the number of modified documents.
+        """
+        if not changes:
+            return 0
+
+        now = datetime.now()
+        result = await Mentorship.get_pymongo_collection().bulk_write(
+            [
+                UpdateOne(
+                    {"_id": PydanticObjectId(mentorship_id)},
+                    {"$set": {"status": status, "updated_at": now}},
+                )
+                for mentorship_id, status in changes.items()
+            ],
+            ordered=False,
+        )
+        ResponseCache.invalidate("mentorships")
+        return result.modified_count
 
     # ---------------------------
     # DELETE
     # ---------------------------
     @staticmethod
     async def delete_mentorship(mentorship_id: str) -> bool:
-        mentorship = await Mentorship.get(PydanticObjectId(mentorship_id))
-        if mentorship:
-            await mentorship.delete()
-            return True
-        return False
+        result = await Mentorship.find_one(
+            Mentorship.id == PydanticObjectId(mentorship_id)
+        ).delete()
+        ResponseCache.invalidate("mentorships")
+        return bool(result and result.deleted_count)
 
     # ---------------------------
     # FILTER BOOKINGS BY DATE
@@ -118,3 +246,173 @@ class MentorshipRepository:
     @staticmethod
     async def get_mentorships_by_date(selected_date: date) -> List[Mentorship]:
         return await Mentorship.find(Mentorship.selected_date == selected_date).to_list()
+
+
+    # ---------------------------
+    # BOOKING SAGA
+    # ---------------------------
+    @staticmethod
+    def _claimable(now: datetime) -> dict:
+        return {
+            "status": {"$in": ["processing", "compensating"]},  # `status_next_attempt` index
+            "processing.next_attempt_at": {"$lte": now},
+            "$or": [
+                {"processing.lease_until": None},
+                # crashed / stuck worker → lease expired
+                {"processing.lease_until": {"$lt": now}},
+            ],
+        }
+
+    @staticmethod
+    async def claim_booking_batch(limit: int, lease_seconds: int) -> List[Mentorship]:
+        """
+        Atomically claim up to `limit` due bookings (same claim-token scheme
+        as the pitch pipeline and the email outbox).
+        """
+        now = datetime.now()
+        claimable = MentorshipRepository._claimable(now)
+        collection = Mentorship.get_pymongo_collection()
+
+        candidates = await (
+            collection
+            .find(claimable, {"_id": 1})
+            .sort("processing.next_attempt_at", 1)
+            .limit(limit)
+            .to_list(length=limit)
+        )
+        if not candidates:
+            return []
+
+        token = uuid.uuid4().hex
+        ids = [c["_id"] for c in candidates]
+        await collection.update_many(
+            {"_id": {"$in": ids}, **claimable},
+            {"$set": {
+                "processing.claim_token": token,
+                "processing.lease_until": now + timedelta(seconds=lease_seconds),
+            }},
+        )
+
+        # re-read by _id (primary key) → only the ones this call actually won
+        return await Mentorship.find({"_id": {"$in": ids}, "processing.claim_token": token}).to_list()
+
+    @staticmethod
+    async def complete_step(
+        mentorship_id: PydanticObjectId,
+        step: str,
+        fields: Optional[dict] = None,
+        compensation: bool = False,
+    ) -> None:
+        """
+        Record a finished saga step (or compensation) + its patch-back in one update.
+        """
+        steps = "processing.compensated_steps" if compensation else "processing.completed_steps"
+        await Mentorship.get_pymongo_collection().update_one(
+            {"_id": mentorship_id},
+            {
+                "$addToSet": {steps: step},
+                "$set": {**(fields or {}), "updated_at": datetime.now()},
+            },
+        )
+        ResponseCache.invalidate("mentorships")
+
+    @staticmethod
+    async def claim_step(mentorship_id: PydanticObjectId, step: str) -> bool:
+        """
+        Record a saga step only if it is not recorded yet → True for exactly
+        one caller (guards side effects that must not repeat, e.g. stats $inc).
+        """
+        result = await Mentorship.get_pymongo_collection().update_one(
+            {"_id": mentorship_id, "processing.completed_steps": {"$ne": step}},
+            {
+                "$addToSet": {"processing.completed_steps": step},
+                "$set": {"updated_at": datetime.now()},
+            },
+        )
+        ResponseCache.invalidate("mentorships")
+        return result.modified_count == 1
+
+    @staticmethod
+    async def mark_booking_done(mentorship_id: PydanticObjectId) -> None:
+        now = datetime.now()
+        await Mentorship.get_pymongo_collection().update_one(
+            {"_id": mentorship_id},
+            {
+                "$set": {
+                    "status": "scheduled",
+                    "processing.finished_at": now,
+                    "processing.lease_until": None,
+                    "updated_at": now,
+                },
+                "$inc": {"processing.attempts": 1},
+            },
+        )
+        ResponseCache.invalidate("mentorships")
+
+    @staticmethod
+    async def mark_booking_retry(
+        mentorship_id: PydanticObjectId, next_attempt_at: datetime, error: str
+    ) -> None:
+        await Mentorship.get_pymongo_collection().update_one(
+            {"_id": mentorship_id},
+            {
+                "$set": {
+                    "processing.next_attempt_at": next_attempt_at,
+                    "processing.last_error": error,
+                    "processing.lease_until": None,
+                },
+                "$inc": {"processing.attempts": 1},
+            },
+        )
+
+    @staticmethod
+    async def mark_booking_compensating(mentorship_id: PydanticObjectId, error: str) -> None:
+        """
+        The booking cannot go through: undo its completed steps
+        (the lease is kept, the same worker compensates right away).
+        """
+        await Mentorship.get_pymongo_collection().update_one(
+            {"_id": mentorship_id},
+            {"$set": {
+                "status": "compensating",
+                "processing.last_error": error,
+                "processing.failure_reason": error,
+                "updated_at": datetime.now(),
+            }},
+        )
+        ResponseCache.invalidate("mentorships")
+
+    @staticmethod
+    async def mark_booking_failed(mentorship_id: PydanticObjectId) -> None:
+        """
+        Compensation finished: the slot is released.
+        """
+        now = datetime.now()
+        await Mentorship.get_pymongo_collection().update_one(
+            {"_id": mentorship_id},
+            {
+                "$set": {
+                    "status": "failed",
+                    "processing.finished_at": now,
+                    "processing.lease_until": None,
+                    "updated_at": now,
+                },
+                "$inc": {"processing.attempts": 1},
+            },
+        )
+        ResponseCache.invalidate("mentorships")
+
+    @staticmethod
+    async def get_booking_status(mentorship_id: PydanticObjectId) -> Optional[dict]:
+        return await Mentorship.get_pymongo_collection().find_one(
+            {"_id": mentorship_id},
+            {"status": 1, "processing": 1, "calendar_event": 1},
+        )
+
+    @staticmethod
+    async def count_by_booking_status() -> dict:
+        rows = await Mentorship.aggregate([
+            {"$match": {"status": {"$in": ["processing", "compensating", "failed"]}}},
+            {"$group": {"_id": "$status", "count": {"$sum": 1}}},
+        ]).to_list()
+        return {row["_id"]: row["count"] for row in rows}
@@ -1,6 +1,15 @@
-from app.models.pitchModel import Pitch
+import uuid
+from datetime import date, datetime, timedelta
+from beanie import PydanticObjectId
+from app.models.pitchModel import Pitch, PitchListView
 from app.schema.pitchSchema import PitchCreateSchema
-from typing import List
+from typing import List, Optional
+from app.util.pagination import (
+    FINGERPRINT_PROJECTION, KEYSET_SORT, keyset_filter, score_keyset_filter, find_raw_page
+)
+from beanie.odm.utils.projection import get_projection
+from app.util.export_stream import created_at_range, open_export_cursor
+from app.util.response_cache import ResponseCache
 
 
 class PitchRepository:
@@ -11,18 +20,298 @@ class PitchRepository:
     @staticmethod
     async def create_pitch_repository(data: PitchCreateSchema):
         pitch = Pitch(**data.model_dump())
-        return await pitch.insert()
+        pitch = await pitch.insert()
+        ResponseCache.invalidate("pitch")
+        return pitch
 
     @staticmethod
-    async def get_all_pitch_repository(skip: int, limit: int) -> List[Pitch]:
-        return (
-            await Pitch.find_all()
-            .sort(-Pitch.created_at)   # latest first
-            .skip(skip)
-            .limit(limit)
-            .to_list()
+    async def get_all_pitch_raw_repository(
+        skip: int, limit: int, cursor: Optional[str] = None
+    ) -> List[dict]:
+        """
+        Latest first.  With a cursor → keyset page (constant cost at any depth),
+        otherwise legacy skip/limit.  Raw Mongo dicts (PitchListView fields)
+        for the fast JSON path.
+        """
+        return await find_raw_page(
+            Pitch.get_pymongo_collection(), get_projection(PitchListView), skip, limit, cursor
+        )
+
+    @staticmethod
+    async def get_all_pitch_fingerprint(
+        skip: int, limit: int, cursor: Optional[str] = None
+    ) -> List[dict]:
+        """
+        (_id, updated_at) of the same window, for the listing ETag.
+        """
+        return await find_raw_page(
+            Pitch.get_pymongo_collection(), FINGERPRINT_PROJECTION, skip, limit, cursor
+        )
+
+    @staticmethod
+    async def search_pitch_raw_repository(
+        q: Optional[str] = None,
+        sector: Optional[str] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> List[dict]:
+        """
+        Raw Mongo dicts (PitchListView fields) matching the filters.
+
+        - q      → `pitch_text` index, ranked by text score (hits carry `score`)
+        - no q   → sector / created_at filters, latest first
+                   (`sector_created_at_id_desc` or `created_at_id_desc`)
+        """
+        query_filter = created_at_range(date_from, date_to)
+        if sector:
+            query_filter["sector"] = sector
+
+        projection = get_projection(PitchListView)
+        collection = Pitch.get_pymongo_collection()
+
+        if not q:
+            if cursor:
+                query_filter = {"$and": [query_filter, keyset_filter(cursor)]}
+            return await (
+                collection.find(query_filter, projection)
+                .sort(KEYSET_SORT)
+                .limit(limit)
+                .to_list(length=limit)
+            )
+
+        # $text must be in the first $match stage
+        pipeline = [
+            {"$match": {"$text": {"$search": q}, **query_filter}},
+            {"$addFields": {"score": {"$meta": "textScore"}}},
+        ]
+        if cursor:
+            pipeline.append({"$match": score_keyset_filter(cursor)})
+        pipeline += [
+            {"$sort": {"score": -1, "_id": -1}},
+            {"$limit": limit},
+            {"$project": {**projection, "score": 1}},
+        ]
+        return await Pitch.aggregate(pipeline).to_list()
+
+    @staticmethod
+    def export_pitch_cursor(date_from: Optional[date] = None, date_to: Optional[date] = None):
+        """
+        Raw cursor (PitchListView fields) for the streaming admin export.
+        """
+        return open_export_cursor(
+            Pitch.get_pymongo_collection(), get_projection(PitchListView), date_from, date_to
         )
 
     @staticmethod
     async def get_by_email_repository(email: str) -> Pitch | None:
         return await Pitch.find_one(Pitch.email == email)
+
+    # ---------------------------
+    # BACKGROUND PIPELINE
+    # ---------------------------
+    @staticmethod
+    def _claimable(now: datetime) -> dict:
+        return {
+            "status": "processing",  # `status_next_attempt` index
+            "processing.next_attempt_at": {"$lte": now},
+            "$or": [
+                {"processing.lease_until": None},
+                # crashed / stuck worker → lease expired
+                {"processing.lease_until": {"$lt": now}},
+            ],
+        }
+
+    @staticmethod
+    async def claim_processing_batch(limit: int, lease_seconds: int) -> List[Pitch]:
+        """
+        Atomically claim up to `limit` due pitches (same scheme as the email
+        outbox: candidates are stamped with a fresh claim token by one
+        update_many that re-checks the claimable filter).
+        """
+        now = datetime.now()
+        claimable = PitchRepository._claimable(now)
+        collection = Pitch.get_pymongo_collection()
+
+        candidates = await (
+            collection
+            .find(claimable, {"_id": 1})
+            .sort("processing.next_attempt_at", 1)
+            .limit(limit)
+            .to_list(length=limit)
+        )
+        if not candidates:
+            return []
+
+        token = uuid.uuid4().hex
+        ids = [c["_id"] for c in candidates]
+        await collection.update_many(
+            {"_id": {"$in": ids}, **claimable},
+            {"$set": {
+                "processing.claim_token": token,
+                "processing.lease_until": now + timedelta(seconds=lease_seconds),
+            }},
+        )
+
+        # re-read by _id (primary key) → only the ones this call actually won
+        return await Pitch.find({"_id": {"$in": ids}, "processing.claim_token": token}).to_list()
+
+    @staticmethod
+    async def complete_step(
+        pitch_id: PydanticObjectId,
+        step: str,
+        fields: Optional[dict] = None,
+        unset: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Record a finished pipeline step (+ its patch-back) in one update.
+        """
+        update = {
+            "$addToSet": {"processing.completed_steps": step},
+            "$set": {**(fields or {}), "updated_at": datetime.now()},
+        }
+        if unset:
+            update["$unset"] = {field: "" for field in unset}
+
+        await Pitch.get_pymongo_collection().update_one({"_id": pitch_id}, update)
+        ResponseCache.invalidate("pitch")
+
+    @staticmethod
+    async def claim_step(pitch_id: PydanticObjectId, step: str) -> bool:
+        """
+        Record a pipeline step only if it is not recorded yet → True for
+        exactly one caller (guards side effects that must not repeat).
+        """
+        result = await Pitch.get_pymongo_collection().update_one(
+            {"_id": pitch_id, "processing.completed_steps": {"$ne": step}},
+            {
+                "$addToSet": {"processing.completed_steps": step},
+                "$set": {"updated_at": datetime.now()},
+            },
+        )
+        ResponseCache.invalidate("pitch")
+        return result.modified_count == 1
+
+    @staticmethod
+    async def mark_processing_done(pitch_id: PydanticObjectId) -> None:
+        now = datetime.now()
+        await Pitch.get_pymongo_collection().update_one(
+            {"_id": pitch_id},
+            {
+                "$set": {
+                    "status": "ready",
+                    "processing.finished_at": now,
+                    "processing.lease_until": None,
+                    "updated_at": now,
+                },
+                "$inc": {"processing.attempts": 1},
+                "$unset": {"pending_upload": ""},
+            },
+        )
+        ResponseCache.invalidate("pitch")
+
+    @staticmethod
+    async def mark_processing_retry(
+        pitch_id: PydanticObjectId, next_attempt_at: datetime, error: str
+    ) -> None:
+        await Pitch.get_pymongo_collection().update_one(
+            {"_id": pitch_id},
+            {
+                "$set": {
+                    "processing.next_attempt_at": next_attempt_at,
+                    "processing.last_error": error,
+                    "processing.lease_until": None,
+                },
+                "$inc": {"processing.attempts": 1},
+            },
+        )
+
+    @staticmethod
+    async def mark_processing_failed(pitch_id: PydanticObjectId, error: str) -> None:
+        """
+        Gave up: the pending file is kept so an admin can re-queue the pitch
+        (requeue_failed) until drop_stale_pending_uploads discards it.
+        """
+        now = datetime.now()
+        await Pitch.get_pymongo_collection().update_one(
+            {"_id": pitch_id},
+            {
+                "$set": {
+                    "status": "failed",
+                    "processing.last_error": error,
+                    "processing.finished_at": now,
+                    "processing.lease_until": None,
+                    "updated_at": now,
+                },
+                "$inc": {"processing.attempts": 1},
+            },
+        )
+        ResponseCache.invalidate("pitch")
+
+    @staticmethod
+    async def requeue_failed(pitch_id: PydanticObjectId) -> bool:
+        """
+        failed → processing, due now with a fresh attempt budget.
+        False if the pitch does not exist, is not failed, or its proposal
+        bytes were dropped before they were uploaded.
+        """
+        now = datetime.now()
+        result = await Pitch.get_pymongo_collection().update_one(
+            {
+                "_id": pitch_id,
+                "status": "failed",
+                "$or": [
+                    {"processing.completed_steps": "upload"},
+                    {"pending_upload": {"$ne": None}},
+                    {"proposal_file_url": {"$ne": None}},
+                ],
+            },
+            {"$set": {
+                "status": "processing",
+                "processing.attempts": 0,
+                "processing.next_attempt_at": now,
+                "processing.finished_at": None,
+                "processing.lease_until": None,
+                "updated_at": now,
+            }},
+        )
+        ResponseCache.invalidate("pitch")
+        return result.modified_count == 1
+
+    @staticmethod
+    async def drop_stale_pending_uploads(failed_before: datetime) -> int:
+        """
+        Free the proposal bytes of pitches that failed before `failed_before`
+        and were never re-queued. Returns the number of pitches cleaned.
+        """
+        result = await Pitch.get_pymongo_collection().update_many(
+            {
+                "status": "failed",  # `status_next_attempt` index
+                "processing.finished_at": {"$lt": failed_before},
+                "pending_upload": {"$ne": None},
+            },
+            {
+                "$unset": {"pending_upload": ""},
+                "$set": {"processing.upload_expired": True},
+            },
+        )
+        return result.modified_count
+
+    @staticmethod
+    async def get_processing_status(pitch_id: PydanticObjectId) -> Optional[dict]:
+        """
+        Status fields only (never the pending file bytes).
+        """
+        return await Pitch.get_pymongo_collection().find_one(
+            {"_id": pitch_id},
+            {"status": 1, "processing": 1, "proposal_file_url": 1},
+        )
+
+    @staticmethod
+    async def count_by_processing_status() -> dict:
+        rows = await Pitch.aggregate([
+            {"$match": {"status": {"$in": ["processing", "failed"]}}},
+            {"$group": {"_id": "$status", "count": {"$sum": 1}}},
+        ]).to_list()
+        return {row["_id"]: row["count"] for row in rows}
@@ -0,0 +1,95 @@
+from datetime import datetime
+from typing import List
+
+from beanie import PydanticObjectId
+from pymongo.errors import BulkWriteError
+
+from app.models.slot_reservation_model import SlotReservation
+
+DUPLICATE_KEY = 11000
+
+
+class SlotReservationRepository:
+    """
+    Data Access Layer for the `slot_reservations` ledger.
+    All datetimes are naive UTC (what the TTL monitor compares against).
+    """
+
+    @staticmethod
+    async def claim(
+        calendar: str,
+        starts: List[datetime],
+        booking_id: PydanticObjectId,
+        expires_at: datetime,
+    ) -> bool:
+        """
+        Hold every granule in one unordered insert_many.
+
+        Any granule already held → the unique index rejects it, the granules
+        this call did insert are removed again and the claim fails. Holds
+        that expired but were not reaped yet (the TTL monitor runs once a
+        minute) are deleted and the claim retried once.
+        """
+        collection = SlotReservation.get_pymongo_collection()
+        now = datetime.utcnow()
+        docs = [
+            {
+                "calendar": calendar,
+                "start": start,
+                "booking_id": booking_id,
+                "expires_at": expires_at,
+                "created_at": now,
+            }
+            for start in starts
+        ]
+
+        for attempt in range(2):
+            try:
+                await collection.insert_many([dict(doc) for doc in docs], ordered=False)
+                return True
+            except BulkWriteError as e:
+                errors = e.details.get("writeErrors", [])
+                if any(error.get("code") != DUPLICATE_KEY for error in errors):
+                    raise
+
+            await collection.delete_many({"booking_id": booking_id})
+            if attempt:
+                return False
+
+            taken = [error["op"]["start"] for error in errors]
+            reaped = await collection.delete_many({
+                "calendar": calendar,
+                "start": {"$in": taken},
+                "expires_at": {"$lte": now},
+            })
+            if reaped.deleted_count < len(taken):
+                return False
+
+        return False
+
+    @staticmethod
+    async def extend(booking_id: PydanticObjectId, expires_at: datetime) -> None:
+        await SlotReservation.get_pymongo_collection().update_many(
+            {"booking_id": booking_id},
+            {"$set": {"expires_at": expires_at}},
+        )
+
+    @staticmethod
+    async def release(booking_id: PydanticObjectId) -> None:
+        await SlotReservation.get_pymongo_collection().delete_many({"booking_id": booking_id})
+
+    @staticmethod
+    async def held_between(calendar: str, start: datetime, end: datetime) -> List[datetime]:
+        """
+        Starts of the live granules in [start, end) (`calendar_start_unique` index).
+        """
+        docs = await SlotReservation.get_pymongo_collection().find(
+            {
+                "calendar": calendar,
+                "start": {"$gte": start, "$lt": end},
+                "expires_at": {"$gt": datetime.utcnow()},
+            },
+            {"_id": 0, "start": 1},
+        ).to_list(length=None)
+
+        return [doc["start"] for doc in docs]
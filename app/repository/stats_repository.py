@@ -0,0 +1,72 @@
+from datetime import datetime
+from typing import Dict, List, Type
+from beanie import Document
+from pymongo import ReplaceOne
+from app.models.stats_model import DailyStats
+
+
+class StatsRepository:
+    """
+    Data Access Layer for the pre-aggregated `daily_stats` buckets.
+    """
+
+    # ---------------------------
+    # INCREMENTAL UPDATE
+    # ---------------------------
+    @staticmethod
+    async def increment(day: str, inc: Dict[str, float]) -> None:
+        """
+        Atomic $inc on the day's bucket (created on first use).
+        Equality upsert on the unique `day` index → no duplicate buckets.
+        """
+        await DailyStats.get_pymongo_collection().update_one(
+            {"day": day},
+            {"$inc": inc, "$set": {"updated_at": datetime.now()}},
+            upsert=True,
+        )
+
+    # ---------------------------
+    # READ
+    # ---------------------------
+    @staticmethod
+    async def get_range(day_from: str, day_to: str) -> List[dict]:
+        """
+        Raw buckets in [day_from, day_to], oldest first.
+        """
+        return await (
+            DailyStats.get_pymongo_collection()
+            .find({"day": {"$gte": day_from, "$lte": day_to}}, {"_id": 0, "updated_at": 0})
+            .sort("day", 1)
+            .to_list(length=None)
+        )
+
+    # ---------------------------
+    # REBUILD
+    # ---------------------------
+    @staticmethod
+    async def aggregate(model: Type[Document], pipeline: List[dict]) -> List[dict]:
+        """
+        Run a grouping pipeline over a source collection (pitches / connects / ...).
+        """
+        return await model.aggregate(pipeline).to_list()
+
+    @staticmethod
+    async def replace_all(buckets: Dict[str, dict]) -> int:
+        """
+        Overwrite every bucket with recomputed values and drop days that
+        no longer have any data. Returns the number of buckets written.
+        """
+        collection = DailyStats.get_pymongo_collection()
+        now = datetime.now()
+
+        if buckets:
+            await collection.bulk_write(
+                [
+                    ReplaceOne({"day": day}, {**values, "day": day, "updated_at": now}, upsert=True)
+                    for day, values in buckets.items()
+                ],
+                ordered=False,
+            )
+        await collection.delete_many({"day": {"$nin": list(buckets)}})
+
+        return len(buckets)
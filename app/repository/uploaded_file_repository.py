@@ -0,0 +1,43 @@
+from datetime import datetime
+from typing import Optional
+from pymongo import ReturnDocument
+from app.models.uploaded_file_model import UploadedFile
+
+
+class UploadedFileRepository:
+    """
+    Data Access Layer for the `uploaded_files` content-hash index.
+    """
+
+    @staticmethod
+    async def claim_existing(sha256: str, folder: str) -> Optional[dict]:
+        """
+        Known file → bump its reuse counter and return it (one round trip).
+        """
+        return await UploadedFile.get_pymongo_collection().find_one_and_update(
+            {"sha256": sha256, "folder": folder},
+            {"$inc": {"reuse_count": 1}, "$set": {"last_used_at": datetime.now()}},
+            return_document=ReturnDocument.AFTER,
+        )
+
+    @staticmethod
+    async def record(sha256: str, folder: str, size_bytes: int, asset: dict) -> None:
+        """
+        Idempotent insert: two concurrent uploads of the same bytes land on
+        the same Cloudinary public_id, so the first record wins.
+        """
+        now = datetime.now()
+        await UploadedFile.get_pymongo_collection().update_one(
+            {"sha256": sha256, "folder": folder},
+            {"$setOnInsert": {
+                "size_bytes": size_bytes,
+                "public_id": asset["public_id"],
+                "url": asset["url"],
+                "resource_type": asset["resource_type"],
+                "format": asset.get("format"),
+                "reuse_count": 0,
+                "last_used_at": now,
+                "created_at": now,
+            }},
+            upsert=True,
+        )
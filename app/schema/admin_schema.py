@@ -1,6 +1,17 @@
-
+from enum import Enum
 from pydantic import BaseModel
 
 class AdminLoginRequest(BaseModel):
     username: str
     password: str  # 👈 plain password
+
+
+class ExportCollection(str, Enum):
+    pitches = "pitches"
+    connects = "connects"
+    mentorships = "mentorships"
+
+
+class ExportFormat(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, EmailStr, Field
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
 class ConnectCreateRequestSchema(BaseModel):
     name: str = Field(..., min_length=2, max_length=100)
@@ -29,4 +29,5 @@ class ConnectFetchResponseSchema(BaseModel):
     count: int
     skip: int
     data: List[ConnectFormEntry]
+    next_cursor: Optional[str] = None  # pass as ?cursor= for the next page
 
@@ -1,7 +1,9 @@
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, model_validator
 from datetime import date, datetime
 from typing import Optional, List
 
+from app.core.config import settings
+
 
 # ==================================================
 # Mentorship Booking (Create)
@@ -20,7 +22,9 @@ class MentorshipCreateSchema(BaseModel):
     # -------------------------------
     plan_name: str = Field(..., example="Premium Mentorship")
     price: float = Field(..., example=1999.0)
-    duration_minutes: int = Field(..., example=60)
+    duration_minutes: int = Field(
+        ..., gt=0, le=settings.MENTORSHIP_MAX_DURATION_MINUTES, example=60
+    )
 
     # -------------------------------
     # Session details
@@ -46,10 +50,23 @@ class MentorshipCreateSchema(BaseModel):
 class MentorshipResponseSchema(BaseModel):
     success: bool = True
     message: str = "Mentorship booked successfully"
+    booking_id: Optional[str] = Field(None, example="65a8f1c9e9b4e71c4f9a1234")
     event_link: Optional[str] = Field(
         None, example="https://meet.google.com/xyz-abc-def"
     )
-    status: str = Field(..., example="confirmed")
+    status: str = Field(..., example="processing")
+
+
+class MentorshipBookingStatusSchema(BaseModel):
+    id: str
+    status: str  # processing / scheduled / compensating / failed
+    completed_steps: List[str] = []
+    compensated_steps: List[str] = []
+    attempts: int = 0
+    last_error: Optional[str] = None
+    failure_reason: Optional[str] = None
+    event_link: Optional[str] = None
+    finished_at: Optional[datetime] = None
 
 
 # ==================================================
@@ -111,6 +128,7 @@ class MentorshipListResponseSchema(BaseModel):
     count: int
     skip: int
     data: List[MentorshipGetSchema]
+    next_cursor: Optional[str] = None  # pass as ?cursor= for the next page
 
 
 # ==================================================
@@ -119,7 +137,11 @@ class MentorshipListResponseSchema(BaseModel):
 
 class AvailabilityRequest(BaseModel):
     meeting_date: date = Field(..., example="2026-01-25")
-    duration_minutes: int = Field(..., example=60)
+    duration_minutes: int = Field(..., gt=0, example=60)
+    step_minutes: Optional[int] = Field(
+        None, ge=5, le=240, example=15,
+        description="Spacing between slot starts (defaults to the meeting duration)"
+    )
 
 
 class TimeSlot(BaseModel):
@@ -130,3 +152,35 @@ class TimeSlot(BaseModel):
 class AvailabilityResponse(BaseModel):
     success: bool = True
     slots: List[TimeSlot]
+
+
+class AvailabilityRangeRequest(BaseModel):
+    meeting_date_from: date = Field(..., example="2026-01-25")
+    meeting_date_to: date = Field(..., example="2026-01-31")
+    duration_minutes: int = Field(..., gt=0, example=60)
+    step_minutes: Optional[int] = Field(
+        None, ge=5, le=240, example=15,
+        description="Spacing between slot starts (defaults to the meeting duration)"
+    )
+
+    @model_validator(mode="after")
+    def check_window(self):
+        if self.meeting_date_to < self.meeting_date_from:
+            raise ValueError("meeting_date_to must be on or after meeting_date_from")
+
+        days = (self.meeting_date_to - self.meeting_date_from).days + 1
+        if days > settings.AVAILABILITY_MAX_RANGE_DAYS:
+            raise ValueError(
+                f"Date range cannot exceed {settings.AVAILABILITY_MAX_RANGE_DAYS} days"
+            )
+        return self
+
+
+class DayAvailability(BaseModel):
+    meeting_date: date = Field(..., example="2026-01-25")
+    slots: List[TimeSlot]
+
+
+class AvailabilityRangeResponse(BaseModel):
+    success: bool = True
+    days: List[DayAvailability]
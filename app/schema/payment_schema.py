@@ -1,5 +1,7 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
+
+from app.core.config import settings
 
 
 
@@ -29,4 +31,26 @@ class PaymentVerificationResponseSchema(BaseModel):
     payment_id: Optional[str] = Field(
         None,
         description="Razorpay payment id"
-    )
\ No newline at end of file
+    )
+
+
+class PaymentSignatureItemSchema(BaseModel):
+    razorpay_order_id: Optional[str] = None
+    razorpay_payment_id: Optional[str] = None
+    razorpay_signature: Optional[str] = None
+
+
+class PaymentBatchVerificationRequestSchema(BaseModel):
+    items: List[PaymentSignatureItemSchema] = Field(
+        ...,
+        max_length=settings.PAYMENT_VERIFY_BATCH_MAX,
+        description="Stored PaymentDetails (order id, payment id, signature) to re-check"
+    )
+
+
+class PaymentBatchVerificationResponseSchema(BaseModel):
+    success: bool = True
+    count: int
+    valid: int
+    invalid: int
+    results: List[bool] = Field(..., description="One result per item, same order")
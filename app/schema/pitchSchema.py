@@ -14,10 +14,36 @@ class PitchCreateSchema(BaseModel):
     proposal_file_url: Optional[str] = None
 
 
+class ProposalUploadSignatureSchema(BaseModel):
+    """
+    Fields to POST (multipart) to `upload_url` together with the file.
+    """
+    upload_url: str
+    api_key: str
+    cloud_name: str
+    resource_type: str
+    public_id: str
+    timestamp: int
+    allowed_formats: str  # comma-separated, signed
+    signature: str
+    expires_at: int  # unix seconds; pitch creation rejects uploads made later
+
+
 class PitchCreateResponseSchema(BaseModel):
     id: str
     created_at: datetime
     has_file: bool
+    status: str = "processing"  # poll GET /{id}/status until "ready"
+
+
+class PitchStatusSchema(BaseModel):
+    id: str
+    status: str  # processing / ready / failed
+    completed_steps: List[str] = []
+    attempts: int = 0
+    last_error: Optional[str] = None
+    proposal_file_url: Optional[str] = None
+    finished_at: Optional[datetime] = None
 
 
 class PitchGetSchema(BaseModel):
@@ -41,4 +67,16 @@ class PitchListResponseSchema(BaseModel):
     limit: int          # page size requested
     count: int          # records returned in this response
     skip: int
-    data: List[PitchGetSchema]
\ No newline at end of file
+    data: List[PitchGetSchema]
+    next_cursor: Optional[str] = None  # pass as ?cursor= for the next page
+
+class PitchSearchHitSchema(PitchGetSchema):
+    score: Optional[float] = None  # text relevance, only when `q` is given
+
+
+class PitchSearchResponseSchema(BaseModel):
+    success: bool = True
+    limit: int
+    count: int
+    data: List[PitchSearchHitSchema]
+    next_cursor: Optional[str] = None  # pass as ?cursor= (with the same filters) for the next page
@@ -1,12 +1,14 @@
+import asyncio
 from datetime import datetime, timedelta
-from typing import List
+from typing import Dict, List, Optional
 import uuid
 from app.util.helper import sanitize_text
-from googleapiclient.errors import HttpError
 
 from app.core.config import settings
-from app.util.google_credential_manager import GoogleCredentials
+from app.util.google_calendar_client import AsyncGoogleCalendarClient, GoogleCalendarError
 from app.util.date_utils import get_day_range
+from app.util.lru_cache import TTLLRUCache
+from app.util.slot_engine import merge_busy_intervals, overlaps
 
 
 class CalenderService:
@@ -15,32 +17,70 @@ class CalenderService:
     ONLY external API calls
     """
 
+    # In-process free/busy cache: (calendar_id, "YYYY-MM-DD") → busy list
+    _busy_cache = TTLLRUCache(
+        max_entries=settings.FREEBUSY_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.FREEBUSY_CACHE_TTL_SECONDS,
+    )
+    _inflight: Dict[tuple, asyncio.Future] = {}
+    # bumped by invalidate_busy_slots: a Google answer that started before a
+    # booking is returned to its caller but never written back to the cache
+    _generation: Dict[tuple, int] = {}
+
     # ---------------------------------------------------------
     # FETCH BUSY SLOTS
     # ---------------------------------------------------------
     @staticmethod
-    def fetch_busy_slots(date: str) -> List[dict]:
+    async def _query_busy(start_dt: datetime, end_dt: datetime) -> List[dict]:
+        """
+        Single Google free/busy round trip for [start_dt, end_dt]
+        """
+        response = await AsyncGoogleCalendarClient.freebusy(
+            time_min=start_dt.isoformat(),
+            time_max=end_dt.isoformat(),
+            calendar_ids=[settings.GOOGLE_CALENDAR_ID],
+        )
+
+        return response["calendars"][settings.GOOGLE_CALENDAR_ID]["busy"]
+
+    @staticmethod
+    async def fetch_busy_slots(date: str, force_refresh: bool = False) -> List[dict]:
         """
         Fetch raw busy slots for a given date
+
+        Served from the free/busy cache unless expired or force_refresh=True
+        (internal: the booking path re-checks against Google).
+        Concurrent misses for the same date share one Google call.
+        Failed or invalidated-while-running lookups are never cached.
         """
+        cache_key = (settings.GOOGLE_CALENDAR_ID, date)
+
+        if not force_refresh:
+            cached = CalenderService._busy_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
-            service = GoogleCredentials.get_calendar_service()
+            inflight = CalenderService._inflight.get(cache_key)
+            if inflight is not None and not force_refresh:
+                return await asyncio.shield(inflight)
 
             start_dt, end_dt = get_day_range(date)
+            generation = CalenderService._generation.get(cache_key, 0)
 
-            response = service.freebusy().query(
-                body={
-                    "timeMin": start_dt.isoformat(),
-                    "timeMax": end_dt.isoformat(),
-                    "items": [
-                        {"id": settings.GOOGLE_CALENDAR_ID}
-                    ],
-                }
-            ).execute()
+            query = asyncio.ensure_future(CalenderService._query_busy(start_dt, end_dt))
+            CalenderService._inflight[cache_key] = query
+            try:
+                busy_slots = await asyncio.shield(query)
+            finally:
+                if CalenderService._inflight.get(cache_key) is query:
+                    del CalenderService._inflight[cache_key]
 
-            return response["calendars"][settings.GOOGLE_CALENDAR_ID]["busy"]
+            if CalenderService._generation.get(cache_key, 0) == generation:
+                CalenderService._busy_cache.set(cache_key, busy_slots)
+            return busy_slots
 
-        except HttpError as e:
+        except GoogleCalendarError as e:
             print("Google Calendar API Error:", e)
             return []
 
@@ -48,6 +88,102 @@ class CalenderService:
             print("Unexpected error while fetching busy slots:", e)
             return []
 
+    @staticmethod
+    async def fetch_busy_slots_range(
+        date_from: str, date_to: str, force_refresh: bool = False
+    ) -> Dict[str, List[dict]]:
+        """
+        Busy slots for every date in [date_from, date_to] → {"YYYY-MM-DD": busy}
+
+        - Fully cached window → no Google call
+        - Otherwise ONE free/busy query for the whole window, split per day
+          and written back to the per-day cache
+        """
+        range_start, _ = get_day_range(date_from)
+        _, range_end = get_day_range(date_to)
+
+        dates: List[str] = []
+        day = range_start.date()
+        while day <= range_end.date():
+            dates.append(day.strftime("%Y-%m-%d"))
+            day += timedelta(days=1)
+
+        if not force_refresh:
+            cached = {
+                d: CalenderService._busy_cache.get((settings.GOOGLE_CALENDAR_ID, d))
+                for d in dates
+            }
+            if all(busy is not None for busy in cached.values()):
+                return cached
+
+        generations = {
+            d: CalenderService._generation.get((settings.GOOGLE_CALENDAR_ID, d), 0)
+            for d in dates
+        }
+
+        try:
+            busy_slots = await CalenderService._query_busy(range_start, range_end)
+
+        except GoogleCalendarError as e:
+            print("Google Calendar API Error:", e)
+            return {d: [] for d in dates}
+
+        except Exception as e:
+            print("Unexpected error while fetching busy slots:", e)
+            return {d: [] for d in dates}
+
+        busy_by_day = CalenderService._split_busy_by_day(busy_slots, dates, range_start.tzinfo)
+        for d, busy in busy_by_day.items():
+            cache_key = (settings.GOOGLE_CALENDAR_ID, d)
+            if CalenderService._generation.get(cache_key, 0) == generations[d]:
+                CalenderService._busy_cache.set(cache_key, busy)
+
+        return busy_by_day
+
+    @staticmethod
+    def _split_busy_by_day(busy_slots: List[dict], dates: List[str], tz) -> Dict[str, List[dict]]:
+        """
+        Clip each busy interval to the days it touches
+        (an event crossing midnight lands on both days).
+        """
+        busy_by_day: Dict[str, List[dict]] = {d: [] for d in dates}
+
+        for busy in busy_slots:
+            busy_start = datetime.fromisoformat(busy["start"]).astimezone(tz)
+            busy_end = datetime.fromisoformat(busy["end"]).astimezone(tz)
+
+            day = busy_start.date()
+            while day <= busy_end.date():
+                key = day.strftime("%Y-%m-%d")
+                if key in busy_by_day:
+                    day_start, day_end = get_day_range(key)
+                    piece_start = max(busy_start, day_start)
+                    piece_end = min(busy_end, day_end)
+                    if piece_start < piece_end:
+                        busy_by_day[key].append({
+                            "start": piece_start.isoformat(),
+                            "end": piece_end.isoformat(),
+                        })
+                day += timedelta(days=1)
+
+        return busy_by_day
+
+    @staticmethod
+    def invalidate_busy_slots(date: str):
+        """
+        Drop the cached free/busy entry for a date (after a booking).
+        Lookups already running for it won't write back; new callers
+        don't join them.
+        """
+        cache_key = (settings.GOOGLE_CALENDAR_ID, date)
+        CalenderService._generation[cache_key] = CalenderService._generation.get(cache_key, 0) + 1
+        CalenderService._inflight.pop(cache_key, None)
+        CalenderService._busy_cache.invalidate(cache_key)
+
+    @staticmethod
+    def busy_cache_stats() -> dict:
+        return CalenderService._busy_cache.stats()
+
     # ---------------------------------------------------------
     # CHECK SLOT AVAILABILITY
     # ---------------------------------------------------------
@@ -60,32 +196,37 @@ class CalenderService:
         """
         Check if requested slot overlaps with busy slots
         """
-        for busy in busy_slots:
-            busy_start = datetime.fromisoformat(busy["start"])
-            busy_end = datetime.fromisoformat(busy["end"])
-
-            if start_datetime < busy_end and end_datetime > busy_start:
-                return False
-
-        return True
+        return not overlaps(
+            int(start_datetime.timestamp()),
+            int(end_datetime.timestamp()),
+            merge_busy_intervals(busy_slots),
+        )
 
     # ---------------------------------------------------------
     # BOOK MEETING WITH GOOGLE MEET
     # ---------------------------------------------------------
     @staticmethod
-    def book_meeting(
+    async def book_meeting(
         date: str,
         start_time: str,
         duration: int,
         title: str,
         description: str,
         attendees: List[str] | None = None,
+        event_id: Optional[str] = None,
     ) -> dict:
         """
         Create Google Calendar event with Google Meet link
+
+        With an `event_id` (see booking_event_id) the call is idempotent:
+        an event already created under that id by an earlier attempt is
+        returned as-is, without a second free/busy check or insert.
         """
         try:
-            service = GoogleCredentials.get_calendar_service()
+            if event_id:
+                existing = await CalenderService._get_event(event_id)
+                if existing is not None:
+                    return CalenderService._event_result(existing)
 
             # Day timezone reference
             start_dt, _ = get_day_range(date)
@@ -97,15 +238,16 @@ class CalenderService:
             end_datetime = start_datetime + timedelta(minutes=duration)
 
             # -------------------------------
-            # Busy slot validation
+            # Busy slot validation (always fresh, never cached data)
             # -------------------------------
-            busy_slots = CalenderService.fetch_busy_slots(date)
+            busy_slots = await CalenderService.fetch_busy_slots(date, force_refresh=True)
 
             if not CalenderService.is_slot_available(
                 start_datetime, end_datetime, busy_slots
             ):
                 return {
                     "status": "error",
+                    "code": "SLOT_BUSY",
                     "message": "Selected slot is already busy",
                 }
 
@@ -144,27 +286,38 @@ class CalenderService:
                     {"email": email} for email in attendees
                 ]
 
+            if event_id:
+                event["id"] = event_id
+
             # -------------------------------
             # Create event
             # -------------------------------
-            created_event = service.events().insert(
-                calendarId=settings.GOOGLE_CALENDAR_ID,
-                body=event,
-                conferenceDataVersion=1,  # 🔥 REQUIRED
-            ).execute()
+            try:
+                created_event = await AsyncGoogleCalendarClient.insert_event(
+                    calendar_id=settings.GOOGLE_CALENDAR_ID,
+                    body=event,
+                    conference_data_version=1,  # 🔥 REQUIRED
+                )
+            except GoogleCalendarError as e:
+                # 409 → an earlier attempt's insert went through after all
+                if not (event_id and e.status_code == 409):
+                    raise
+                created_event = await CalenderService._get_event(event_id)
+                if created_event is None:
+                    return {
+                        "status": "error",
+                        "code": "EVENT_CANCELLED",
+                        "message": "Event id was already used by a cancelled event",
+                    }
+
+            # 🔹 The day just changed → next availability check must refetch
+            CalenderService.invalidate_busy_slots(date)
 
             # print(created_event)
 
-            return {
-                "status": "success",
-                "event_id": created_event.get("id"),
-                # "meet_link": created_event.get("hangoutLink"),
-                "calendar_link": created_event.get("htmlLink"),
-                "start": created_event["start"]["dateTime"],
-                "end": created_event["end"]["dateTime"],
-            }
+            return CalenderService._event_result(created_event)
 
-        except HttpError as e:
+        except GoogleCalendarError as e:
             return {
                 "status": "error",
                 "message": f"Google API error: {e}",
@@ -175,3 +328,57 @@ class CalenderService:
         #         "status": "error",
         #         "message": str(e),
         #     }
+
+    @staticmethod
+    def _event_result(created_event: dict) -> dict:
+        return {
+            "status": "success",
+            "event_id": created_event.get("id"),
+            # "meet_link": created_event.get("hangoutLink"),
+            "calendar_link": created_event.get("htmlLink"),
+            "start": created_event["start"]["dateTime"],
+            "end": created_event["end"]["dateTime"],
+        }
+
+    @staticmethod
+    async def _get_event(event_id: str) -> Optional[dict]:
+        """
+        Live event by id; None if it does not exist or was cancelled.
+        """
+        try:
+            event = await AsyncGoogleCalendarClient.get_event(
+                calendar_id=settings.GOOGLE_CALENDAR_ID, event_id=event_id
+            )
+        except GoogleCalendarError as e:
+            if e.status_code in (404, 410):
+                return None
+            raise
+
+        return None if event.get("status") == "cancelled" else event
+
+    @staticmethod
+    def booking_event_id(booking_id: str) -> str:
+        """
+        Deterministic Google event id of a booking (base32hex: a-v, 0-9),
+        so a retried calendar step can never create a second event.
+        """
+        return f"mentorship{booking_id}"
+
+    # ---------------------------------------------------------
+    # CANCEL MEETING (booking compensation)
+    # ---------------------------------------------------------
+    @staticmethod
+    async def cancel_meeting(event_id: str, date: str) -> None:
+        """
+        Delete an event; already deleted counts as done.
+        Raises GoogleCalendarError on any other failure.
+        """
+        try:
+            await AsyncGoogleCalendarClient.delete_event(
+                calendar_id=settings.GOOGLE_CALENDAR_ID, event_id=event_id
+            )
+        except GoogleCalendarError as e:
+            if e.status_code not in (404, 410):
+                raise
+
+        CalenderService.invalidate_busy_slots(date)
@@ -1,7 +1,7 @@
-from datetime import datetime
-
 from app.schema.connectSchema import ConnectCreateRequestSchema
 from app.util.email_service import EmailService
+from app.services.email_outbox_service import EmailOutboxService
+from app.services.stats_service import StatsService
 from app.core.config import settings
 from app.repository.connect_repository import ConnectRepository
 
@@ -11,32 +11,31 @@ class ConnectService:
     @staticmethod
     async def connect_create_service(payload: ConnectCreateRequestSchema):
         """
-        Handles sending emails and saving Connect submission.
+        Saves Connect submission and queues the notification emails.
         """
 
-        timestamp = datetime.now()
-
-        # 1️⃣ Email to USER
-        EmailService.send_email(
-            to_email=payload.email,
-            subject="Thanks for connecting with us 🙌",
-            template_name="connect_user.html",
-            name=payload.name,
-            purpose=payload.purpose,
-        )
-
-        # 2️⃣ Email to ADMIN
-        EmailService.send_email(
-            to_email=settings.EMAIL_FROM,
-            subject="New Connect Request",
-            template_name="connect_admin.html",
-            **payload.model_dump(),
-        )
-
-        # 3️⃣ Save data to database
+        # 1️⃣ Save data to database
         connect = await ConnectRepository.connect_create_repository(payload)
+        await StatsService.record_connect(connect)
+
+        # 2️⃣ Queue emails (USER + ADMIN) → sent by the outbox drainer
+        await EmailOutboxService.queue(
+            EmailService.build_outbox_entry(
+                to_email=payload.email,
+                subject="Thanks for connecting with us 🙌",
+                template_name="connect_user.html",
+                name=payload.name,
+                purpose=payload.purpose,
+            ),
+            EmailService.build_outbox_entry(
+                to_email=settings.EMAIL_FROM,
+                subject="New Connect Request",
+                template_name="connect_admin.html",
+                **payload.model_dump(),
+            ),
+        )
 
-        # 4️⃣ Response
+        # 3️⃣ Response
         return {
             "id": str(connect.id),
             "created_at": connect.created_at,
@@ -0,0 +1,141 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Optional
+
+from app.core.config import settings
+from app.models.email_outbox_model import EmailOutboxEntry
+from app.repository.email_outbox_repository import EmailOutboxRepository
+from app.util.email_outbox import EmailOutbox
+from app.util.email_service import EmailService
+
+
+class EmailOutboxService:
+    """
+    Background drainer for the durable `email_outbox` collection.
+
+    - Claims due rows in batches (atomic lease, safe with many workers)
+    - Delivers them through the in-process EmailOutbox (pooled SMTP)
+    - Failed rows are retried with exponential backoff, then marked failed
+    - Rows left in `sending` by a crashed process are re-claimed after the lease
+    """
+
+    _task: Optional[asyncio.Task] = None
+    _wakeup: Optional[asyncio.Event] = None
+
+    @classmethod
+    async def start(cls):
+        """
+        Called ONCE during FastAPI startup (after EmailOutbox.start()).
+        """
+        if cls._task is not None:
+            return
+
+        cls._wakeup = asyncio.Event()
+        cls._task = asyncio.create_task(cls._run(), name="email-outbox-drainer")
+        print("✅ Email outbox drainer started")
+
+    @classmethod
+    async def stop(cls):
+        if cls._task is None:
+            return
+
+        cls._task.cancel()
+        await asyncio.gather(cls._task, return_exceptions=True)
+        cls._task = None
+        cls._wakeup = None
+        print("🛑 Email outbox drainer stopped")
+
+    # ---------------------------------------------------------
+    # ENQUEUE (REQUEST PATH)
+    # ---------------------------------------------------------
+    @classmethod
+    async def queue(cls, *entries: EmailOutboxEntry) -> None:
+        """
+        Persist messages (one bulk insert) and wake the drainer.
+        Never touches SMTP.
+        """
+        await EmailOutboxRepository.enqueue_many(list(entries))
+
+        if cls._wakeup is not None:
+            cls._wakeup.set()
+
+    # ---------------------------------------------------------
+    # DRAIN LOOP
+    # ---------------------------------------------------------
+    @classmethod
+    async def _run(cls):
+        while True:
+            try:
+                drained = await cls.drain_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[ERROR] - Email outbox drain failed: [{e}]")
+                drained = 0
+
+            # Full batch → more is probably waiting, go again right away
+            if drained >= settings.EMAIL_OUTBOX_BATCH_SIZE:
+                continue
+
+            try:
+                await asyncio.wait_for(
+                    cls._wakeup.wait(),
+                    timeout=settings.EMAIL_OUTBOX_POLL_SECONDS,
+                )
+            except asyncio.TimeoutError:
+                pass
+            cls._wakeup.clear()
+
+    @classmethod
+    async def drain_once(cls) -> int:
+        """
+        Claim one batch, deliver it and record the outcome.
+        Returns the number of rows claimed.
+        """
+        entries = await EmailOutboxRepository.claim_batch(
+            limit=settings.EMAIL_OUTBOX_BATCH_SIZE,
+            lease_seconds=settings.EMAIL_OUTBOX_LEASE_SECONDS,
+        )
+        if not entries:
+            return 0
+
+        results = await asyncio.gather(
+            *(cls._deliver(entry) for entry in entries),
+            return_exceptions=True,
+        )
+
+        sent = []
+        for entry, result in zip(entries, results):
+            if not isinstance(result, Exception):
+                sent.append(entry)
+                continue
+
+            attempts = entry.attempts + 1
+            if attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+                await EmailOutboxRepository.mark_failed(entry, str(result))
+                print(f"[ERROR] - Email {entry.id} to {entry.to_email} gave up after {attempts} attempts")
+            else:
+                await EmailOutboxRepository.mark_retry(
+                    entry,
+                    next_attempt_at=datetime.now() + cls._backoff(attempts),
+                    error=str(result),
+                )
+
+        await EmailOutboxRepository.mark_sent(sent)
+        return len(entries)
+
+    @staticmethod
+    async def _deliver(entry: EmailOutboxEntry):
+        msg = EmailService._build_message(
+            to_email=entry.to_email,
+            subject=entry.subject,
+            html_body=entry.html_body,
+            attachment_bytes=entry.attachment_bytes,
+            attachment_name=entry.attachment_name,
+        )
+        await EmailOutbox.enqueue(msg)
+
+    @staticmethod
+    def _backoff(attempts: int) -> timedelta:
+        delay = settings.EMAIL_OUTBOX_BACKOFF_BASE_SECONDS * (2 ** (attempts - 1))
+        return timedelta(seconds=min(delay, settings.EMAIL_OUTBOX_BACKOFF_MAX_SECONDS))
@@ -0,0 +1,116 @@
+import asyncio
+import hashlib
+import json
+import time
+import uuid
+from typing import Awaitable, Callable, Dict, Tuple
+
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.repository.idempotency_repository import IdempotencyRepository
+
+
+class IdempotencyService:
+    """
+    Run a request once per (scope, key) and replay its first response.
+
+    - Done before      → stored response, one indexed lookup, no side effects
+    - Running here     → await the same in-process future
+    - Running elsewhere → poll the record until it is done (or its lease
+                          expires and this request takes over)
+    - Same key, different body → 422
+    - Failed requests are not stored: the key is freed for the next retry
+    """
+
+    # (scope, key) → (fingerprint, future) of requests running in this process
+    _inflight: Dict[Tuple[str, str], Tuple[str, asyncio.Future]] = {}
+
+    @staticmethod
+    def fingerprint(payload: dict) -> str:
+        return hashlib.sha256(
+            json.dumps(payload, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    @staticmethod
+    def _mismatch() -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Idempotency key was already used for a different request"
+        )
+
+    @classmethod
+    async def run(
+        cls,
+        scope: str,
+        key: str,
+        fingerprint: str,
+        build: Callable[[], Awaitable[dict]],
+    ) -> dict:
+        """
+        `build` returns a JSON-ready dict (stored + replayed as-is).
+        """
+        local_key = (scope, key)
+
+        inflight = cls._inflight.get(local_key)
+        if inflight is not None:
+            inflight_fingerprint, future = inflight
+            if inflight_fingerprint != fingerprint:
+                raise cls._mismatch()
+            return await asyncio.shield(future)
+
+        owner = uuid.uuid4().hex
+        deadline = time.monotonic() + settings.IDEMPOTENCY_WAIT_SECONDS
+
+        while True:
+            existing = await IdempotencyRepository.begin(
+                scope,
+                key,
+                fingerprint,
+                owner,
+                lease_seconds=settings.IDEMPOTENCY_LEASE_SECONDS,
+                ttl_seconds=settings.IDEMPOTENCY_TTL_SECONDS,
+            )
+            if existing is None:
+                break
+
+            if existing:
+                if existing["fingerprint"] != fingerprint:
+                    raise cls._mismatch()
+                if existing["status"] == "done":
+                    return existing["response"]
+                if await IdempotencyRepository.take_over(
+                    scope, key, owner, settings.IDEMPOTENCY_LEASE_SECONDS
+                ):
+                    break
+
+            if time.monotonic() >= deadline:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="A request with this key is still being processed, retry later"
+                )
+            await asyncio.sleep(settings.IDEMPOTENCY_POLL_SECONDS)
+
+        future = asyncio.get_running_loop().create_future()
+        cls._inflight[local_key] = (fingerprint, future)
+        try:
+            response = await build()
+            await IdempotencyRepository.complete(scope, key, owner, response)
+        except BaseException as e:
+            try:
+                await IdempotencyRepository.abandon(scope, key, owner)
+            except Exception as abandon_error:
+                # the lease runs out instead and a retry takes over
+                print(f"[WARN] - Idempotency key {scope}:{key} not released: [{abandon_error}]")
+
+            if isinstance(e, Exception):
+                future.set_exception(e)
+                future.exception()  # retrieved: no "never retrieved" warning without waiters
+            else:
+                future.cancel()
+            raise
+        finally:
+            cls._inflight.pop(local_key, None)
+
+        future.set_result(response)
+        return response
@@ -0,0 +1,329 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Optional
+
+from app.core.config import settings
+from app.models.mentorship_model import CalendarEventDetails, Mentorship
+from app.repository.mentorship_repository import MentorshipRepository
+from app.services.calender_service import CalenderService
+from app.services.email_outbox_service import EmailOutboxService
+from app.services.slot_reservation_service import SlotReservationService
+from app.services.stats_service import StatsService
+from app.util.email_service import EmailService
+
+# Run in order; each one is recorded in processing.completed_steps and
+# skipped on retry
+STEPS = ("calendar", "notify", "stats")
+
+PLATFORM_NAME = "Rohit Mentorship"
+
+
+class BookingRejected(Exception):
+    """
+    The booking can never go through (e.g. the slot is busy on Google):
+    compensate right away instead of retrying.
+    """
+
+
+class MentorshipBookingService:
+    """
+    Background saga for bookings accepted by POST /mentorship/book
+    (status "processing", slot already held in the slot_reservations ledger).
+
+    - calendar: Google event under a deterministic id (idempotent on retry)
+    - notify:   user + admin confirmation emails queued on the durable outbox
+    - stats:    dashboard counters
+    - Transient failures are retried with exponential backoff
+    - Rejected / out of retries → status "compensating": the event is
+      deleted, failure emails are queued, the ledger hold is released,
+      then status "failed"
+    - Bookings left claimed by a crashed process are re-claimed after the lease
+
+    Started / stopped from the FastAPI lifespan.
+    """
+
+    _task: Optional[asyncio.Task] = None
+    _wakeup: Optional[asyncio.Event] = None
+
+    @classmethod
+    async def start(cls):
+        if cls._task is not None:
+            return
+
+        cls._wakeup = asyncio.Event()
+        cls._task = asyncio.create_task(cls._run(), name="mentorship-booking")
+        print("✅ Mentorship booking worker started")
+
+    @classmethod
+    async def stop(cls):
+        if cls._task is None:
+            return
+
+        cls._task.cancel()
+        await asyncio.gather(cls._task, return_exceptions=True)
+        cls._task = None
+        cls._wakeup = None
+        print("🛑 Mentorship booking worker stopped")
+
+    @classmethod
+    def wake(cls):
+        """
+        A booking was just stored: process it now instead of at the next poll.
+        """
+        if cls._wakeup is not None:
+            cls._wakeup.set()
+
+    # ---------------------------------------------------------
+    # LOOP
+    # ---------------------------------------------------------
+    @classmethod
+    async def _run(cls):
+        while True:
+            try:
+                processed = await cls.process_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[ERROR] - Mentorship booking worker failed: [{e}]")
+                processed = 0
+
+            # Full batch → more is probably waiting, go again right away
+            if processed >= settings.MENTORSHIP_BOOKING_BATCH_SIZE:
+                continue
+
+            try:
+                await asyncio.wait_for(
+                    cls._wakeup.wait(),
+                    timeout=settings.MENTORSHIP_BOOKING_POLL_SECONDS,
+                )
+            except asyncio.TimeoutError:
+                pass
+            cls._wakeup.clear()
+
+    @classmethod
+    async def process_once(cls) -> int:
+        """
+        Claim one batch and move each booking forward (or compensate it).
+        Returns the number of bookings claimed.
+        """
+        bookings = await MentorshipRepository.claim_booking_batch(
+            limit=settings.MENTORSHIP_BOOKING_BATCH_SIZE,
+            lease_seconds=settings.MENTORSHIP_BOOKING_LEASE_SECONDS,
+        )
+        if not bookings:
+            return 0
+
+        results = await asyncio.gather(
+            *(cls._handle(booking) for booking in bookings),
+            return_exceptions=True,
+        )
+
+        # Only bookkeeping writes end up here; the lease brings the booking back
+        for booking, result in zip(bookings, results):
+            if isinstance(result, Exception):
+                print(f"[ERROR] - Booking {booking.id} not recorded: [{result}]")
+
+        return len(bookings)
+
+    @classmethod
+    async def _handle(cls, booking: Mentorship):
+        if booking.status == "processing":
+            try:
+                await cls._process(booking)
+            except Exception as e:
+                attempts = booking.processing.attempts + 1
+                if not isinstance(e, BookingRejected) and attempts < settings.MENTORSHIP_BOOKING_MAX_ATTEMPTS:
+                    await MentorshipRepository.mark_booking_retry(
+                        booking.id,
+                        next_attempt_at=datetime.now() + cls._backoff(attempts),
+                        error=str(e),
+                    )
+                    return
+
+                print(f"[ERROR] - Booking {booking.id} failed, compensating: [{e}]")
+                booking.processing.failure_reason = str(e)
+                await MentorshipRepository.mark_booking_compensating(booking.id, str(e))
+            else:
+                await MentorshipRepository.mark_booking_done(booking.id)
+                return
+
+        # status "compensating" (just now, or resumed after a crash / failed undo)
+        try:
+            await cls._compensate(booking)
+        except Exception as e:
+            await MentorshipRepository.mark_booking_retry(
+                booking.id,
+                next_attempt_at=datetime.now() + cls._backoff(booking.processing.attempts + 1),
+                error=f"compensation: {e}",
+            )
+            return
+
+        await MentorshipRepository.mark_booking_failed(booking.id)
+
+    # ---------------------------------------------------------
+    # STEPS
+    # ---------------------------------------------------------
+    @staticmethod
+    async def _process(booking: Mentorship):
+        done = booking.processing.completed_steps
+
+        if "calendar" not in done:
+            result = await CalenderService.book_meeting(
+                date=booking.selected_date.strftime("%Y-%m-%d"),
+                start_time=booking.selected_start_time,
+                duration=booking.duration_minutes,
+                title=f"Mentorship: {booking.plan_name}",
+                description=booking.topic or "No topic specified",
+                event_id=CalenderService.booking_event_id(str(booking.id)),
+            )
+
+            if result.get("status") != "success":
+                if result.get("code") in ("SLOT_BUSY", "EVENT_CANCELLED"):
+                    raise BookingRejected(result["message"])
+                raise RuntimeError(result.get("message", "Failed to schedule mentorship session"))
+
+            booking.calendar_event = CalendarEventDetails(
+                event_id=result["event_id"],
+                calendar_link=result["calendar_link"],
+                meet_link=result.get("meet_link"),
+                start_datetime=result["start"],
+                end_datetime=result["end"],
+            )
+            # hold the slot in the ledger until the session is over
+            await SlotReservationService.confirm(
+                booking.id,
+                booking.selected_date,
+                booking.selected_start_time,
+                booking.duration_minutes,
+            )
+            await MentorshipRepository.complete_step(
+                booking.id,
+                "calendar",
+                fields={"calendar_event": booking.calendar_event.model_dump()},
+            )
+            done.append("calendar")
+
+        if "notify" not in done:
+            await MentorshipBookingService.queue_booking_emails(booking)
+            await MentorshipRepository.complete_step(booking.id, "notify")
+            done.append("notify")
+
+        if "stats" not in done:
+            # step recorded first, then $inc: a retry or a worker that took
+            # over the lease cannot count the booking twice (a crash in
+            # between under-counts instead, which rebuild() repairs)
+            if await MentorshipRepository.claim_step(booking.id, "stats"):
+                await StatsService.record_mentorship(booking)
+            done.append("stats")
+
+    @staticmethod
+    async def _compensate(booking: Mentorship):
+        """
+        Undo in reverse order; each undo is recorded in
+        processing.compensated_steps so a resumed compensation skips it.
+        (stats is the last step: a booking that got that far never fails.)
+        """
+        undone = booking.processing.compensated_steps
+
+        if "notify" not in undone:
+            # the failure notice supersedes a confirmation that may have gone out
+            await MentorshipBookingService.queue_booking_failed_emails(booking)
+            await MentorshipRepository.complete_step(booking.id, "notify", compensation=True)
+            undone.append("notify")
+
+        if "calendar" not in undone:
+            # even without a recorded "calendar" step: the insert may have
+            # landed at Google (timeout, or confirm / complete_step failed
+            # after it). The id is deterministic and a missing event is a no-op.
+            await CalenderService.cancel_meeting(
+                CalenderService.booking_event_id(str(booking.id)),
+                booking.selected_date.strftime("%Y-%m-%d"),
+            )
+            await MentorshipRepository.complete_step(
+                booking.id, "calendar", fields={"calendar_event": None}, compensation=True
+            )
+            undone.append("calendar")
+
+        # idempotent: free the slot for other bookings
+        await SlotReservationService.release(booking.id)
+
+    @staticmethod
+    def _backoff(attempts: int) -> timedelta:
+        delay = settings.MENTORSHIP_BOOKING_BACKOFF_BASE_SECONDS * (2 ** (attempts - 1))
+        return timedelta(seconds=min(delay, settings.MENTORSHIP_BOOKING_BACKOFF_MAX_SECONDS))
+
+    # ---------------------------------------------------------
+    # EMAILS
+    # ---------------------------------------------------------
+    @staticmethod
+    async def queue_booking_emails(booking: Mentorship) -> None:
+        """
+        Queue emails (USER confirmation + ADMIN booking details)
+        """
+        await EmailOutboxService.queue(
+            EmailService.build_outbox_entry(
+                to_email=booking.email,
+                subject="Mentorship Session Confirmed",
+                template_name="mentorship_requested_user.html",
+                full_name=booking.full_name,
+                plan_name=booking.plan_name,
+                session_date=booking.selected_date.strftime("%d %b %Y"),
+                session_time=booking.selected_start_time,
+                duration_minutes=booking.duration_minutes,
+                topic=booking.topic or "General Discussion",
+                platform_name=PLATFORM_NAME
+            ),
+            EmailService.build_outbox_entry(
+                to_email=settings.EMAIL_FROM,
+                subject="New Mentorship Session Booked",
+                template_name="mentorship_requested_admin.html",
+                user_name=booking.full_name,
+                user_email=booking.email,
+                contact=booking.contact,
+                plan_name=booking.plan_name,
+                price=booking.price,
+                session_date=booking.selected_date.strftime("%d %b %Y"),
+                session_time=booking.selected_start_time,
+                duration_minutes=booking.duration_minutes,
+                topic=booking.topic or "General Discussion",
+                payment_method=booking.payment_method,
+                platform_name=PLATFORM_NAME
+            ),
+        )
+
+    @staticmethod
+    async def queue_booking_failed_emails(booking: Mentorship) -> None:
+        """
+        Queue emails (USER "could not schedule" + ADMIN with refund details)
+        """
+        payment = booking.payment
+
+        await EmailOutboxService.queue(
+            EmailService.build_outbox_entry(
+                to_email=booking.email,
+                subject="Mentorship Session Could Not Be Scheduled",
+                template_name="mentorship_failed_user.html",
+                full_name=booking.full_name,
+                plan_name=booking.plan_name,
+                session_date=booking.selected_date.strftime("%d %b %Y"),
+                session_time=booking.selected_start_time,
+                platform_name=PLATFORM_NAME
+            ),
+            EmailService.build_outbox_entry(
+                to_email=settings.EMAIL_FROM,
+                subject="Mentorship Booking Failed",
+                template_name="mentorship_failed_admin.html",
+                user_name=booking.full_name,
+                user_email=booking.email,
+                contact=booking.contact,
+                plan_name=booking.plan_name,
+                price=booking.price,
+                session_date=booking.selected_date.strftime("%d %b %Y"),
+                session_time=booking.selected_start_time,
+                duration_minutes=booking.duration_minutes,
+                payment_method=booking.payment_method,
+                razorpay_payment_id=payment.razorpay_payment_id if payment else None,
+                payment_verified=bool(payment and payment.verified),
+                reason=booking.processing.failure_reason,
+            ),
+        )
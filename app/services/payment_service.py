@@ -1,7 +1,18 @@
-from fastapi import HTTPException
-from app.schema.payment_schema import PaymentVerificationRequestSchema, PaymentVerificationResponseSchema
-from app.core.razorpay_client import RazorpayClient
-from razorpay.errors import SignatureVerificationError
+import time
+from datetime import date
+from typing import Optional
+
+from app.core.config import settings
+from app.core.razorpay_client import AsyncRazorpayClient
+from app.repository.mentorship_repository import MentorshipRepository
+from app.schema.payment_schema import (
+    PaymentVerificationRequestSchema,
+    PaymentVerificationResponseSchema,
+    PaymentBatchVerificationRequestSchema,
+    PaymentBatchVerificationResponseSchema,
+)
+from app.util.export_stream import cursor_batches
+from app.util.payment_signature import PaymentSignatureVerifier
 
 class PaymentService:
 
@@ -10,14 +21,11 @@ class PaymentService:
         amount: float,
         currency: str
     ) -> dict:
-        client = RazorpayClient.get_client()
-
-        order_data = {
-            "amount": int(amount * 100),  # Razorpay expects paise
-            "currency": currency
-        }
-
-        razorpay_order = client.order.create(data=order_data)
+        # Native async call on the pooled client (no executor thread)
+        razorpay_order = await AsyncRazorpayClient.create_order(
+            amount=int(round(amount * 100)),  # Razorpay expects paise
+            currency=currency,
+        )
 
         return razorpay_order
     
@@ -26,34 +34,82 @@ class PaymentService:
         payload: PaymentVerificationRequestSchema
     ) -> PaymentVerificationResponseSchema:
 
-        try:
-            client = RazorpayClient.get_client()  # ✅ instance
-
-            client.utility.verify_payment_signature({
-                "razorpay_order_id": payload.razorpay_order_id,
-                "razorpay_payment_id": payload.razorpay_payment_id,
-                "razorpay_signature": payload.razorpay_signature,
-            })
-
-            # ✅ Signature valid → payment verified
-            return PaymentVerificationResponseSchema(
-                success=True,
-                message="Payment verified successfully",
-                order_id=payload.razorpay_order_id,
-                payment_id=payload.razorpay_payment_id,
-            )
-
-        except SignatureVerificationError:
+        # In-process HMAC check (precomputed keyed context, constant-time compare)
+        if not PaymentSignatureVerifier.default().verify(
+            payload.razorpay_order_id,
+            payload.razorpay_payment_id,
+            payload.razorpay_signature,
+        ):
             return PaymentVerificationResponseSchema(
                 success=False,
                 message="Invalid payment signature",
             )
 
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail={
-                    "code": "PAYMENT_VERIFICATION_FAILED",
-                    "message": str(e),
-                },
+        # ✅ Signature valid → payment verified
+        return PaymentVerificationResponseSchema(
+            success=True,
+            message="Payment verified successfully",
+            order_id=payload.razorpay_order_id,
+            payment_id=payload.razorpay_payment_id,
+        )
+
+    @staticmethod
+    def verify_payment_batch_service(
+        payload: PaymentBatchVerificationRequestSchema
+    ) -> PaymentBatchVerificationResponseSchema:
+        """
+        Re-check many stored signatures in one call (reconciliation).
+        """
+        results = PaymentSignatureVerifier.default().verify_many(
+            (item.razorpay_order_id, item.razorpay_payment_id, item.razorpay_signature)
+            for item in payload.items
+        )
+        valid = sum(results)
+
+        return PaymentBatchVerificationResponseSchema(
+            count=len(results),
+            valid=valid,
+            invalid=len(results) - valid,
+            results=results,
+        )
+
+    @staticmethod
+    async def reconcile_stored_payments(
+        date_from: Optional[date] = None, date_to: Optional[date] = None
+    ) -> dict:
+        """
+        Re-check the signature of every verified Razorpay booking in
+        [date_from, date_to], one verify_many per cursor batch.
+        """
+        started = time.perf_counter()
+        verifier = PaymentSignatureVerifier.default()
+        checked = valid = 0
+        invalid_ids = []
+
+        cursor = MentorshipRepository.payment_signatures_cursor(date_from, date_to)
+        async for batch in cursor_batches(cursor, settings.EXPORT_BATCH_SIZE):
+            # the cursor only returns verified bookings with a payment id
+            results = verifier.verify_many(
+                (
+                    doc["payment"].get("razorpay_order_id"),
+                    doc["payment"]["razorpay_payment_id"],
+                    doc["payment"].get("razorpay_signature"),
+                )
+                for doc in batch
             )
+
+            checked += len(results)
+            for doc, ok in zip(batch, results):
+                if ok:
+                    valid += 1
+                else:
+                    invalid_ids.append(str(doc["_id"]))
+
+        return {
+            "success": True,
+            "checked": checked,
+            "valid": valid,
+            "invalid": len(invalid_ids),
+            "invalid_ids": invalid_ids,
+            "took_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
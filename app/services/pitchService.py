@@ -3,9 +3,10 @@ from typing import Optional
 
 from app.schema.pitchSchema import PitchCreateSchema
 from app.util.email_service import EmailService
+from app.services.email_outbox_service import EmailOutboxService
 from app.core.config import settings
 from app.repository.pitchRepository import PitchRepository
-from app.models.pitchModel import Pitch
+from app.models.pitchModel import Pitch, PendingUpload, PitchProcessing
 
 
 class PitchService:
@@ -14,56 +15,69 @@ class PitchService:
     async def create_pitch_service(
         payload: PitchCreateSchema,
         proposal_file_url: Optional[str] = None,
+        proposal_public_id: Optional[str] = None,
+        pending_upload: Optional[dict] = None,
     ) -> dict:
         """
         Create pitch:
-        - Send emails (no attachment, only link)
-        - Store pitch in DB with proposal_file_url
+        - Store pitch in DB right away with status "processing"
+          (a file still to be uploaded travels along as pending_upload)
+        - Upload, URL patch-back and emails run in PitchPipelineService
         """
-        has_file=False
-        if proposal_file_url:
-            has_file = True
-        
-        timestamp = datetime.now().strftime("%d %b %Y, %I:%M %p")
+        has_file = bool(proposal_file_url or pending_upload)
 
-        # 1️⃣ Send email to USER (confirmation)
-        EmailService.send_email(
-            to_email=payload.email,
-            subject="Pitch Submitted Successfully 🚀",
-            template_name="pitch_submitted_user.html",
-            name=payload.name,
-            timestamp=timestamp,
-        )
-
-        # 2️⃣ Send email to ADMIN (with proposal link)
-        EmailService.send_email(
-            to_email=settings.EMAIL_FROM,
-            subject="New Pitch Received 🚀",
-            template_name="pitch_submitted_admin.html",
-            **payload.model_dump(exclude={"proposal_file_url"}),
-            proposal_file_url=proposal_file_url,  # 🔥 LINK ONLY
-            timestamp=timestamp,
-        )
-
-        # 3️⃣ Save pitch in database
-        pitch_data = payload.model_dump()
-        pitch_data["proposal_file_url"] = proposal_file_url
-
-        # 3️⃣ 🔥 Convert payload → MODEL-ALIGNED data
+        # 1️⃣ 🔥 Convert payload → MODEL-ALIGNED data
         pitch_model = Pitch(
             **payload.model_dump(exclude={"proposal_file_url"}),
             proposal_file_url=proposal_file_url,
+            proposal_public_id=proposal_public_id,
+            status="processing",
+            processing=PitchProcessing(),
+            pending_upload=PendingUpload(**pending_upload) if pending_upload else None,
             created_at=datetime.now(),
             updated_at=datetime.now(),
         )
 
-        # Repository should ONLY deal with DB ops
+        # 2️⃣ Single insert — the only work on the request path
         pitch = await PitchRepository.create_pitch_repository(pitch_model)
 
-        # 4️⃣ Return response
+        # 3️⃣ Return response
         return {
             "id": str(pitch.id),
             "email": pitch.email,
-            "has_file":has_file,
+            "has_file": has_file,
             "created_at": pitch.created_at,
+            "status": pitch.status,
         }
+
+    @staticmethod
+    async def queue_pitch_emails(pitch: Pitch) -> None:
+        """
+        Queue emails (USER confirmation + ADMIN with proposal link)
+        """
+        timestamp = pitch.created_at.strftime("%d %b %Y, %I:%M %p")
+
+        await EmailOutboxService.queue(
+            EmailService.build_outbox_entry(
+                to_email=pitch.email,
+                subject="Pitch Submitted Successfully 🚀",
+                template_name="pitch_submitted_user.html",
+                name=pitch.name,
+                timestamp=timestamp,
+            ),
+            EmailService.build_outbox_entry(
+                to_email=settings.EMAIL_FROM,
+                subject="New Pitch Received 🚀",
+                template_name="pitch_submitted_admin.html",
+                name=pitch.name,
+                company_name=pitch.company_name,
+                sector=pitch.sector,
+                investment_required=pitch.investment_required,
+                email=pitch.email,
+                contact_number=pitch.contact_number,
+                pitch_summary=pitch.pitch_summary,
+                proposal_file_url=pitch.proposal_file_url,  # 🔥 LINK ONLY
+                proposal_pending=pitch.pending_upload is not None,  # upload not done yet
+                timestamp=timestamp,
+            ),
+        )
@@ -0,0 +1,218 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Optional
+
+from app.core.config import settings
+from app.models.pitchModel import Pitch
+from app.repository.pitchRepository import PitchRepository
+from app.services.pitchService import PitchService
+from app.services.stats_service import StatsService
+from app.services.upload_service import UploadService
+from app.util.cloudinary_upload import (
+    PROPOSAL_FOLDER,
+    delete_proposal_upload,
+    proposal_upload_bytes,
+)
+
+# Run in order; each one is recorded in processing.completed_steps and
+# skipped on retry
+STEPS = ("upload", "notify", "stats")
+
+
+class PitchPipelineService:
+    """
+    Background worker for freshly stored pitches (status "processing").
+
+    - upload: pending proposal bytes → Cloudinary (deduplicated), URL patched back
+    - notify: user + admin emails queued on the durable outbox
+    - stats:  dashboard counters
+    - A failed upload does not hold back notify / stats: the link is patched
+      back onto the pitch once a retry stores the file
+    - Failed pitches are retried with exponential backoff, then marked failed;
+      an admin can re-queue them (POST /admin/pitches/{id}/requeue) until
+      their proposal bytes are dropped after PITCH_FAILED_UPLOAD_RETENTION_HOURS
+    - Pitches left claimed by a crashed process are re-claimed after the lease
+
+    Started / stopped from the FastAPI lifespan.
+    """
+
+    _task: Optional[asyncio.Task] = None
+    _wakeup: Optional[asyncio.Event] = None
+
+    @classmethod
+    async def start(cls):
+        if cls._task is not None:
+            return
+
+        cls._wakeup = asyncio.Event()
+        cls._task = asyncio.create_task(cls._run(), name="pitch-pipeline")
+        print("✅ Pitch pipeline started")
+
+    @classmethod
+    async def stop(cls):
+        if cls._task is None:
+            return
+
+        cls._task.cancel()
+        await asyncio.gather(cls._task, return_exceptions=True)
+        cls._task = None
+        cls._wakeup = None
+        print("🛑 Pitch pipeline stopped")
+
+    @classmethod
+    def wake(cls):
+        """
+        A pitch was just stored: process it now instead of at the next poll.
+        """
+        if cls._wakeup is not None:
+            cls._wakeup.set()
+
+    # ---------------------------------------------------------
+    # LOOP
+    # ---------------------------------------------------------
+    @classmethod
+    async def _run(cls):
+        while True:
+            try:
+                processed = await cls.process_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[ERROR] - Pitch pipeline failed: [{e}]")
+                processed = 0
+
+            # Full batch → more is probably waiting, go again right away
+            if processed >= settings.PITCH_PIPELINE_BATCH_SIZE:
+                continue
+
+            try:
+                await asyncio.wait_for(
+                    cls._wakeup.wait(),
+                    timeout=settings.PITCH_PIPELINE_POLL_SECONDS,
+                )
+            except asyncio.TimeoutError:
+                pass
+            cls._wakeup.clear()
+
+    @classmethod
+    async def process_once(cls) -> int:
+        """
+        Claim one batch, run the pending steps of each pitch, record the outcome.
+        Returns the number of pitches claimed.
+        """
+        pitches = await PitchRepository.claim_processing_batch(
+            limit=settings.PITCH_PIPELINE_BATCH_SIZE,
+            lease_seconds=settings.PITCH_PIPELINE_LEASE_SECONDS,
+        )
+        if not pitches:
+            # idle: free the bytes of failed pitches nobody re-queued
+            await PitchRepository.drop_stale_pending_uploads(
+                datetime.now() - timedelta(hours=settings.PITCH_FAILED_UPLOAD_RETENTION_HOURS)
+            )
+            return 0
+
+        results = await asyncio.gather(
+            *(cls._process(pitch) for pitch in pitches),
+            return_exceptions=True,
+        )
+
+        for pitch, result in zip(pitches, results):
+            if not isinstance(result, Exception):
+                await PitchRepository.mark_processing_done(pitch.id)
+                continue
+
+            attempts = pitch.processing.attempts + 1
+            if attempts >= settings.PITCH_PIPELINE_MAX_ATTEMPTS:
+                await PitchRepository.mark_processing_failed(pitch.id, str(result))
+                print(f"[ERROR] - Pitch {pitch.id} gave up after {attempts} attempts: [{result}]")
+            else:
+                await PitchRepository.mark_processing_retry(
+                    pitch.id,
+                    next_attempt_at=datetime.now() + cls._backoff(attempts),
+                    error=str(result),
+                )
+
+        return len(pitches)
+
+    # ---------------------------------------------------------
+    # STEPS
+    # ---------------------------------------------------------
+    @staticmethod
+    async def _process(pitch: Pitch):
+        done = set(pitch.processing.completed_steps)
+
+        upload_error = None
+        if "upload" not in done:
+            try:
+                await PitchPipelineService._upload(pitch)
+            except Exception as e:
+                # still confirm the submission; the upload is retried below
+                upload_error = e
+
+        if "notify" not in done:
+            await PitchService.queue_pitch_emails(pitch)
+            await PitchRepository.complete_step(pitch.id, "notify")
+
+        if "stats" not in done:
+            # step recorded first, then $inc → never counted twice
+            if await PitchRepository.claim_step(pitch.id, "stats"):
+                await StatsService.record_pitch(pitch)
+
+        if upload_error is not None:
+            raise upload_error
+
+    @staticmethod
+    async def _upload(pitch: Pitch):
+        pending = pitch.pending_upload
+        if not pending:
+            if pitch.processing.upload_expired:
+                # never "ready" without the file the submitter sent
+                raise RuntimeError("Proposal bytes were dropped before the upload ran")
+            if pitch.proposal_public_id:
+                await PitchPipelineService._check_direct_upload(pitch)
+            await PitchRepository.complete_step(
+                pitch.id,
+                "upload",
+                fields={
+                    "proposal_file_url": pitch.proposal_file_url,
+                    "proposal_public_id": pitch.proposal_public_id,
+                },
+            )
+            return
+
+        upload_result = await UploadService.store_deduplicated(
+            data=pending.data,
+            sha256=pending.sha256,
+            filename=pending.filename,
+            folder=PROPOSAL_FOLDER,
+            resource_type="raw",  # pdf/doc/ppt
+        )
+        pitch.proposal_file_url = upload_result["url"]
+        await PitchRepository.complete_step(
+            pitch.id,
+            "upload",
+            fields={"proposal_file_url": pitch.proposal_file_url},
+            unset=["pending_upload"],
+        )
+
+    @staticmethod
+    async def _check_direct_upload(pitch: Pitch):
+        """
+        Browser → Cloudinary uploads skip the multipart size check: same cap
+        here. Oversized (or missing) files are dropped from the pitch.
+        """
+        size = await proposal_upload_bytes(pitch.proposal_public_id)
+        if size is not None and size <= settings.MAX_UPLOAD_SIZE_MB * 1024 * 1024:
+            return
+
+        if size is not None:
+            await delete_proposal_upload(pitch.proposal_public_id)
+            print(f"[WARN] - Pitch {pitch.id}: direct upload of {size} bytes exceeds "
+                  f"{settings.MAX_UPLOAD_SIZE_MB} MB, deleted")
+        pitch.proposal_file_url = None
+        pitch.proposal_public_id = None
+
+    @staticmethod
+    def _backoff(attempts: int) -> timedelta:
+        delay = settings.PITCH_PIPELINE_BACKOFF_BASE_SECONDS * (2 ** (attempts - 1))
+        return timedelta(seconds=min(delay, settings.PITCH_PIPELINE_BACKOFF_MAX_SECONDS))
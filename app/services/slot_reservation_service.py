@@ -0,0 +1,154 @@
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Tuple
+
+from beanie import PydanticObjectId
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.repository.slot_reservation_repository import SlotReservationRepository
+from app.util.date_utils import get_day_range
+from app.util.slot_engine import granule_starts
+
+
+def _utc(epoch_seconds: int) -> datetime:
+    return datetime.fromtimestamp(epoch_seconds, timezone.utc).replace(tzinfo=None)
+
+
+class SlotReservationService:
+    """
+    Local slot ledger in front of Google Calendar.
+
+    - Booking: hold the slot's granules in Mongo first (one insert_many,
+      unique index → concurrent bookings of the same slot cannot both win)
+    - Calendar event created: hold extended until the session ends
+    - Booking failed: hold released
+    - Availability: live holds are busy time on top of Google free/busy
+    """
+
+    @staticmethod
+    def _slot_bounds(selected_date: date, start_time: str, duration_minutes: int) -> Tuple[int, int]:
+        """
+        Local date + "HH:MM" → [start, end) in epoch seconds.
+        Raises ValueError on a malformed start time.
+        """
+        date_str = selected_date.strftime("%Y-%m-%d")
+        day_start, _ = get_day_range(date_str)
+
+        start = datetime.strptime(
+            f"{date_str} {start_time}", "%Y-%m-%d %H:%M"
+        ).replace(tzinfo=day_start.tzinfo)
+
+        epoch = int(start.timestamp())
+        return epoch, epoch + duration_minutes * 60
+
+    @staticmethod
+    def _bookable_granules(selected_date: date, start_time: str, duration_minutes: int) -> List[datetime]:
+        """
+        Granules of a slot a client asked for; 400 unless it is well-formed,
+        non-empty and inside WORK_START_TIME / WORK_END_TIME.
+        """
+        try:
+            start, end = SlotReservationService._slot_bounds(selected_date, start_time, duration_minutes)
+            work_start, _ = SlotReservationService._slot_bounds(selected_date, settings.WORK_START_TIME, 0)
+            work_end, _ = SlotReservationService._slot_bounds(selected_date, settings.WORK_END_TIME, 0)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="selected_start_time must be HH:MM"
+            )
+
+        if not (work_start <= start and end <= work_end):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Slot must lie within working hours "
+                       f"({settings.WORK_START_TIME}-{settings.WORK_END_TIME})"
+            )
+
+        granule = settings.SLOT_RESERVATION_GRANULE_MINUTES * 60
+        starts = [_utc(t) for t in granule_starts(start, end, granule)]
+        if not starts:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Slot has no duration"
+            )
+        return starts
+
+    # ---------------------------------------------------------
+    # BOOKING
+    # ---------------------------------------------------------
+    @staticmethod
+    async def hold(
+        booking_id: PydanticObjectId,
+        selected_date: date,
+        start_time: str,
+        duration_minutes: int,
+    ) -> bool:
+        """
+        Atomically hold the slot for a new booking. False → already taken.
+        HTTPException(400) for a malformed / out-of-hours / empty slot.
+        """
+        return await SlotReservationRepository.claim(
+            calendar=settings.GOOGLE_CALENDAR_ID,
+            starts=SlotReservationService._bookable_granules(selected_date, start_time, duration_minutes),
+            booking_id=booking_id,
+            expires_at=datetime.utcnow() + timedelta(seconds=settings.SLOT_HOLD_TTL_SECONDS),
+        )
+
+    @staticmethod
+    async def confirm(
+        booking_id: PydanticObjectId,
+        selected_date: date,
+        start_time: str,
+        duration_minutes: int,
+    ) -> None:
+        """
+        The event exists: keep the hold until the session is over.
+        """
+        _, end = SlotReservationService._slot_bounds(selected_date, start_time, duration_minutes)
+        await SlotReservationRepository.extend(booking_id, _utc(end))
+
+    @staticmethod
+    async def release(booking_id: PydanticObjectId) -> None:
+        await SlotReservationRepository.release(booking_id)
+
+    # ---------------------------------------------------------
+    # AVAILABILITY
+    # ---------------------------------------------------------
+    @staticmethod
+    async def held_busy(date_from: str, date_to: str) -> Dict[str, List[dict]]:
+        """
+        Live holds in [date_from, date_to] as Google-style busy intervals
+        → {"YYYY-MM-DD": [{"start": iso, "end": iso}, ...]} (days with holds only)
+        """
+        range_start, _ = get_day_range(date_from)
+        _, range_end = get_day_range(date_to)
+        tz = range_start.tzinfo
+        granule = timedelta(minutes=settings.SLOT_RESERVATION_GRANULE_MINUTES)
+
+        starts = await SlotReservationRepository.held_between(
+            settings.GOOGLE_CALENDAR_ID,
+            _utc(int(range_start.timestamp())),
+            _utc(int(range_end.timestamp())),
+        )
+
+        # adjacent granules → one interval per run
+        busy_by_day: Dict[str, List[dict]] = defaultdict(list)
+        run_start = run_end = None
+        for start in sorted(starts):
+            start = start.replace(tzinfo=timezone.utc).astimezone(tz)
+            if run_end is not None and start == run_end and start.date() == run_start.date():
+                run_end = start + granule
+                continue
+            if run_start is not None:
+                busy_by_day[run_start.strftime("%Y-%m-%d")].append(
+                    {"start": run_start.isoformat(), "end": run_end.isoformat()}
+                )
+            run_start, run_end = start, start + granule
+
+        if run_start is not None:
+            busy_by_day[run_start.strftime("%Y-%m-%d")].append(
+                {"start": run_start.isoformat(), "end": run_end.isoformat()}
+            )
+
+        return dict(busy_by_day)
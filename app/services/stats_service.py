@@ -0,0 +1,167 @@
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, Optional
+
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.models.connect_model import Connect
+from app.models.mentorship_model import Mentorship
+from app.models.pitchModel import Pitch
+from app.repository.stats_repository import StatsRepository
+
+COUNTERS = ("pitches", "connects", "mentorships", "paid_mentorships", "mentorship_revenue")
+
+# created_at → "YYYY-MM-DD"; same day as `created_at.date()` on the write path
+_DAY = {"$dateToString": {"format": "%Y-%m-%d", "date": "$created_at"}}
+_VERIFIED = {"$eq": ["$payment.verified", True]}
+
+# what the write path counts: documents whose "stats" step ran (pitches /
+# bookings still in the pipeline, failed or compensated never were), plus
+# documents saved before the background pipelines existed
+_COUNTED = {"$match": {"$or": [
+    {"processing.completed_steps": "stats"},
+    {"processing": None},
+]}}
+
+
+def sector_key(sector: Optional[str]) -> str:
+    """
+    Free-text sector → safe sub-document key ("." and "$" are not allowed in
+    field paths); case / whitespace variants are counted together.
+    """
+    key = (sector or "").strip().lower().replace(".", "_").replace("$", "_")
+    return key or "unspecified"
+
+
+class StatsService:
+    """
+    Admin dashboard statistics.
+
+    - Daily buckets in `daily_stats` are bumped with $inc on every submission
+    - GET /admin/stats only reads the buckets of the requested range
+    - rebuild() recomputes every bucket from the raw collections
+    """
+
+    # ---------------------------------------------------------
+    # WRITE PATH (called by the services after a successful save)
+    # ---------------------------------------------------------
+    @staticmethod
+    async def _bump(created_at: datetime, inc: Dict[str, float]) -> None:
+        # Stats must never fail a submission; rebuild() repairs any gap
+        try:
+            await StatsRepository.increment(created_at.date().isoformat(), inc)
+        except Exception as e:
+            print(f"[WARN] - Stats update failed: [{e}]")
+
+    @staticmethod
+    async def record_pitch(pitch: Pitch) -> None:
+        await StatsService._bump(pitch.created_at, {
+            "pitches": 1,
+            f"pitches_by_sector.{sector_key(pitch.sector)}": 1,
+        })
+
+    @staticmethod
+    async def record_connect(connect: Connect) -> None:
+        await StatsService._bump(connect.created_at, {"connects": 1})
+
+    @staticmethod
+    async def record_mentorship(mentorship: Mentorship) -> None:
+        inc = {"mentorships": 1}
+
+        payment = mentorship.payment
+        if payment and payment.verified:
+            inc["paid_mentorships"] = 1
+            inc["mentorship_revenue"] = payment.amount or 0
+
+        await StatsService._bump(mentorship.created_at, inc)
+
+    # ---------------------------------------------------------
+    # READ
+    # ---------------------------------------------------------
+    @staticmethod
+    async def get_stats(date_from: Optional[date] = None, date_to: Optional[date] = None) -> dict:
+        """
+        Totals + per-day series for [date_from, date_to]
+        (default: the last STATS_DEFAULT_RANGE_DAYS days).
+        """
+        date_to = date_to or date.today()
+        date_from = date_from or date_to - timedelta(days=settings.STATS_DEFAULT_RANGE_DAYS - 1)
+
+        if date_from > date_to:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="date_from must be on or before date_to"
+            )
+
+        days = await StatsRepository.get_range(date_from.isoformat(), date_to.isoformat())
+
+        totals = {counter: 0 for counter in COUNTERS}
+        by_sector = defaultdict(int)
+        for day in days:
+            for counter in COUNTERS:
+                totals[counter] += day.get(counter, 0)
+            for sector, count in day.get("pitches_by_sector", {}).items():
+                by_sector[sector] += count
+
+        return {
+            "success": True,
+            "date_from": date_from,
+            "date_to": date_to,
+            "totals": {**totals, "pitches_by_sector": dict(by_sector)},
+            "days": days,
+        }
+
+    # ---------------------------------------------------------
+    # REBUILD (aggregation over the raw collections)
+    # ---------------------------------------------------------
+    @staticmethod
+    async def rebuild() -> dict:
+        """
+        Recompute every bucket from scratch.
+        Submissions landing while it runs may be off by one until the next rebuild.
+        """
+        started = time.perf_counter()
+        buckets: Dict[str, dict] = defaultdict(
+            lambda: {**{counter: 0 for counter in COUNTERS}, "pitches_by_sector": {}}
+        )
+
+        pitch_rows = await StatsRepository.aggregate(Pitch, [
+            _COUNTED,
+            {"$group": {"_id": {"day": _DAY, "sector": "$sector"}, "count": {"$sum": 1}}},
+        ])
+        for row in pitch_rows:
+            bucket = buckets[row["_id"]["day"]]
+            sector = sector_key(row["_id"].get("sector"))
+            bucket["pitches"] += row["count"]
+            bucket["pitches_by_sector"][sector] = bucket["pitches_by_sector"].get(sector, 0) + row["count"]
+
+        connect_rows = await StatsRepository.aggregate(Connect, [
+            {"$group": {"_id": _DAY, "count": {"$sum": 1}}},
+        ])
+        for row in connect_rows:
+            buckets[row["_id"]]["connects"] = row["count"]
+
+        mentorship_rows = await StatsRepository.aggregate(Mentorship, [
+            _COUNTED,
+            {"$group": {
+                "_id": _DAY,
+                "count": {"$sum": 1},
+                "paid": {"$sum": {"$cond": [_VERIFIED, 1, 0]}},
+                "revenue": {"$sum": {"$cond": [_VERIFIED, {"$ifNull": ["$payment.amount", 0]}, 0]}},
+            }},
+        ])
+        for row in mentorship_rows:
+            bucket = buckets[row["_id"]]
+            bucket["mentorships"] = row["count"]
+            bucket["paid_mentorships"] = row["paid"]
+            bucket["mentorship_revenue"] = row["revenue"]
+
+        written = await StatsRepository.replace_all(dict(buckets))
+
+        return {
+            "success": True,
+            "days": written,
+            "took_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
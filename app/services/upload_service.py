@@ -0,0 +1,87 @@
+import io
+import os
+
+from fastapi import HTTPException, UploadFile
+
+from app.core.config import settings
+from app.core.executor import BlockingExecutor
+from app.repository.uploaded_file_repository import UploadedFileRepository
+from app.util.cloudinary_upload import upload_file_to_cloudinary
+from app.util.helper import read_capped
+
+
+class UploadService:
+
+    # ---------------------------------------------------------
+    # REQUEST PATH: size-capped read + hash (no network)
+    # ---------------------------------------------------------
+    @staticmethod
+    async def read_capped(file: UploadFile) -> dict:
+        """
+        Read the file in chunks (SHA-256 on the fly), abort past MAX_UPLOAD_SIZE_MB.
+        Returns {data, sha256, size_bytes, filename}.
+        """
+        max_bytes = settings.MAX_UPLOAD_SIZE_MB * 1024 * 1024
+        too_large = HTTPException(
+            status_code=413,
+            detail=f"File exceeds the {settings.MAX_UPLOAD_SIZE_MB} MB limit"
+        )
+
+        # Spooled size is known up front for multipart uploads
+        if file.size is not None and file.size > max_bytes:
+            raise too_large
+
+        data, sha256, size = await BlockingExecutor.run(
+            "cloudinary", read_capped, file.file, max_bytes, settings.UPLOAD_READ_CHUNK_BYTES
+        )
+        if size > max_bytes:
+            raise too_large
+
+        return {
+            "data": data,
+            "sha256": sha256,
+            "size_bytes": size,
+            "filename": file.filename,
+        }
+
+    # ---------------------------------------------------------
+    # BACKGROUND: content-addressed upload
+    # ---------------------------------------------------------
+    @staticmethod
+    async def store_deduplicated(
+        data: bytes,
+        sha256: str,
+        filename: str,
+        folder: str,
+        resource_type: str = "auto",
+    ) -> dict:
+        """
+        - Same bytes already stored in this folder → reuse that asset, no upload
+        - Otherwise upload with public_id = hash (overwrite=False, so a racing
+          or retried upload of the same file resolves to the same asset)
+        """
+        existing = await UploadedFileRepository.claim_existing(sha256, folder)
+        if existing:
+            return {
+                "public_id": existing["public_id"],
+                "url": existing["url"],
+                "resource_type": existing["resource_type"],
+                "format": existing.get("format"),
+                "bytes": existing["size_bytes"],
+                "deduplicated": True,
+            }
+
+        # raw assets keep their extension in the public_id (and delivery URL)
+        extension = os.path.splitext(filename or "")[1].lower()
+        public_id = sha256 + extension if resource_type == "raw" else sha256
+
+        result = await upload_file_to_cloudinary(
+            file=io.BytesIO(data),
+            folder=folder,
+            resource_type=resource_type,
+            public_id=public_id,
+            overwrite=False,
+        )
+        await UploadedFileRepository.record(sha256, folder, len(data), result)
+
+        return {**result, "deduplicated": False}
@@ -1,7 +1,16 @@
+import re
+import time
+import uuid
+from typing import BinaryIO, Optional, Union
+
 import cloudinary
+import cloudinary.api
+import cloudinary.exceptions
 import cloudinary.uploader
+import cloudinary.utils
 from fastapi import UploadFile, HTTPException
 from app.core.config import settings
+from app.core.executor import BlockingExecutor
 
 
 # 🔹 configure once
@@ -12,21 +21,32 @@ cloudinary.config(
     secure=True,
 )
 
+PROPOSAL_FOLDER = "pitch/proposals"
+# pitch/proposals/<issued unix ts>-<random hex>: the ts lets us enforce the TTL
+_PROPOSAL_PUBLIC_ID = re.compile(rf"^{PROPOSAL_FOLDER}/(\d+)-[0-9a-f]{{32}}$")
+_CLOCK_SKEW_SECONDS = 60  # our clock vs Cloudinary's upload timestamp
+# signed into every grant: Cloudinary rejects any other file type
+PROPOSAL_FORMATS = ("pdf", "ppt", "pptx", "doc", "docx")
+
 
 async def upload_file_to_cloudinary(
-    file: UploadFile,
+    file: Union[UploadFile, BinaryIO],
     folder: str,
     resource_type: str = "auto",  # image / video / raw / auto
+    **options,  # extra uploader options (public_id, overwrite, ...)
 ) -> dict:
     """
     Uploads file to Cloudinary and returns important metadata
     """
 
     try:
-        result = cloudinary.uploader.upload(
-            file.file,
+        result = await BlockingExecutor.run(
+            "cloudinary",
+            cloudinary.uploader.upload,
+            file.file if isinstance(file, UploadFile) else file,
             folder=folder,
             resource_type=resource_type,
+            **options,
         )
 
         return {
@@ -42,3 +62,82 @@ async def upload_file_to_cloudinary(
             status_code=500,
             detail=f"Cloudinary upload failed: {str(e)}"
         )
+
+
+# ---------------------------------------------------------
+# DIRECT (BROWSER → CLOUDINARY) SIGNED UPLOAD
+# ---------------------------------------------------------
+def sign_proposal_upload() -> dict:
+    """
+    Signed, single-use upload parameters for one proposal file.
+
+    The public_id and allowed_formats are chosen here and covered by the
+    signature, so the browser can only upload a proposal-type file to that
+    exact path inside pitch/proposals. The Upload API has no signed size
+    limit: MAX_UPLOAD_SIZE_MB is enforced by the pitch pipeline
+    (proposal_upload_bytes), which deletes oversized uploads.
+    No network call: signing is a local hash.
+    """
+    timestamp = int(time.time())
+    params = {
+        "public_id": f"{PROPOSAL_FOLDER}/{timestamp}-{uuid.uuid4().hex}",
+        "timestamp": timestamp,
+        "allowed_formats": ",".join(PROPOSAL_FORMATS),
+    }
+
+    return {
+        "upload_url": cloudinary.utils.cloudinary_api_url("upload", resource_type="raw"),
+        "api_key": settings.CLOUDINARY_API_KEY,
+        "cloud_name": settings.CLOUDINARY_CLOUD_NAME,
+        "resource_type": "raw",
+        **params,
+        "signature": cloudinary.utils.api_sign_request(params, settings.CLOUDINARY_API_SECRET),
+        "expires_at": timestamp + settings.CLOUDINARY_SIGNED_UPLOAD_TTL_SECONDS,
+    }
+
+
+def verify_proposal_upload(public_id: str, version: Optional[int], signature: Optional[str]) -> str:
+    """
+    Check the upload response the browser got back from Cloudinary and
+    return the delivery URL.
+
+    - public_id must be one we issued (pitch/proposals/<ts>-<hex>)
+    - version (= upload time) must fall inside the signed-upload TTL
+    - signature must be Cloudinary's response signature for (public_id, version)
+    """
+    match = _PROPOSAL_PUBLIC_ID.match(public_id or "")
+    if not match or version is None or not signature:
+        raise HTTPException(status_code=400, detail="Invalid proposal upload reference")
+
+    issued_at = int(match.group(1))
+    earliest = issued_at - _CLOCK_SKEW_SECONDS
+    latest = issued_at + settings.CLOUDINARY_SIGNED_UPLOAD_TTL_SECONDS + _CLOCK_SKEW_SECONDS
+    if not earliest <= version <= latest:
+        raise HTTPException(status_code=400, detail="Proposal upload has expired")
+
+    if not cloudinary.utils.verify_api_response_signature(public_id, version, signature):
+        raise HTTPException(status_code=400, detail="Proposal upload signature mismatch")
+
+    url, _ = cloudinary.utils.cloudinary_url(
+        public_id, resource_type="raw", version=version, secure=True
+    )
+    return url
+
+
+async def proposal_upload_bytes(public_id: str) -> Optional[int]:
+    """
+    Stored size of a direct upload (Admin API); None if it does not exist.
+    """
+    try:
+        resource = await BlockingExecutor.run(
+            "cloudinary", cloudinary.api.resource, public_id, resource_type="raw"
+        )
+    except cloudinary.exceptions.NotFound:
+        return None
+    return resource.get("bytes")
+
+
+async def delete_proposal_upload(public_id: str) -> None:
+    await BlockingExecutor.run(
+        "cloudinary", cloudinary.uploader.destroy, public_id, resource_type="raw", invalidate=True
+    )
@@ -0,0 +1,148 @@
+import asyncio
+import time
+from email.message import Message
+from typing import List, Optional
+
+from app.core.config import settings
+from app.core.executor import BlockingExecutor
+from app.util.metrics import LatencyRecorder
+from app.util.smtp_pool import SMTPConnectionPool
+
+
+class EmailOutbox:
+    """
+    In-process async email outbox.
+
+    - enqueue() returns immediately (request path never touches SMTP)
+    - A fixed pool of worker tasks drains the queue
+    - Workers send through SMTPConnectionPool (reused, authenticated sessions)
+      on the "smtp" BlockingExecutor pool
+
+    Started / stopped from the FastAPI lifespan.
+    """
+
+    _queue: Optional[asyncio.Queue] = None
+    _workers: List[asyncio.Task] = []
+    _pool: Optional[SMTPConnectionPool] = None
+
+    _sent = 0
+    _failed = 0
+    _queue_latency = LatencyRecorder()
+    _send_latency = LatencyRecorder()
+
+    @classmethod
+    def is_running(cls) -> bool:
+        return cls._queue is not None
+
+    @classmethod
+    async def start(cls):
+        """
+        Create the queue, SMTP pool and worker tasks.
+
+        Called ONCE during FastAPI startup.
+        """
+        if cls._queue is not None:
+            return
+
+        cls._queue = asyncio.Queue(maxsize=settings.EMAIL_OUTBOX_MAX_QUEUE)
+        cls._pool = SMTPConnectionPool(
+            size=settings.EMAIL_SMTP_POOL_SIZE,
+            max_idle_seconds=settings.EMAIL_SMTP_MAX_IDLE_SECONDS,
+            timeout=settings.EMAIL_SMTP_TIMEOUT_SECONDS,
+        )
+        cls._workers = [
+            asyncio.create_task(cls._worker(), name=f"email-outbox-{i}")
+            for i in range(settings.EMAIL_OUTBOX_WORKERS)
+        ]
+
+        print(f"✅ Email outbox started ({len(cls._workers)} workers)")
+
+    @classmethod
+    async def stop(cls):
+        """
+        Flush queued mail (bounded wait), stop workers and close SMTP sessions.
+
+        Called during FastAPI shutdown.
+        """
+        if cls._queue is None:
+            return
+
+        try:
+            await asyncio.wait_for(
+                cls._queue.join(),
+                timeout=settings.EMAIL_OUTBOX_DRAIN_TIMEOUT_SECONDS,
+            )
+        except asyncio.TimeoutError:
+            print(f"[WARN] - Email outbox stopped with {cls._queue.qsize()} unsent messages")
+
+        for worker in cls._workers:
+            worker.cancel()
+        await asyncio.gather(*cls._workers, return_exceptions=True)
+
+        await BlockingExecutor.run("smtp", cls._pool.close)
+
+        cls._queue = None
+        cls._workers = []
+        cls._pool = None
+        print("🛑 Email outbox stopped")
+
+    # ---------------------------------------------------------
+    # ENQUEUE
+    # ---------------------------------------------------------
+    @classmethod
+    def enqueue(cls, msg: Message) -> asyncio.Future:
+        """
+        Queue a ready-to-send message.
+        Returns a future resolved once the message is delivered.
+        """
+        future = asyncio.get_running_loop().create_future()
+
+        try:
+            cls._queue.put_nowait((msg, time.perf_counter(), future))
+        except asyncio.QueueFull:
+            raise RuntimeError("Email sending failed: outbox queue is full")
+
+        return future
+
+    # ---------------------------------------------------------
+    # WORKER
+    # ---------------------------------------------------------
+    @classmethod
+    async def _worker(cls):
+        while True:
+            msg, enqueued_at, future = await cls._queue.get()
+            started_at = time.perf_counter()
+            cls._queue_latency.record(started_at - enqueued_at)
+
+            try:
+                await BlockingExecutor.run("smtp", cls._pool.send, msg)
+                cls._sent += 1
+                if not future.done():
+                    future.set_result(True)
+
+            except Exception as e:
+                cls._failed += 1
+                print(f"[ERROR] - Email to {msg['To']} failed: [{e}]")
+                if not future.done():
+                    future.set_exception(RuntimeError(f"Email sending failed: {str(e)}"))
+                    future.exception()  # already logged, don't warn if nobody awaits
+
+            finally:
+                cls._send_latency.record(time.perf_counter() - started_at)
+                cls._queue.task_done()
+
+    # ---------------------------------------------------------
+    # METRICS
+    # ---------------------------------------------------------
+    @classmethod
+    def metrics(cls) -> dict:
+        return {
+            "running": cls.is_running(),
+            "queue_depth": cls._queue.qsize() if cls._queue else 0,
+            "workers": len(cls._workers),
+            "sent": cls._sent,
+            "failed": cls._failed,
+            "queue_wait": cls._queue_latency.snapshot(),
+            "send_latency": cls._send_latency.snapshot(),
+            "smtp_pool": cls._pool.stats() if cls._pool else None,
+        }
@@ -1,4 +1,3 @@
-import smtplib
 import os
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -6,6 +5,7 @@ from email.mime.application import MIMEApplication
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
 from app.core.config import settings
+from app.models.email_outbox_model import EmailOutboxEntry
 
 
 BASE_DIR = os.path.dirname(__file__)
@@ -20,13 +20,13 @@ env = Environment(
 class EmailService:
 
     @staticmethod
-    def _send(
+    def _build_message(
         to_email: str,
         subject: str,
         html_body: str,
         attachment_bytes: bytes | None = None,
         attachment_name: str | None = None,
-    ):
+    ) -> MIMEMultipart:
         # 🔹 Use mixed for attachments
         msg = MIMEMultipart("mixed")
         msg["From"] = f"{settings.EMAIL_USERNAME} <{settings.EMAIL_FROM}>"
@@ -45,51 +45,23 @@ class EmailService:
             )
             msg.attach(part)
 
-        try:
-            if settings.EMAIL_USE_SSL:
-                server = smtplib.SMTP_SSL(
-                    settings.EMAIL_HOST,
-                    settings.EMAIL_PORT
-                )
-            else:
-                server = smtplib.SMTP(
-                    settings.EMAIL_HOST,
-                    settings.EMAIL_PORT
-                )
-                server.starttls()
+        return msg
 
-            with server:
-                server.login(
-                    settings.EMAIL_USERNAME,
-                    settings.EMAIL_PASSWORD
-                )
-                server.send_message(msg)
-
-        except Exception as e:
-            raise RuntimeError(f"Email sending failed: {str(e)}")
-
-    @classmethod
-    def send_email(
-        cls,
+    @staticmethod
+    def build_outbox_entry(
         to_email: str,
         subject: str,
         template_name: str,
-        attachment_bytes: bytes | None = None,
-        attachment_name: str | None = None,
         **template_vars,
-    ):
+    ) -> EmailOutboxEntry:
         """
-        template_name -> HTML file inside email_templates/
-        template_vars -> injected into Jinja template
+        Render a template into a durable outbox row
+        (persist with EmailOutboxService.queue()).
         """
-
         template = env.get_template(template_name)
-        html_body = template.render(**template_vars)
 
-        cls._send(
+        return EmailOutboxEntry(
             to_email=to_email,
             subject=subject,
-            html_body=html_body,
-            attachment_bytes=attachment_bytes,
-            attachment_name=attachment_name,
+            html_body=template.render(**template_vars),
         )
@@ -0,0 +1,77 @@
+import hashlib
+from typing import Any, Awaitable, Callable, Hashable, List, Optional, Tuple
+
+from fastapi.responses import Response
+
+from app.util.fast_json import FastJSONResponse, dumps
+from app.util.response_cache import ResponseCache
+
+# Clients may reuse a cached page but must revalidate it first
+CACHE_CONTROL = "private, no-cache"
+
+
+def window_etag(version: int, key: Tuple[Hashable, ...], window: List[dict]) -> str:
+    """
+    Strong ETag of a listing page: collection write version + request key +
+    (_id, updated_at) of every row in the window (incl. the look-ahead row,
+    so "is there a next page" is covered too).
+    """
+    digest = hashlib.blake2b(digest_size=12)
+    digest.update(repr((version, key)).encode())
+    for doc in window:
+        digest.update(str(doc["_id"]).encode())
+        updated_at = doc.get("updated_at")
+        digest.update(updated_at.isoformat().encode() if updated_at else b"-")
+    return f'"{digest.hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    RFC 9110 weak comparison against an If-None-Match header.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+
+
+async def conditional_listing(
+    if_none_match: Optional[str],
+    collection: str,
+    key: Tuple[Hashable, ...],
+    probe: Callable[[], Awaitable[List[dict]]],
+    build: Callable[[], Awaitable[Any]],
+) -> Response:
+    """
+    Conditional GET for an admin listing page.
+
+    1. Cached page (same write version) → its ETag; a match is a 304 with
+       no Mongo query and no serialization.
+    2. Otherwise probe the window (_id + updated_at only) for the ETag;
+       a match is a 304 without fetching or serializing full documents.
+    3. Otherwise build + serialize the page, cache (etag, body), return 200.
+    """
+    version = ResponseCache.version(collection)
+
+    cached = ResponseCache.get(collection, version, key)
+    if cached is not None:
+        etag, body = cached
+        if etag_matches(if_none_match, etag):
+            return _not_modified(etag)
+    else:
+        etag = window_etag(version, key, await probe())
+        if etag_matches(if_none_match, etag):
+            return _not_modified(etag)
+
+        body = dumps(await build())
+        ResponseCache.set(collection, version, key, (etag, body))
+
+    return FastJSONResponse(body, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
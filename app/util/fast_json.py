@@ -0,0 +1,33 @@
+from typing import Any
+
+from bson import ObjectId
+from fastapi.responses import Response
+from pydantic_core import to_json
+
+
+def _fallback(value: Any) -> Any:
+    if isinstance(value, ObjectId):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Plain dicts / lists / raw Mongo values → JSON bytes in one pydantic-core pass.
+    datetime / date output matches what FastAPI + pydantic models produce.
+    """
+    return to_json(content, fallback=_fallback)
+
+
+class FastJSONResponse(Response):
+    """
+    JSON response that skips response_model validation and jsonable_encoder.
+    Accepts already-serialized bytes or JSON-ready python data.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
@@ -0,0 +1,180 @@
+import asyncio
+import time
+from typing import List, Optional
+from urllib.parse import quote
+
+import httpx
+from google.auth import jwt
+
+from app.core.config import settings
+from app.core.executor import BlockingExecutor
+from app.util.google_credential_manager import GoogleCredentials, SCOPES
+
+GOOGLE_TOKEN_URI = "https://oauth2.googleapis.com/token"
+CALENDAR_API_URL = "https://www.googleapis.com/calendar/v3"
+
+
+class GoogleCalendarError(Exception):
+    """
+    Non-2xx response from the Google token / Calendar API.
+    """
+
+    def __init__(self, status_code: int, message: str):
+        self.status_code = status_code
+        self.message = message
+        super().__init__(f"[{status_code}] {message}")
+
+
+class AsyncGoogleCalendarClient:
+    """
+    Native asyncio Google Calendar client (httpx, pooled keep-alive connections).
+
+    - Reuses the service-account credentials from GoogleCredentials
+    - Access tokens are cached and refreshed ahead of expiry
+    - Only the operations we use: freebusy + events insert / get / delete
+
+    Lazy singleton; closed from the FastAPI lifespan.
+    """
+
+    _http: Optional[httpx.AsyncClient] = None
+    _token: Optional[str] = None
+    _token_expires_at: float = 0.0
+    _token_lock: Optional[asyncio.Lock] = None
+
+    # ---------------------------------------------------------
+    # HTTP CLIENT
+    # ---------------------------------------------------------
+    @classmethod
+    def _get_http(cls) -> httpx.AsyncClient:
+        if cls._http is None:
+            cls._http = httpx.AsyncClient(
+                timeout=settings.GOOGLE_HTTP_TIMEOUT_SECONDS,
+                limits=httpx.Limits(
+                    max_connections=settings.GOOGLE_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.GOOGLE_HTTP_MAX_CONNECTIONS,
+                ),
+            )
+        return cls._http
+
+    @classmethod
+    async def close(cls):
+        if cls._http is not None:
+            await cls._http.aclose()
+            cls._http = None
+
+    # ---------------------------------------------------------
+    # ACCESS TOKEN (service account JWT bearer grant)
+    # ---------------------------------------------------------
+    @classmethod
+    def _build_assertion(cls) -> str:
+        credentials = GoogleCredentials.get_credentials()
+        now = int(time.time())
+
+        return jwt.encode(
+            credentials.signer,
+            {
+                "iss": credentials.service_account_email,
+                "scope": " ".join(SCOPES),
+                "aud": GOOGLE_TOKEN_URI,
+                "iat": now,
+                "exp": now + 3600,
+            },
+        ).decode("utf-8")
+
+    @classmethod
+    async def _access_token(cls, force_refresh: bool = False) -> str:
+        margin = settings.GOOGLE_TOKEN_REFRESH_MARGIN_SECONDS
+
+        if not force_refresh and cls._token and time.time() < cls._token_expires_at - margin:
+            return cls._token
+
+        if cls._token_lock is None:
+            cls._token_lock = asyncio.Lock()
+
+        async with cls._token_lock:
+            # another request may have refreshed while we waited
+            if not force_refresh and cls._token and time.time() < cls._token_expires_at - margin:
+                return cls._token
+
+            response = await cls._get_http().post(
+                GOOGLE_TOKEN_URI,
+                data={
+                    "grant_type": "urn:ietf:params:oauth:grant-type:jwt-bearer",
+                    # RSA signing (+ first-time key decrypt) off the loop
+                    "assertion": await BlockingExecutor.run("google", cls._build_assertion),
+                },
+            )
+            if response.status_code != 200:
+                raise GoogleCalendarError(response.status_code, response.text)
+
+            payload = response.json()
+            cls._token = payload["access_token"]
+            cls._token_expires_at = time.time() + int(payload.get("expires_in", 3600))
+
+            return cls._token
+
+    # ---------------------------------------------------------
+    # REQUEST
+    # ---------------------------------------------------------
+    @classmethod
+    async def _request(cls, method: str, path: str, **kwargs) -> dict:
+        token = await cls._access_token()
+
+        for attempt in range(2):
+            response = await cls._get_http().request(
+                method,
+                f"{CALENDAR_API_URL}{path}",
+                headers={"Authorization": f"Bearer {token}"},
+                **kwargs,
+            )
+
+            # token revoked / clock skew → refresh once and retry
+            if response.status_code == 401 and attempt == 0:
+                token = await cls._access_token(force_refresh=True)
+                continue
+
+            if response.status_code >= 400:
+                raise GoogleCalendarError(response.status_code, response.text)
+
+            # events.delete → 204 No Content
+            return response.json() if response.content else {}
+
+    # ---------------------------------------------------------
+    # OPERATIONS
+    # ---------------------------------------------------------
+    @classmethod
+    async def freebusy(cls, time_min: str, time_max: str, calendar_ids: List[str]) -> dict:
+        return await cls._request(
+            "POST",
+            "/freeBusy",
+            json={
+                "timeMin": time_min,
+                "timeMax": time_max,
+                "items": [{"id": calendar_id} for calendar_id in calendar_ids],
+            },
+        )
+
+    @classmethod
+    async def insert_event(
+        cls, calendar_id: str, body: dict, conference_data_version: int = 1
+    ) -> dict:
+        return await cls._request(
+            "POST",
+            f"/calendars/{quote(calendar_id, safe='')}/events",
+            params={"conferenceDataVersion": conference_data_version},
+            json=body,
+        )
+
+    @classmethod
+    async def get_event(cls, calendar_id: str, event_id: str) -> dict:
+        return await cls._request(
+            "GET",
+            f"/calendars/{quote(calendar_id, safe='')}/events/{quote(event_id, safe='')}",
+        )
+
+    @classmethod
+    async def delete_event(cls, calendar_id: str, event_id: str) -> dict:
+        return await cls._request(
+            "DELETE",
+            f"/calendars/{quote(calendar_id, safe='')}/events/{quote(event_id, safe='')}",
+        )
@@ -1,5 +1,4 @@
 from google.oauth2 import service_account
-from googleapiclient.discovery import build
 
 from app.core.config import settings
 
@@ -11,10 +10,12 @@ class GoogleCredentials:
     Centralized Google Service Account credential loader
     Uses encrypted service_account.enc via settings
     (lazy + cached)
+
+    Calendar calls go through AsyncGoogleCalendarClient
+    (app/util/google_calendar_client.py), which signs with these credentials.
     """
 
     _credentials = None
-    _calendar_service = None
 
     @classmethod
     def get_credentials(cls):
@@ -38,22 +39,3 @@ class GoogleCredentials:
         )
 
         return cls._credentials
-
-    @classmethod
-    def get_calendar_service(cls):
-        """
-        Build and cache Google Calendar service
-        """
-        if cls._calendar_service is not None:
-            return cls._calendar_service
-
-        credentials = cls.get_credentials()
-
-        cls._calendar_service = build(
-            "calendar",
-            "v3",
-            credentials=credentials,
-            cache_discovery=False,  # important for prod / serverless
-        )
-
-        return cls._calendar_service
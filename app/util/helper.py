@@ -1,5 +1,6 @@
+import hashlib
 from datetime import datetime, timedelta
-from typing import List
+from typing import BinaryIO, List, Tuple
 import pytz
 
 
@@ -28,3 +29,26 @@ def sanitize_text(text: str) -> str:
             .replace("\n", " ")
             .replace("\t", " ")
     )
+
+
+def read_capped(fileobj: BinaryIO, max_bytes: int, chunk_size: int) -> Tuple[bytes, str, int]:
+    """
+    Read a file object in chunks, hashing (SHA-256) on the fly.
+    Stops as soon as more than max_bytes were read (returned size > max_bytes,
+    data is then incomplete). Blocking: run it on an executor.
+    """
+    digest = hashlib.sha256()
+    chunks = []
+    size = 0
+
+    while True:
+        chunk = fileobj.read(chunk_size)
+        if not chunk:
+            break
+        size += len(chunk)
+        if size > max_bytes:
+            break
+        digest.update(chunk)
+        chunks.append(chunk)
+
+    return b"".join(chunks), digest.hexdigest(), size
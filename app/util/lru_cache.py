@@ -0,0 +1,73 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+_MISSING = object()
+
+
+class TTLLRUCache:
+    """
+    Size-bounded LRU cache with per-entry TTL.
+
+    - get() returns `default` for missing / expired keys
+    - Least recently used entry is evicted once max_entries is reached
+    - Not thread-safe: meant to be used from the event loop
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        item = self._data.get(key, _MISSING)
+        if item is _MISSING:
+            self.misses += 1
+            return default
+
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None):
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        return self._data.pop(key, _MISSING) is not _MISSING
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        keys = [key for key in self._data if predicate(key)]
+        for key in keys:
+            del self._data[key]
+        return len(keys)
+
+    def clear(self):
+        self._data.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            "evictions": self.evictions,
+        }
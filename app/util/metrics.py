@@ -0,0 +1,32 @@
+from collections import deque
+from typing import Deque
+
+
+class LatencyRecorder:
+    """
+    Keeps the most recent latency samples (seconds) and
+    reports count / avg / p50 / p99 / max in milliseconds.
+    """
+
+    def __init__(self, window: int = 1000):
+        self._samples: Deque[float] = deque(maxlen=window)
+        self.count = 0
+
+    def record(self, seconds: float):
+        self._samples.append(seconds)
+        self.count += 1
+
+    def snapshot(self) -> dict:
+        if not self._samples:
+            return {"count": self.count, "avg_ms": None, "p50_ms": None, "p99_ms": None, "max_ms": None}
+
+        ordered = sorted(self._samples)
+        last = len(ordered) - 1
+
+        return {
+            "count": self.count,
+            "avg_ms": round(sum(ordered) / len(ordered) * 1000, 3),
+            "p50_ms": round(ordered[int(last * 0.50)] * 1000, 3),
+            "p99_ms": round(ordered[int(last * 0.99)] * 1000, 3),
+            "max_ms": round(ordered[-1] * 1000, 3),
+        }
@@ -0,0 +1,121 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from beanie import PydanticObjectId
+from bson.errors import InvalidId
+from fastapi import HTTPException, status
+from pymongo import DESCENDING
+
+# Keyset order used by every admin listing (latest first, _id breaks ties)
+KEYSET_SORT = [("created_at", DESCENDING), ("_id", DESCENDING)]
+
+# Just enough of each row to fingerprint a page (ETag probe)
+FINGERPRINT_PROJECTION = {"_id": 1, "updated_at": 1}
+
+
+def encode_cursor(created_at: datetime, doc_id: Any) -> str:
+    """
+    (created_at, _id) of the last row → opaque url-safe cursor
+    """
+    raw = json.dumps({"c": created_at.isoformat(), "i": str(doc_id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, PydanticObjectId]:
+    """
+    Opaque cursor → (created_at, _id).  Raises HTTP 400 when tampered / malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(data["c"]), PydanticObjectId(data["i"])
+    except (ValueError, KeyError, TypeError, InvalidId):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+
+async def find_raw_page(
+    collection, projection: dict, skip: int, limit: int, cursor: Optional[str] = None
+) -> List[dict]:
+    """
+    Raw Mongo documents of one listing page (no model hydration at all).
+    Same filter / sort / index as the typed repository reads.
+    """
+    if cursor:
+        find = collection.find(keyset_filter(cursor), projection)
+    else:
+        find = collection.find({}, projection).skip(skip)
+
+    return await find.sort(KEYSET_SORT).limit(limit).to_list(length=limit)
+
+
+def encode_score_cursor(score: float, doc_id: Any) -> str:
+    """
+    (text score, _id) of the last search hit → opaque url-safe cursor
+    """
+    raw = json.dumps({"s": score, "i": str(doc_id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_score_cursor(cursor: str) -> Tuple[float, PydanticObjectId]:
+    """
+    Opaque search cursor → (score, _id).  Raises HTTP 400 when tampered / malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return float(data["s"]), PydanticObjectId(data["i"])
+    except (ValueError, KeyError, TypeError, InvalidId):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+
+def score_keyset_filter(cursor: str) -> dict:
+    """
+    Aggregation $match for hits strictly after the cursor in (score desc, _id desc).
+    """
+    score, doc_id = decode_score_cursor(cursor)
+    return {
+        "$or": [
+            {"score": {"$lt": score}},
+            {"score": score, "_id": {"$lt": doc_id}},
+        ]
+    }
+
+
+def keyset_filter(cursor: str) -> dict:
+    """
+    Mongo filter for rows strictly after the cursor in KEYSET_SORT order.
+    """
+    created_at, doc_id = decode_cursor(cursor)
+    return {
+        "$or": [
+            {"created_at": {"$lt": created_at}},
+            {"created_at": created_at, "_id": {"$lt": doc_id}},
+        ]
+    }
+
+
+def split_page(docs: List[Any], limit: int) -> Tuple[List[Any], Optional[str]]:
+    """
+    Repositories are asked for limit + 1 rows: the extra row only tells us
+    whether another page exists.  Returns (page, next_cursor).
+    Works with models (.created_at / .id), raw Mongo dicts and text-search
+    hits (score / _id).
+    """
+    if len(docs) <= limit:
+        return docs, None
+
+    page = docs[:limit]
+    last = page[-1]
+    if isinstance(last, dict) and "score" in last:
+        return page, encode_score_cursor(last["score"], last["_id"])
+    if isinstance(last, dict):
+        return page, encode_cursor(last["created_at"], last["_id"])
+    return page, encode_cursor(last.created_at, last.id)
@@ -0,0 +1,62 @@
+import hashlib
+import hmac
+from typing import Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+
+
+class PaymentSignatureVerifier:
+    """
+    Razorpay checkout signature check, in process:
+
+        signature == hex(HMAC-SHA256(key_secret, f"{order_id}|{payment_id}"))
+
+    - The keyed HMAC context is built once; each check copies it
+      (no key padding / inner-outer setup per call)
+    - Constant-time comparison (hmac.compare_digest)
+    - A bad signature is a False result, not an exception
+    """
+
+    _default: Optional["PaymentSignatureVerifier"] = None
+
+    def __init__(self, key_secret: str):
+        self._keyed = hmac.new(key_secret.encode(), digestmod=hashlib.sha256)
+
+    @classmethod
+    def default(cls) -> "PaymentSignatureVerifier":
+        """
+        Shared verifier for RAZORPAY_KEY_SECRET.
+        """
+        if cls._default is None:
+            cls._default = cls(settings.RAZORPAY_KEY_SECRET)
+        return cls._default
+
+    def sign(self, order_id: str, payment_id: str) -> str:
+        mac = self._keyed.copy()
+        mac.update(f"{order_id}|{payment_id}".encode())
+        return mac.hexdigest()
+
+    def verify(self, order_id: str, payment_id: str, signature: Optional[str]) -> bool:
+        if not (order_id and payment_id and signature):
+            return False
+        return hmac.compare_digest(
+            self.sign(order_id, payment_id).encode(), signature.encode()
+        )
+
+    def verify_many(self, items: Iterable[Tuple[str, str, Optional[str]]]) -> List[bool]:
+        """
+        (order_id, payment_id, signature) triples → one result each, same order.
+        """
+        keyed_copy = self._keyed.copy
+        compare = hmac.compare_digest
+        results = []
+
+        for order_id, payment_id, signature in items:
+            if not (order_id and payment_id and signature):
+                results.append(False)
+                continue
+            mac = keyed_copy()
+            mac.update(f"{order_id}|{payment_id}".encode())
+            results.append(compare(mac.hexdigest().encode(), signature.encode()))
+
+        return results
@@ -0,0 +1,26 @@
+import time
+from typing import Hashable
+
+from app.util.lru_cache import TTLLRUCache
+
+
+class FixedWindowRateLimiter:
+    """
+    In-process "at most `limit` hits per `window_seconds`" per key
+    (e.g. client IP). Counters live in a bounded TTL LRU, so idle keys
+    cost nothing; each worker process counts on its own.
+    """
+
+    def __init__(self, limit: int, window_seconds: int, max_keys: int = 10000):
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self._windows = TTLLRUCache(max_entries=max_keys, ttl_seconds=window_seconds)
+
+    def hit(self, key: Hashable) -> bool:
+        """
+        Count one hit for `key`. False → over the limit for this window.
+        """
+        window = int(time.time() // self.window_seconds)
+        count = self._windows.get((key, window), 0) + 1
+        self._windows.set((key, window), count)
+        return count <= self.limit
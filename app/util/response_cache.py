@@ -0,0 +1,174 @@
+import random
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from app.core.config import settings
+from app.util.fast_json import dumps
+from app.util.lru_cache import TTLLRUCache
+
+# Collections whose listings are cached; one version slot each
+COLLECTIONS = ("pitch", "connect", "mentorships")
+_SLOT = 8  # bytes per version token
+
+
+class _LocalVersions:
+    """
+    Per-process version tokens (single worker).
+    """
+
+    def __init__(self):
+        self._versions = {name: 0 for name in COLLECTIONS}
+
+    def get(self, collection: str) -> int:
+        return self._versions[collection]
+
+    def bump(self, collection: str):
+        self._versions[collection] += 1
+
+    def close(self):
+        pass
+
+
+class _SharedVersions:
+    """
+    Version tokens in a named shared-memory block, visible to every worker
+    process on the host.
+
+    A bump writes a fresh random token instead of incrementing, so two
+    workers bumping at the same time can never land on a value a reader
+    already cached under.
+    """
+
+    def __init__(self, name: str):
+        size = _SLOT * len(COLLECTIONS)
+        try:
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            self._shm.buf[:size] = bytes(size)
+        except FileExistsError:
+            self._shm = shared_memory.SharedMemory(name=name)
+
+        # The block outlives any single worker: keep the resource tracker
+        # from unlinking it when this process exits.
+        resource_tracker.unregister(self._shm._name, "shared_memory")
+
+    def _offset(self, collection: str) -> int:
+        return COLLECTIONS.index(collection) * _SLOT
+
+    def get(self, collection: str) -> int:
+        offset = self._offset(collection)
+        return int.from_bytes(self._shm.buf[offset:offset + _SLOT], "little")
+
+    def bump(self, collection: str):
+        offset = self._offset(collection)
+        self._shm.buf[offset:offset + _SLOT] = random.getrandbits(64).to_bytes(_SLOT, "little")
+
+    def close(self):
+        self._shm.close()
+
+
+class ResponseCache:
+    """
+    Read-through cache of serialized admin listing responses.
+
+    - Key: (collection, version, endpoint, page / filter params)
+    - Value: the JSON bytes, served as-is by FastJSONResponse
+      (conditional listings store (etag, bytes), see app/util/etag.py)
+    - Size-bounded LRU + TTL (TTLLRUCache), one per worker process
+    - Repository writes call invalidate(collection): the version changes,
+      so every cached page of that collection stops matching
+
+    RESPONSE_CACHE_BACKEND:
+    - "local"  → versions live in this process (single worker)
+    - "shared" → versions live in shared memory, so a write in one worker
+                 invalidates the pages cached by all of them
+    - "off"    → always build
+
+    Configured from the FastAPI lifespan.
+    """
+
+    _cache: Optional[TTLLRUCache] = None
+    _versions = _LocalVersions()
+    _backend = "off"
+
+    @classmethod
+    def start(cls):
+        backend = settings.RESPONSE_CACHE_BACKEND
+        if backend == "off":
+            return
+
+        if backend == "shared":
+            cls._versions = _SharedVersions(settings.RESPONSE_CACHE_SHM_NAME)
+        cls._cache = TTLLRUCache(
+            max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+        )
+        cls._backend = backend
+        print(f"✅ Response cache started ({backend})")
+
+    @classmethod
+    def stop(cls):
+        cls._versions.close()
+        cls._versions = _LocalVersions()
+        cls._cache = None
+        cls._backend = "off"
+
+    # ---------------------------------------------------------
+    # LOOKUP / STORE
+    # ---------------------------------------------------------
+    @classmethod
+    def version(cls, collection: str) -> int:
+        return cls._versions.get(collection)
+
+    @classmethod
+    def get(cls, collection: str, version: int, key: Tuple[Hashable, ...]) -> Any:
+        if cls._cache is None:
+            return None
+        return cls._cache.get((collection, version, *key))
+
+    @classmethod
+    def set(cls, collection: str, version: int, key: Tuple[Hashable, ...], value: Any):
+        if cls._cache is not None:
+            cls._cache.set((collection, version, *key), value)
+
+    # ---------------------------------------------------------
+    # READ THROUGH
+    # ---------------------------------------------------------
+    @classmethod
+    async def get_or_build(
+        cls,
+        collection: str,
+        key: Tuple[Hashable, ...],
+        build: Callable[[], Awaitable[Any]],
+    ) -> bytes:
+        """
+        Cached JSON bytes for `key`, or build() → serialize → store.
+        The version is read BEFORE building, so a write racing with the
+        build leaves the result under the old (already stale) version.
+        """
+        version = cls.version(collection)
+        body = cls.get(collection, version, key)
+        if body is None:
+            body = dumps(await build())
+            cls.set(collection, version, key, body)
+
+        return body
+
+    # ---------------------------------------------------------
+    # INVALIDATION (called by the repositories after a write)
+    # ---------------------------------------------------------
+    @classmethod
+    def invalidate(cls, collection: str):
+        cls._versions.bump(collection)
+        if cls._cache is not None:
+            # free this worker's now-unreachable pages right away
+            cls._cache.invalidate_where(lambda key: key[0] == collection)
+
+    # ---------------------------------------------------------
+    # METRICS
+    # ---------------------------------------------------------
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        return {
+            "backend": cls._backend,
+            **(cls._cache.stats() if cls._cache else {}),
+        }
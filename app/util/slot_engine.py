@@ -0,0 +1,119 @@
+"""
+slot_engine.py
+-------------
+Free-slot computation for the mentorship availability endpoints.
+
+Busy intervals are parsed ONCE into epoch seconds, sorted and merged into
+two parallel lists (starts / ends).  Candidate slot starts are then swept
+left → right with a single pointer into the merged intervals:
+
+- merge:  O(n log n)  (sort of the busy intervals)
+- sweep:  O(n + k)    (k = candidate starts on the step grid)
+
+Candidates are plain ints until the caller formats the survivors,
+so a call allocates little beyond the result list.
+"""
+
+from bisect import bisect_right
+from datetime import datetime
+from typing import Iterable, List, Tuple
+
+Intervals = Tuple[List[int], List[int]]
+
+
+def merge_busy_intervals(busy_slots: Iterable[dict]) -> Intervals:
+    """
+    Google busy list [{"start": iso, "end": iso}, ...] → merged (starts, ends)
+    in epoch seconds, sorted, non-overlapping (touching intervals are joined).
+    """
+    parsed = sorted(
+        (int(datetime.fromisoformat(b["start"]).timestamp()),
+         int(datetime.fromisoformat(b["end"]).timestamp()))
+        for b in busy_slots
+    )
+
+    starts: List[int] = []
+    ends: List[int] = []
+    for start, end in parsed:
+        if end <= start:
+            continue
+        if ends and start <= ends[-1]:
+            if end > ends[-1]:
+                ends[-1] = end
+        else:
+            starts.append(start)
+            ends.append(end)
+
+    return starts, ends
+
+
+def overlaps(start: int, end: int, intervals: Intervals) -> bool:
+    """
+    Does [start, end) intersect any merged busy interval?  O(log n)
+    """
+    starts, ends = intervals
+    i = bisect_right(ends, start)
+    return i < len(starts) and starts[i] < end
+
+
+def free_slot_starts(
+    grid_origin: int,
+    window_start: int,
+    window_end: int,
+    duration: int,
+    step: int,
+    intervals: Intervals,
+) -> List[int]:
+    """
+    Start times (epoch seconds) of every free [t, t + duration) slot with
+
+    - t on the grid  grid_origin + k * step
+    - window_start <= t  and  t + duration <= window_end
+    - no overlap with the merged busy intervals
+    """
+    starts, ends = intervals
+    n = len(starts)
+    result: List[int] = []
+
+    # first grid point at / after window_start
+    t = window_start
+    offset = (t - grid_origin) % step
+    if offset:
+        t += step - offset
+
+    i = 0
+    while t + duration <= window_end:
+        # skip busy intervals that finished before this candidate
+        while i < n and ends[i] <= t:
+            i += 1
+
+        if i < n and starts[i] < t + duration:
+            # conflict → jump to the first grid point after this busy block
+            t = ends[i]
+            offset = (t - grid_origin) % step
+            if offset:
+                t += step - offset
+            continue
+
+        result.append(t)
+        t += step
+
+    return result
+
+
+def hhmm(epoch_seconds: int, utc_offset_seconds: int) -> str:
+    """
+    Epoch seconds → local "HH:MM" for a fixed UTC offset (no datetime objects).
+    """
+    minutes = (epoch_seconds + utc_offset_seconds) // 60 % 1440
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def granule_starts(start: int, end: int, granule: int) -> List[int]:
+    """
+    Starts (epoch seconds) of the fixed `granule`-second cells covering
+    [start, end): aligned to the epoch, so every booking maps a given
+    instant to the same cell.
+    """
+    first = start - start % granule
+    return list(range(first, end, granule))
@@ -0,0 +1,129 @@
+import queue
+import smtplib
+import threading
+import time
+from email.message import Message
+
+from app.core.config import settings
+
+
+class SMTPConnectionPool:
+    """
+    Small pool of authenticated, reusable SMTP sessions.
+
+    - Sessions are opened lazily (connect + STARTTLS + login once)
+    - Idle sessions older than max_idle_seconds are recycled
+    - A dropped session is reconnected and the send retried once
+
+    Thread-safe: used from the email outbox worker threads.
+    """
+
+    def __init__(self, size: int, max_idle_seconds: int, timeout: int):
+        self._size = size
+        self._max_idle_seconds = max_idle_seconds
+        self._timeout = timeout
+        self._idle: "queue.LifoQueue[tuple[smtplib.SMTP, float]]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._open_sessions = 0
+        self._connects = 0
+        self._reconnects = 0
+
+    # ---------------------------------------------------------
+    # SESSION LIFECYCLE
+    # ---------------------------------------------------------
+    def _connect(self) -> smtplib.SMTP:
+        if settings.EMAIL_USE_SSL:
+            server = smtplib.SMTP_SSL(
+                settings.EMAIL_HOST,
+                settings.EMAIL_PORT,
+                timeout=self._timeout,
+            )
+        else:
+            server = smtplib.SMTP(
+                settings.EMAIL_HOST,
+                settings.EMAIL_PORT,
+                timeout=self._timeout,
+            )
+            server.starttls()
+
+        server.login(settings.EMAIL_USERNAME, settings.EMAIL_PASSWORD)
+
+        with self._lock:
+            self._open_sessions += 1
+            self._connects += 1
+        return server
+
+    def _discard(self, server: smtplib.SMTP):
+        try:
+            server.quit()
+        except Exception:
+            try:
+                server.close()
+            except Exception:
+                pass
+        with self._lock:
+            self._open_sessions -= 1
+
+    def _acquire(self) -> smtplib.SMTP:
+        while True:
+            try:
+                server, last_used = self._idle.get_nowait()
+            except queue.Empty:
+                return self._connect()
+
+            if time.monotonic() - last_used < self._max_idle_seconds:
+                return server
+
+            # 🔹 Stale session → server has most likely dropped it
+            self._discard(server)
+
+    def _release(self, server: smtplib.SMTP):
+        self._idle.put((server, time.monotonic()))
+
+    # ---------------------------------------------------------
+    # SEND
+    # ---------------------------------------------------------
+    def send(self, msg: Message):
+        """
+        Send a message through a pooled session (blocking).
+        """
+        with self._slots:
+            server = self._acquire()
+            try:
+                server.send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                self._discard(server)
+                with self._lock:
+                    self._reconnects += 1
+                server = self._connect()
+                try:
+                    server.send_message(msg)
+                except Exception:
+                    self._discard(server)
+                    raise
+            except Exception:
+                self._discard(server)
+                raise
+
+            self._release(server)
+
+    def close(self):
+        """
+        Close every idle session.
+        """
+        while True:
+            try:
+                server, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(server)
+
+    def stats(self) -> dict:
+        return {
+            "size": self._size,
+            "open_sessions": self._open_sessions,
+            "idle_sessions": self._idle.qsize(),
+            "connects": self._connects,
+            "reconnects": self._reconnects,
+        }
@@ -0,0 +1,136 @@
+"""
+Admin listing serialization benchmark: typed model path vs raw-dict fast path.
+
+    python -m bench.bench_list_serialization
+
+Both paths start from the raw documents Motor hands back for one page and end
+with the response body bytes; the Mongo round trip itself is not included.
+
+- model: PitchListView validation → PitchGetSchema / PitchListResponseSchema
+         → response_model validation + JSON-mode dump → json.dumps
+- fast:  plain dicts (PitchController) → pydantic-core to_json (FastJSONResponse)
+"""
+
+import json
+import random
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+from pydantic import TypeAdapter
+
+from app.models.pitchModel import PitchListView
+from app.schema.pitchSchema import PitchGetSchema, PitchListResponseSchema
+from app.util.fast_json import dumps
+
+RESPONSE_ADAPTER = TypeAdapter(PitchListResponseSchema)
+
+
+def make_docs(n: int, seed: int = 7) -> list:
+    rnd = random.Random(seed)
+    created = datetime(2026, 10, 1, 12, 0, 0)
+    docs = []
+    for i in range(n):
+        created -= timedelta(seconds=rnd.randrange(1, 3600))
+        docs.append({
+            "_id": ObjectId(),
+            "name": f"Founder {i}",
+            "company_name": f"Startup {i} Pvt Ltd",
+            "sector": rnd.choice(["fintech", "edtech", "healthtech", "saas"]),
+            "investment_required": f"{rnd.randrange(10, 500)} lakh",
+            "email": f"founder{i}@example.com",
+            "contact_number": f"98{rnd.randrange(10**7, 10**8)}",
+            "pitch_summary": "We are building " + "something useful " * rnd.randrange(5, 40),
+            "proposal_file_url": f"https://res.cloudinary.com/demo/raw/upload/pitch_{i}.pdf",
+            "created_at": created,
+            "updated_at": created,
+        })
+    return docs
+
+
+def model_path(docs: list) -> bytes:
+    views = [PitchListView.model_validate(doc) for doc in docs]
+    response = PitchListResponseSchema.model_construct(
+        success=True,
+        limit=len(views),
+        count=len(views),
+        skip=0,
+        data=[
+            PitchGetSchema.model_construct(
+                id=str(v.id),
+                name=v.name,
+                company_name=v.company_name,
+                sector=v.sector,
+                investment_required=v.investment_required,
+                email=v.email,
+                contact_number=v.contact_number,
+                pitch_summary=v.pitch_summary,
+                proposal_file_url=v.proposal_file_url,
+                created_at=v.created_at,
+                updated_at=v.updated_at,
+            )
+            for v in views
+        ],
+        next_cursor=None,
+    )
+    # what FastAPI does with response_model + JSONResponse
+    validated = RESPONSE_ADAPTER.validate_python(response, from_attributes=True)
+    content = RESPONSE_ADAPTER.dump_python(validated, mode="json")
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def fast_path(docs: list) -> bytes:
+    data = [
+        {
+            "id": str(doc["_id"]),
+            "name": doc["name"],
+            "company_name": doc["company_name"],
+            "sector": doc["sector"],
+            "investment_required": doc["investment_required"],
+            "email": doc["email"],
+            "contact_number": doc["contact_number"],
+            "pitch_summary": doc.get("pitch_summary"),
+            "proposal_file_url": doc.get("proposal_file_url"),
+            "created_at": doc["created_at"],
+            "updated_at": doc["updated_at"],
+        }
+        for doc in docs
+    ]
+    return dumps({
+        "success": True,
+        "limit": len(data),
+        "count": len(data),
+        "skip": 0,
+        "data": data,
+        "next_cursor": None,
+    })
+
+
+def measure(fn, docs, repeat: int) -> tuple:
+    fn(docs)  # warm up
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn(docs)
+    pages_per_sec = repeat / (time.perf_counter() - started)
+
+    tracemalloc.start()
+    fn(docs)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return pages_per_sec, peak
+
+
+def main():
+    print(f"{'limit':>6} | {'model pages/s':>13} {'peak KiB':>9} | {'fast pages/s':>12} {'peak KiB':>9} | same")
+    for limit in (10, 20, 100):
+        docs = make_docs(limit)
+        repeat = 2000 if limit <= 20 else 500
+        m_rate, m_peak = measure(model_path, docs, repeat)
+        f_rate, f_peak = measure(fast_path, docs, repeat)
+        same = json.loads(model_path(docs)) == json.loads(fast_path(docs))
+        print(f"{limit:>6} | {m_rate:>13.0f} {m_peak / 1024:>9.1f} | {f_rate:>12.0f} {f_peak / 1024:>9.1f} | {same}")
+
+
+if __name__ == "__main__":
+    main()
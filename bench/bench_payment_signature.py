@@ -0,0 +1,101 @@
+"""
+Razorpay payment signature verification benchmark: SDK utility vs PaymentSignatureVerifier.
+
+    python -m bench.bench_payment_signature
+
+Fully offline (pure CPU, no network).
+
+- sdk:    razorpay.Client().utility.verify_payment_signature, the previous
+          /verify path (new HMAC key setup per call, raises on a bad signature)
+- verify: PaymentSignatureVerifier.verify (keyed context built once, copied per call)
+- batch:  PaymentSignatureVerifier.verify_many over the whole list
+          (the /verify-batch + admin reconcile path)
+
+~10% of the signatures are invalid, like a replayed / tampered callback mix.
+Reports verifications/s and per-call p50 / p99.
+"""
+
+import os
+import random
+import secrets
+import time
+
+PAYMENTS = 100_000
+INVALID_RATIO = 0.10
+KEY_SECRET = "bench_key_secret_" + "x" * 8
+
+
+def percentile(samples: list, q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[int((len(ordered) - 1) * q)] * 1_000_000
+
+
+def make_payments(verifier) -> list:
+    rng = random.Random(42)
+    payments = []
+    for _ in range(PAYMENTS):
+        order_id = f"order_{secrets.token_hex(7)}"
+        payment_id = f"pay_{secrets.token_hex(7)}"
+        signature = verifier.sign(order_id, payment_id)
+        if rng.random() < INVALID_RATIO:
+            signature = secrets.token_hex(32)
+        payments.append((order_id, payment_id, signature))
+    return payments
+
+
+def timed_calls(payments: list, check) -> tuple:
+    """
+    One check per payment → (verifications/s, latencies, valid count)
+    """
+    latencies = []
+    valid = 0
+    started = time.perf_counter()
+    for payment in payments:
+        call_started = time.perf_counter()
+        valid += check(*payment)
+        latencies.append(time.perf_counter() - call_started)
+    return len(payments) / (time.perf_counter() - started), latencies, valid
+
+
+def main():
+    # settings are read on first import
+    os.environ["RAZORPAY_KEY_ID"] = "rzp_test_bench"
+    os.environ["RAZORPAY_KEY_SECRET"] = KEY_SECRET
+
+    import razorpay
+    from razorpay.errors import SignatureVerificationError
+    from app.util.payment_signature import PaymentSignatureVerifier
+
+    sdk = razorpay.Client(auth=("rzp_test_bench", KEY_SECRET))
+    verifier = PaymentSignatureVerifier.default()
+    payments = make_payments(verifier)
+
+    def sdk_check(order_id, payment_id, signature) -> bool:
+        try:
+            sdk.utility.verify_payment_signature({
+                "razorpay_order_id": order_id,
+                "razorpay_payment_id": payment_id,
+                "razorpay_signature": signature,
+            })
+            return True
+        except SignatureVerificationError:
+            return False
+
+    s_rate, s_lat, s_valid = timed_calls(payments, sdk_check)
+    v_rate, v_lat, v_valid = timed_calls(payments, verifier.verify)
+
+    started = time.perf_counter()
+    b_valid = sum(verifier.verify_many(payments))
+    b_rate = PAYMENTS / (time.perf_counter() - started)
+
+    assert s_valid == v_valid == b_valid, "implementations disagree"
+
+    print(f"{PAYMENTS} payments, {PAYMENTS - s_valid} invalid signatures")
+    print(f"{'path':>6} | {'verifications/s':>15} {'p50 us':>8} {'p99 us':>8}")
+    print(f"{'sdk':>6} | {s_rate:>15.0f} {percentile(s_lat, 0.5):>8.2f} {percentile(s_lat, 0.99):>8.2f}")
+    print(f"{'verify':>6} | {v_rate:>15.0f} {percentile(v_lat, 0.5):>8.2f} {percentile(v_lat, 0.99):>8.2f}")
+    print(f"{'batch':>6} | {b_rate:>15.0f} {'-':>8} {'-':>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Razorpay order creation benchmark: sync SDK on the executor vs AsyncRazorpayClient.
+
+    python -m bench.bench_razorpay_client
+
+Runs offline against bench/fake_razorpay.py (started as a subprocess with a
+fixed per-call latency standing in for the network round trip).
+
+- sdk:   razorpay.Client (requests) via a SDK_WORKERS thread pool, the
+         previous create-order path (the retired "razorpay" executor pool)
+- async: AsyncRazorpayClient (pooled httpx keep-alive connections,
+         RAZORPAY_MAX_CONCURRENCY calls in flight)
+
+Reports orders/s and per-call p50 / p99 at growing caller concurrency.
+"""
+
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+LATENCY_MS = 100  # typical India → Razorpay API round trip
+ORDERS = 500
+SDK_WORKERS = 4  # size of the retired "razorpay" executor pool
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_fake_server(port: int) -> subprocess.Popen:
+    server = subprocess.Popen(
+        [sys.executable, "-m", "bench.fake_razorpay", "--port", str(port), "--latency-ms", str(LATENCY_MS)],
+    )
+    deadline = time.monotonic() + 15
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/v1/payments/pay_ping", auth=("k", "s"))
+            return server
+        except httpx.TransportError:
+            time.sleep(0.1)
+    server.kill()
+    raise RuntimeError("fake Razorpay server did not start")
+
+
+def percentile(samples: list, q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[int((len(ordered) - 1) * q)] * 1000
+
+
+async def run_callers(concurrency: int, call) -> tuple:
+    """
+    `concurrency` callers issue ORDERS calls in total → (orders/s, latencies)
+    """
+    latencies = []
+    remaining = iter(range(ORDERS))
+
+    async def caller():
+        for _ in remaining:
+            started = time.perf_counter()
+            await call()
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(caller() for _ in range(concurrency)))
+    return ORDERS / (time.perf_counter() - started), latencies
+
+
+async def bench(port: int):
+    import razorpay
+    from app.core.config import settings
+    from app.core.razorpay_client import AsyncRazorpayClient
+
+    sdk = razorpay.Client(auth=("rzp_test_bench", "secret"), base_url=f"http://127.0.0.1:{port}")
+    pool = ThreadPoolExecutor(max_workers=SDK_WORKERS)
+    loop = asyncio.get_running_loop()
+    order = {"amount": 199900, "currency": "INR"}
+
+    async def sdk_call():
+        await loop.run_in_executor(pool, lambda: sdk.order.create(data=order))
+
+    async def async_call():
+        await AsyncRazorpayClient.create_order(**order)
+
+    await async_call()  # warm the connection pool
+
+    print(f"fake latency {LATENCY_MS} ms, {ORDERS} orders, "
+          f"executor workers {SDK_WORKERS}, "
+          f"async max concurrency {settings.RAZORPAY_MAX_CONCURRENCY}")
+    print(f"{'callers':>7} | {'sdk orders/s':>12} {'p50 ms':>8} {'p99 ms':>8} | {'async orders/s':>14} {'p50 ms':>8} {'p99 ms':>8}")
+    for concurrency in (5, 20, 50, 200):
+        s_rate, s_lat = await run_callers(concurrency, sdk_call)
+        a_rate, a_lat = await run_callers(concurrency, async_call)
+        print(
+            f"{concurrency:>7} | {s_rate:>12.0f} {percentile(s_lat, 0.5):>8.1f} {percentile(s_lat, 0.99):>8.1f}"
+            f" | {a_rate:>14.0f} {percentile(a_lat, 0.5):>8.1f} {percentile(a_lat, 0.99):>8.1f}"
+        )
+
+    await AsyncRazorpayClient.close()
+    pool.shutdown()
+
+
+def main():
+    port = free_port()
+    # settings are read on first import: aim the async client at the fake server
+    os.environ["RAZORPAY_API_URL"] = f"http://127.0.0.1:{port}/v1"
+    os.environ["RAZORPAY_KEY_ID"] = "rzp_test_bench"
+    os.environ["RAZORPAY_KEY_SECRET"] = "secret"
+
+    server = start_fake_server(port)
+    try:
+        asyncio.run(bench(port))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Slot engine benchmark: legacy O(slots × busy) loop vs merged-interval sweep.
+
+    python -m bench.bench_slot_engine
+
+Reports per-call latency and peak allocation (tracemalloc) for a working
+day (10:00-23:00, Asia/Kolkata) with a growing number of busy intervals.
+"""
+
+import random
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+from app.util.slot_engine import free_slot_starts, hhmm, merge_busy_intervals
+
+TZ = timezone(timedelta(hours=5, minutes=30))
+DAY = datetime(2026, 11, 2, tzinfo=TZ)
+WORK_START = DAY.replace(hour=10)
+WORK_END = DAY.replace(hour=23)
+
+
+def make_busy(n: int, seed: int = 7) -> list:
+    rnd = random.Random(seed)
+    busy = []
+    for _ in range(n):
+        start = WORK_START + timedelta(minutes=rnd.randrange(0, 13 * 60, 5))
+        end = start + timedelta(minutes=rnd.choice([15, 30, 45, 60]))
+        busy.append({
+            "start": start.astimezone(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "end": end.astimezone(timezone.utc).isoformat().replace("+00:00", "Z"),
+        })
+    return busy
+
+
+def legacy(busy_slots: list, duration_minutes: int, step_minutes: int) -> list:
+    duration_td = timedelta(minutes=duration_minutes)
+    step_td = timedelta(minutes=step_minutes)
+    slot_start = WORK_START
+    slots = []
+    while slot_start + duration_td <= WORK_END:
+        slot_end = slot_start + duration_td
+        overlap = False
+        for busy in busy_slots:
+            busy_start = datetime.fromisoformat(busy["start"]).astimezone(TZ)
+            busy_end = datetime.fromisoformat(busy["end"]).astimezone(TZ)
+            if slot_start < busy_end and slot_end > busy_start:
+                overlap = True
+                break
+        if not overlap:
+            slots.append((slot_start.strftime("%H:%M"), slot_end.strftime("%H:%M")))
+        slot_start += step_td
+    return slots
+
+
+def engine(busy_slots: list, duration_minutes: int, step_minutes: int) -> list:
+    duration = duration_minutes * 60
+    starts = free_slot_starts(
+        grid_origin=int(WORK_START.timestamp()),
+        window_start=int(WORK_START.timestamp()),
+        window_end=int(WORK_END.timestamp()),
+        duration=duration,
+        step=step_minutes * 60,
+        intervals=merge_busy_intervals(busy_slots),
+    )
+    offset = int(WORK_START.utcoffset().total_seconds())
+    return [(hhmm(t, offset), hhmm(t + duration, offset)) for t in starts]
+
+
+def measure(fn, busy, repeat: int) -> tuple:
+    fn(busy, 60, 15)  # warm up
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn(busy, 60, 15)
+    per_call_us = (time.perf_counter() - started) / repeat * 1e6
+
+    tracemalloc.start()
+    fn(busy, 60, 15)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return per_call_us, peak
+
+
+def main():
+    print(f"{'busy':>6} | {'legacy µs':>10} {'peak KiB':>9} | {'engine µs':>10} {'peak KiB':>9} | same")
+    for n in (0, 5, 20, 100, 500):
+        busy = make_busy(n)
+        repeat = 200 if n <= 100 else 20
+        l_us, l_peak = measure(legacy, busy, repeat)
+        e_us, e_peak = measure(engine, busy, repeat)
+        same = legacy(busy, 60, 15) == engine(busy, 60, 15)
+        print(f"{n:>6} | {l_us:>10.1f} {l_peak / 1024:>9.1f} | {e_us:>10.1f} {e_peak / 1024:>9.1f} | {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Local stand-in for the Razorpay REST API (offline benchmarks / manual tests).
+
+    python -m bench.fake_razorpay --port 8765 --latency-ms 20
+
+Point the app at it with RAZORPAY_API_URL=http://127.0.0.1:8765/v1.
+
+Only the endpoints AsyncRazorpayClient uses, with Razorpay-shaped bodies:
+- POST /v1/orders
+- GET  /v1/payments/{payment_id}
+- POST /v1/payments/{payment_id}/refund
+
+Every call sleeps `--latency-ms` to stand in for the network round trip.
+"""
+
+import argparse
+import asyncio
+import secrets
+import time
+
+import uvicorn
+from fastapi import FastAPI, Header, HTTPException, Request
+
+
+def create_app(latency_ms: float = 20.0) -> FastAPI:
+    app = FastAPI(openapi_url=None, docs_url=None, redoc_url=None)
+    delay = latency_ms / 1000
+    orders = {}
+
+    def check_auth(authorization):
+        if not authorization or not authorization.startswith("Basic "):
+            raise HTTPException(status_code=401, detail="Authentication failed")
+
+    def new_id(prefix: str) -> str:
+        return f"{prefix}_{secrets.token_hex(7)}"
+
+    @app.post("/v1/orders")
+    async def create_order(request: Request, authorization: str = Header(None)):
+        check_auth(authorization)
+        body = await request.json()
+        await asyncio.sleep(delay)
+
+        if not isinstance(body.get("amount"), int) or body["amount"] < 100:
+            raise HTTPException(status_code=400, detail="The amount must be atleast INR 1.00")
+
+        order = {
+            "id": new_id("order"),
+            "entity": "order",
+            "amount": body["amount"],
+            "amount_paid": 0,
+            "amount_due": body["amount"],
+            "currency": body.get("currency", "INR"),
+            "receipt": body.get("receipt"),
+            "status": "created",
+            "attempts": 0,
+            "notes": body.get("notes") or [],
+            "created_at": int(time.time()),
+        }
+        orders[order["id"]] = order
+        return order
+
+    @app.get("/v1/payments/{payment_id}")
+    async def fetch_payment(payment_id: str, authorization: str = Header(None)):
+        check_auth(authorization)
+        await asyncio.sleep(delay)
+        return {
+            "id": payment_id,
+            "entity": "payment",
+            "amount": 199900,
+            "currency": "INR",
+            "status": "captured",
+            "order_id": next(iter(orders), None),
+            "method": "upi",
+            "captured": True,
+            "amount_refunded": 0,
+            "created_at": int(time.time()),
+        }
+
+    @app.post("/v1/payments/{payment_id}/refund")
+    async def refund_payment(payment_id: str, request: Request, authorization: str = Header(None)):
+        check_auth(authorization)
+        body = await request.json()
+        await asyncio.sleep(delay)
+        return {
+            "id": new_id("rfnd"),
+            "entity": "refund",
+            "amount": body.get("amount", 199900),
+            "currency": "INR",
+            "payment_id": payment_id,
+            "speed_requested": body.get("speed", "normal"),
+            "status": "processed",
+            "notes": body.get("notes") or [],
+            "created_at": int(time.time()),
+        }
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    uvicorn.run(create_app(args.latency_ms), host="127.0.0.1", port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
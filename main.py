@@ -3,6 +3,14 @@ from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.database import MongoDatabase
+from app.util.email_outbox import EmailOutbox
+from app.services.email_outbox_service import EmailOutboxService
+from app.services.pitch_pipeline_service import PitchPipelineService
+from app.services.mentorship_booking_service import MentorshipBookingService
+from app.util.google_calendar_client import AsyncGoogleCalendarClient
+from app.core.razorpay_client import AsyncRazorpayClient
+from app.core.executor import BlockingExecutor
+from app.util.response_cache import ResponseCache
 from app.api.v1.pitch.route import router as pitch_v1_router
 from app.api.v1.connect.route import router as connect_v1_router
 from app.api.v1.mentorship.route import router as mentorship_v1_router
@@ -16,8 +24,21 @@ load_dotenv()
 async def lifespan(app: FastAPI):
     # 🔹 Startup
     await MongoDatabase.connect()
+    await EmailOutbox.start()
+    await EmailOutboxService.start()
+    await PitchPipelineService.start()
+    await MentorshipBookingService.start()
+    ResponseCache.start()
     yield
     # 🔹 Shutdown
+    ResponseCache.stop()
+    await MentorshipBookingService.stop()
+    await PitchPipelineService.stop()
+    await EmailOutboxService.stop()
+    await EmailOutbox.stop()
+    await AsyncGoogleCalendarClient.close()
+    await AsyncRazorpayClient.close()
+    BlockingExecutor.shutdown()
     await MongoDatabase.close()
 
 